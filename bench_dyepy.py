@@ -0,0 +1,770 @@
+"""
+Benchmarks and accuracy harnesses for dyepy.
+
+These are not part of the installed module, they are meant to be ran
+from a checkout to catch precision and performance regressions with
+numbers instead of guesses.
+
+Usage:
+    $ python bench_dyepy.py roundtrip --step 1 --processes 8
+    $ python bench_dyepy.py roundtrip --step 8 --json
+    $ python bench_dyepy.py hex
+    $ python bench_dyepy.py screen --width 160 --height 48
+    $ python bench_dyepy.py ansi --megabytes 16
+    $ python bench_dyepy.py pty --frames 100 --json > before.json
+    $ python bench_dyepy.py ycbcr --width 1920 --height 1080
+
+Run `python bench_dyepy.py <command> --help` for the options of each command
+"""
+
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import re
+import sys
+import threading
+import time
+
+import dyepy
+
+
+# Round trips swept by `roundtrip`, as (name, forward, backward)
+ROUNDTRIPS = (
+    ('hsv', dyepy.Converters.rgb2hsv, dyepy.Converters.hsv2rgb),
+    ('hsl', dyepy.Converters.rgb2hsl, dyepy.Converters.hsl2rgb),
+    ('yiq', dyepy.Converters.rgb2yiq, dyepy.Converters.yiq2rgb),
+    ('ycbcr', dyepy.Converters.rgb2ycbcr, dyepy.Converters.ycbcr2rgb),
+    ('cmyk', dyepy.Converters.rgb2cmyk, dyepy.Converters.cmyk2rgb),
+)
+
+# Number of worst-case inputs kept per round trip
+WORST_KEPT = 8
+
+
+def roundtrip_worker(task):
+    """
+    Returns the round trip statistics of every color with the red
+    channel *red*, sampling green and blue every *step* values
+
+    *task* is a `(red, step, names)` tuple so that it can be sent through
+    `multiprocessing.Pool.imap_unordered` as is. The result maps every
+    round trip name to a dict of:
+        histogram: {max channel error: count}
+        worst: [(error, (r, g, b), (r', g', b')), ...]
+        seconds: time spent converting
+        count: number of colors converted
+    """
+
+    red, step, names = task
+    values = range(0, 256, step)
+    stats = {}
+
+    for name, forward, backward in ROUNDTRIPS:
+        if name not in names:
+            continue
+
+        histogram = {}
+        worst = []
+        worst_error = 0
+        results = []
+
+        start = time.perf_counter()
+
+        for green in values:
+            for blue in values:
+                results.append(backward(*forward(red, green, blue)))
+
+        seconds = time.perf_counter() - start
+
+        index = 0
+
+        for green in values:
+            for blue in values:
+                out = results[index]
+                index += 1
+
+                error = max(
+                    abs(out[0] - red), abs(out[1] - green), abs(out[2] - blue)
+                )
+                histogram[error] = histogram.get(error, 0) + 1
+
+                if error > worst_error:
+                    worst_error = error
+                    worst = []
+
+                if error == worst_error and error and len(worst) < WORST_KEPT:
+                    worst.append((error, (red, green, blue), tuple(out)))
+
+        stats[name] = {
+            'histogram': histogram,
+            'worst': worst,
+            'seconds': seconds,
+            'count': len(results),
+        }
+
+    return stats
+
+
+def roundtrip(step: int = 1, processes: int = 0, names=None) -> dict:
+    """
+    Returns the merged round trip report of the whole RGB cube
+
+    step: sample every *step*-th value of each channel (1 = all 16.7M)
+    processes: worker processes to use, 0 meaning one per core
+    names: round trips to run, all of them if None
+    """
+
+    names = tuple(names or (name for name, _, _ in ROUNDTRIPS))
+    processes = processes or os.cpu_count() or 1
+    tasks = [(red, step, names) for red in range(0, 256, step)]
+
+    report = {
+        name: {'histogram': {}, 'worst': [], 'seconds': 0.0, 'count': 0}
+        for name in names
+    }
+
+    start = time.perf_counter()
+
+    with multiprocessing.Pool(processes) as pool:
+        for stats in pool.imap_unordered(roundtrip_worker, tasks):
+            for name, part in stats.items():
+                merged = report[name]
+                merged['seconds'] += part['seconds']
+                merged['count'] += part['count']
+
+                for error, count in part['histogram'].items():
+                    merged['histogram'][error] = (
+                        merged['histogram'].get(error, 0) + count
+                    )
+
+                merged['worst'].extend(part['worst'])
+
+    wall = time.perf_counter() - start
+
+    for name, merged in report.items():
+        merged['worst'].sort(reverse=True)
+        merged['worst'] = merged['worst'][:WORST_KEPT]
+        merged['max_error'] = max(merged['histogram'], default=0)
+        merged['exact'] = merged['histogram'].get(0, 0) / merged['count']
+
+        # Two conversions (there and back) per color, per core
+        merged['conversions_per_second'] = (
+            2 * merged['count'] / merged['seconds'] if merged['seconds'] else 0
+        )
+
+    total = sum(merged['count'] for merged in report.values())
+
+    return {
+        'step': step,
+        'processes': processes,
+        'wall_seconds': wall,
+        'conversions_per_second': 2 * total / wall if wall else 0,
+        'roundtrips': report,
+    }
+
+
+def print_roundtrip(report: dict) -> None:
+    """
+    Prints a human readable version of a `roundtrip` report
+    """
+
+    print(
+        f"Swept every {report['step']} value(s) per channel with "
+        f"{report['processes']} process(es) in {report['wall_seconds']:.2f}s "
+        f"({report['conversions_per_second']:,.0f} conversions/s overall)\n"
+    )
+
+    for name, stats in report['roundtrips'].items():
+        print(
+            f"rgb -> {name} -> rgb: {stats['count']:,} colors, "
+            f"{stats['exact']:.4%} exact, max error {stats['max_error']}, "
+            f"{stats['conversions_per_second']:,.0f} conversions/s per core"
+        )
+
+        for error in sorted(stats['histogram']):
+            count = stats['histogram'][error]
+            print(f'    error {error:>3}: {count:>10,} ({count / stats["count"]:.4%})')
+
+        for error, source, result in stats['worst']:
+            print(f'    worst: {source} -> {result} (error {error})')
+
+        print()
+
+
+def legacy_rgb(red=0, green=0, blue=0) -> str:
+    """
+    Returns the Hex value of an RGB color the way `Colors.rgb` did before
+    it was table-driven, as the baseline of `hex`
+    """
+
+    clamp = dyepy.clamp
+
+    return (
+        f'#{clamp(round(red), 0, 255):02x}'
+        f'{clamp(round(green), 0, 255):02x}'
+        f'{clamp(round(blue), 0, 255):02x}'
+    )
+
+
+def best_of(function, repeat: int = 5) -> float:
+    """
+    Returns the best wall-clock time (in seconds) of *repeat* calls to *function*
+    """
+
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def hex_encoding(count: int = 100000, seed: int = 0) -> dict:
+    """
+    Returns the nanoseconds per color of every Hex encoding path
+    for *count* random colors
+    """
+
+    import random
+
+    rng = random.Random(seed)
+    packed = [rng.getrandbits(24) for _ in range(count)]
+    triples = [(v >> 16, v >> 8 & 255, v & 255) for v in packed]
+    buffer = bytes(channel for color in triples for channel in color)
+    rgb = dyepy.Colors.rgb
+    rgb_many = dyepy.Colors.rgb_many
+
+    cases = {
+        'legacy Colors.rgb per color': lambda: [legacy_rgb(*c) for c in triples],
+        'Colors.rgb per color': lambda: [rgb(*c) for c in triples],
+        'Colors.rgb per color (floats)': lambda: [rgb(r + .4, g, b) for r, g, b in triples],
+        'legacy join': lambda: '\n'.join([legacy_rgb(*c) for c in triples]),
+        'Colors.rgb_many(tuples, sep)': lambda: rgb_many(triples, '\n'),
+        'Colors.rgb_many(packed, sep)': lambda: rgb_many(packed, '\n'),
+        'Colors.rgb_many(buffer, sep)': lambda: rgb_many(buffer, '\n'),
+        'Colors.rgb_many(buffer, sep, bytes)': lambda: rgb_many(buffer, '\n', True),
+    }
+
+    return {
+        name: best_of(case) / count * 1e9 for name, case in cases.items()
+    }
+
+
+def screen_frames(
+    width: int = 160,
+    height: int = 48,
+    frames: int = 50,
+    seed: int = 0
+) -> dict:
+    """
+    Returns the frames per second and bytes per frame of `Screen` for
+    dashboards changing none, 2% and all of their cells every frame,
+    next to a naive full repaint with `Styles.Bg.rgb` per cell
+    """
+
+    import random
+
+    rng = random.Random(seed)
+    colormap = dyepy.Colormap(dyepy.Colormap.VIRIDIS)
+    cells = width * height
+    report = {}
+
+    for name, changed in (('static', 0), ('2% changed', cells // 50), ('all changed', cells)):
+        screen = dyepy.Screen(width, height)
+        values = [rng.random() for _ in range(cells)]
+        screen.render()
+        sizes = []
+        rendering = 0.0
+
+        start = time.perf_counter()
+
+        for _ in range(frames):
+            for index in rng.sample(range(cells), changed):
+                values[index] = rng.random()
+                screen.put(
+                    index % width, index // width, '#',
+                    colormap.packed[int(values[index] * 255)],
+                    colormap.packed[255 - int(values[index] * 255)]
+                )
+
+            started = time.perf_counter()
+            sizes.append(len(screen.render().encode()))
+            rendering += time.perf_counter() - started
+
+        seconds = time.perf_counter() - start
+
+        report[f'Screen, {name}'] = {
+            'frames_per_second': frames / seconds,
+            'render_milliseconds': rendering / frames * 1000,
+            'bytes_per_frame': sum(sizes) / frames,
+        }
+
+    fg, bg = dyepy.Styles.Fg.rgb, dyepy.Styles.Bg.rgb
+    packed = colormap.packed
+    sizes = []
+    start = time.perf_counter()
+
+    for _ in range(frames):
+        rows = []
+
+        for y in range(height):
+            row = []
+
+            for v in values[y * width:(y + 1) * width]:
+                front, back = packed[int(v * 255)], packed[255 - int(v * 255)]
+                row.append(
+                    fg(front >> 16, front >> 8 & 255, front & 255)
+                    + bg(back >> 16, back >> 8 & 255, back & 255) + '#'
+                )
+
+            rows.append(''.join(row))
+
+        sizes.append(len(('\x1b[H' + '\n'.join(rows) + dyepy.Styles.RESET).encode()))
+
+    seconds = time.perf_counter() - start
+
+    report['naive full repaint'] = {
+        'frames_per_second': frames / seconds,
+        'render_milliseconds': seconds / frames * 1000,
+        'bytes_per_frame': sum(sizes) / frames,
+    }
+
+    return report
+
+
+def styled_log(megabytes: float = 8, seed: int = 0) -> str:
+    """
+    Returns about *megabytes* of log lines colored with `Styles`, like
+    the build logs the ANSI helpers are meant for
+    """
+
+    import random
+
+    rng = random.Random(seed)
+    styles = dyepy.Styles
+    levels = (
+        styles.Fg.GREEN + 'INFO' + styles.RESET,
+        styles.BOLD + styles.Fg.ORANGE + 'WARN' + styles.RESET,
+        styles.Bg.RED + styles.Fg.rgb(255, 255, 255) + 'FAIL' + styles.RESET,
+    )
+    words = 'compiling linking module test passed cached 日本語 wörld'.split()
+    lines = []
+    size = 0
+
+    while size < megabytes * 1e6:
+        line = (
+            f'{styles.Fg.n(rng.randrange(256))}{rng.randrange(10 ** 6):>7}'
+            f'{styles.RESET} {rng.choice(levels)} '
+            + ' '.join(rng.choice(words) for _ in range(rng.randrange(4, 16)))
+        )
+        lines.append(line)
+        size += len(line) + 1
+
+    return '\n'.join(lines)
+
+
+def ansi_throughput(megabytes: float = 8, chunk_size: int = 65536) -> dict:
+    """
+    Returns the megabytes per second of the ANSI helpers (and of the
+    usual ad-hoc regex they replace), of `AnsiHtml` and of `Colorizer`
+    over a styled log
+    """
+
+    text = styled_log(megabytes)
+    encoded = text.encode()
+    blocks = [encoded[i:i + (1 << 20)] for i in range(0, len(encoded), 1 << 20)]
+    colorizer = dyepy.Colorizer()
+    lines = text.split('\n')
+    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    adhoc = re.compile(r'\x1b\[[0-9;]*m')
+    size = len(text.encode()) / 1e6
+
+    cases = {
+        'ad-hoc re.sub per line': lambda: [adhoc.sub('', line) for line in lines],
+        'strip_ansi per line': lambda: [dyepy.strip_ansi(line) for line in lines],
+        'strip_ansi whole text': lambda: dyepy.strip_ansi(text),
+        'iter_strip_ansi chunks': lambda: list(dyepy.iter_strip_ansi(chunks)),
+        'ad-hoc len(re.sub) per line': lambda: [len(adhoc.sub('', line)) for line in lines],
+        'visible_width per line': lambda: [dyepy.visible_width(line) for line in lines],
+        'wrap per line (40 columns)': lambda: [dyepy.wrap(line, 40) for line in lines],
+        'AnsiHtml.convert chunks': lambda: list(dyepy.AnsiHtml().convert(chunks)),
+        'Colorizer 1 MB blocks': lambda: [colorizer(block) for block in blocks],
+    }
+
+    return {
+        name: size / best_of(case, 3) for name, case in cases.items()
+    }
+
+
+def pty_renderers(width: int = 120, height: int = 40, seed: int = 0) -> dict:
+    """
+    Returns the frame functions of the end-to-end benchmarks, by name:
+    functions of a frame number returning the lines of that frame
+    """
+
+    styles = dyepy.Styles
+    header = dyepy.Style(bold=True, fg=dyepy.Colors.WHITE, bg=(0, 120, 215))
+    odd, even = dyepy.Style(bg=(32, 32, 32)), dyepy.Style()
+    ok, failed = dyepy.Style(fg=styles.Fg.GREEN), dyepy.Style(bold=True, fg=styles.Fg.RED)
+    columns = max(1, width // 12)
+
+    def table(frame):
+        lines = [header(''.join(f'{f"column {c}":<12}' for c in range(columns)))]
+
+        for y in range(height - 1):
+            style = odd if y % 2 else even
+            cells = []
+
+            for c in range(columns):
+                value = (frame * 7 + y * 13 + c * 31) % 1000
+                status = ok if value % 3 else failed
+                cells.append(status(f'{value:>5}') + style(f'{"":<7}'))
+
+            lines.append(''.join(cells))
+
+        return lines
+
+    cells = dyepy.Colormap(dyepy.Colormap.VIRIDIS).ansi()
+
+    def gradient(frame):
+        return [
+            ''.join(cells[(x * 255 // width + frame + y) % 256] for x in range(width))
+            + styles.RESET
+            for y in range(height)
+        ]
+
+    pixels = [
+        bytes(
+            channel
+            for x in range(width)
+            for channel in (x * 255 // width, y * 255 // height, (x + y) % 256)
+        )
+        for y in range(height)
+    ]
+    dither = dyepy.Dither(256, 'bayer')
+
+    def image(frame):
+        dither.reset()
+
+        return [dither.ansi(row) + styles.RESET for row in pixels]
+
+    bg = styles.Bg.rgb
+
+    def truecolor(frame):
+        return [
+            ''.join(
+                bg(row[x], row[x + 1], row[x + 2]) + ' '
+                for x in range(0, len(row), 3)
+            ) + styles.RESET
+            for row in pixels
+        ]
+
+    log = styled_log(max(1, width * height * 40 * 2) / 1e6, seed).split('\n')
+
+    def logs(frame):
+        start = frame * height % max(1, len(log) - height)
+
+        return log[start:start + height]
+
+    bars = [
+        dyepy.ProgressBar(1000, max(1, width - 10), label=f'{y:>4}') for y in range(height)
+    ]
+
+    def progress(frame):
+        for y, bar in enumerate(bars):
+            bar.set((frame * 7 + y * 37) % 1000)
+
+        return [bar.render() for bar in bars]
+
+    return {
+        'table': table,
+        'gradient': gradient,
+        'image (256 colors, dithered)': image,
+        'image (true color)': truecolor,
+        'log stream': logs,
+        'progress bars': progress,
+    }
+
+
+def pty_throughput(
+    frames: int = 50,
+    width: int = 120,
+    height: int = 40,
+    only=None
+) -> dict:
+    """
+    Returns the end-to-end statistics of every renderer of
+    `pty_renderers` writing *frames* frames to a pseudo-terminal, whose
+    other end is drained by a thread, once with a single write per
+    frame and once with a write per line (like `print`):
+        bytes_per_frame: bytes written (encoded as UTF-8)
+        writes_per_frame, reads_per_frame: system calls of both ends
+        build_milliseconds: time spent building frames
+        frames_per_second: frames written and drained per wall second
+    """
+
+    import pty
+    import tty
+
+    report = {}
+
+    for name, renderer in pty_renderers(width, height).items():
+        if only and not any(part in name for part in only):
+            continue
+
+        renderer(0)     # Warm up the caches and tables of the renderer
+
+        for mode in ('frame', 'line'):
+            master, slave = pty.openpty()
+            tty.setraw(slave)
+            drained = {'bytes': 0, 'reads': 0}
+
+            def drain():
+                while True:
+                    try:
+                        data = os.read(master, 1 << 16)
+
+                    except OSError:     # The other end was closed
+                        return
+
+                    if not data:
+                        return
+
+                    drained['bytes'] += len(data)
+                    drained['reads'] += 1
+
+            reader = threading.Thread(target=drain, daemon=True)
+            reader.start()
+
+            written = writes = 0
+            building = 0.0
+            start = time.perf_counter()
+
+            for frame in range(frames):
+                started = time.perf_counter()
+                lines = renderer(frame)
+                chunks = (
+                    ['\x1b[H' + '\r\n'.join(lines)] if mode == 'frame'
+                    else ['\x1b[H'] + [line + '\r\n' for line in lines]
+                )
+                building += time.perf_counter() - started
+
+                for chunk in chunks:
+                    data = memoryview(chunk.encode())
+
+                    while data:
+                        count = os.write(slave, data)
+                        data = data[count:]
+                        written += count
+                        writes += 1
+
+            while drained['bytes'] < written:
+                time.sleep(0.0005)
+
+            seconds = time.perf_counter() - start
+            os.close(slave)
+            reader.join()
+            os.close(master)
+
+            report[f'{name}, write per {mode}'] = {
+                'bytes_per_frame': written / frames,
+                'writes_per_frame': writes / frames,
+                'reads_per_frame': drained['reads'] / frames,
+                'build_milliseconds': building / frames * 1000,
+                'frames_per_second': frames / seconds,
+                'megabytes_per_second': written / seconds / 1e6,
+            }
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'frames': frames,
+        'width': width,
+        'height': height,
+        'renderers': report,
+    }
+
+
+def ycbcr_frames(width: int = 1280, height: int = 720, seed: int = 0) -> dict:
+    """
+    Returns the milliseconds per *width*×*height* frame of every
+    `YCbCr` conversion, for both standards in limited range
+    """
+
+    import random
+
+    rng = random.Random(seed)
+    # A smooth frame with some noise, like decoded video
+    frame = bytes(
+        (x * 255 // width + rng.randrange(8)) & 255 if channel < 2
+        else (y * 255 // height + rng.randrange(8)) & 255
+        for y in range(height) for x in range(width) for channel in range(3)
+    )
+    report = {}
+
+    for standard in (601, 709):
+        video = dyepy.YCbCr(standard)
+        i420 = video.to_i420(frame, width, height)
+        nv12 = video.to_nv12(frame, width, height)
+
+        cases = {
+            'to_i420': lambda: video.to_i420(frame, width, height),
+            'to_nv12': lambda: video.to_nv12(frame, width, height),
+            'from_i420': lambda: video.from_i420(i420, width, height),
+            'from_nv12': lambda: video.from_nv12(nv12, width, height),
+        }
+
+        for name, case in cases.items():
+            report[f'BT.{standard} {name}'] = best_of(case, 3) * 1e3
+
+    return report
+
+
+def main(argv=None) -> int:
+    """
+    Command-line entry point of the benchmarks, returns the exit code
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    sweep = commands.add_parser(
+        'roundtrip', help='sweep the RGB cube through every round trip'
+    )
+    sweep.add_argument('--step', type=int, default=1)
+    sweep.add_argument('--processes', type=int, default=0)
+    sweep.add_argument(
+        '--only', action='append', choices=[name for name, _, _ in ROUNDTRIPS]
+    )
+    sweep.add_argument('--json', action='store_true')
+    sweep.add_argument(
+        '--max-error', type=int, default=None,
+        help='exit with 1 if any round trip exceeds this channel error'
+    )
+
+    encoding = commands.add_parser(
+        'hex', help='time the Hex encoders against the legacy f-string path'
+    )
+    encoding.add_argument('--count', type=int, default=100000)
+    encoding.add_argument('--json', action='store_true')
+
+    frames = commands.add_parser(
+        'screen', help='time Screen frame diffs against full repaints'
+    )
+    frames.add_argument('--width', type=int, default=160)
+    frames.add_argument('--height', type=int, default=48)
+    frames.add_argument('--frames', type=int, default=50)
+    frames.add_argument('--json', action='store_true')
+
+    escapes = commands.add_parser(
+        'ansi', help='time the ANSI helpers and AnsiHtml on a styled log'
+    )
+    escapes.add_argument('--megabytes', type=float, default=8)
+    escapes.add_argument('--chunk-size', type=int, default=65536)
+    escapes.add_argument('--json', action='store_true')
+
+    terminal = commands.add_parser(
+        'pty', help='time renderers end to end through a pseudo-terminal'
+    )
+    terminal.add_argument('--frames', type=int, default=50)
+    terminal.add_argument('--width', type=int, default=120)
+    terminal.add_argument('--height', type=int, default=40)
+    terminal.add_argument(
+        '--only', action='append', help='run the renderers containing this text'
+    )
+    terminal.add_argument('--json', action='store_true')
+
+    video = commands.add_parser(
+        'ycbcr', help='time the YCbCr frame conversions (I420 and NV12)'
+    )
+    video.add_argument('--width', type=int, default=1280)
+    video.add_argument('--height', type=int, default=720)
+    video.add_argument('--json', action='store_true')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'roundtrip':
+        report = roundtrip(args.step, args.processes, args.only)
+
+        if args.json:
+            print(json.dumps(report, indent=2, sort_keys=True))
+
+        else:
+            print_roundtrip(report)
+
+        if args.max_error is not None and any(
+            stats['max_error'] > args.max_error
+            for stats in report['roundtrips'].values()
+        ):
+            return 1
+
+    elif args.command == 'hex':
+        report = hex_encoding(args.count)
+
+        if args.json:
+            print(json.dumps(report, indent=2))
+
+        else:
+            for name, nanoseconds in report.items():
+                print(f'{name:<40} {nanoseconds:>8.1f} ns/color')
+
+    elif args.command == 'screen':
+        report = screen_frames(args.width, args.height, args.frames)
+
+        if args.json:
+            print(json.dumps(report, indent=2))
+
+        else:
+            for name, stats in report.items():
+                print(
+                    f"{name:<24} {stats['frames_per_second']:>9.1f} frames/s "
+                    f"{stats['render_milliseconds']:>8.2f} ms/render "
+                    f"{stats['bytes_per_frame']:>10,.0f} bytes/frame"
+                )
+
+    elif args.command == 'ansi':
+        report = ansi_throughput(args.megabytes, args.chunk_size)
+
+        if args.json:
+            print(json.dumps(report, indent=2))
+
+        else:
+            for name, speed in report.items():
+                print(f'{name:<32} {speed:>8.1f} MB/s')
+
+    elif args.command == 'pty':
+        report = pty_throughput(args.frames, args.width, args.height, args.only)
+
+        if args.json:
+            print(json.dumps(report, indent=2))
+
+        else:
+            for name, stats in report['renderers'].items():
+                print(
+                    f"{name:<44} {stats['frames_per_second']:>8.1f} frames/s "
+                    f"{stats['bytes_per_frame']:>9,.0f} bytes/frame "
+                    f"{stats['writes_per_frame']:>6.1f} writes/frame "
+                    f"{stats['build_milliseconds']:>7.2f} ms/build"
+                )
+
+    elif args.command == 'ycbcr':
+        report = ycbcr_frames(args.width, args.height)
+
+        if args.json:
+            print(json.dumps(report, indent=2))
+
+        else:
+            for name, milliseconds in report.items():
+                print(f'{name:<20} {milliseconds:>9.1f} ms/frame')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,340 @@
+"""
+Module with everything related to styles and colors in any way.
+
+From rgb-hex converters to printing text in colors on a command-line,
+this module allows you to deal with colors, also helpful when making
+GUIs on Python (using tkinter, PyGame, etc.), by giving you the
+colors you want in Hexadecimal to common colors to all types
+of color representations supported by CSS4 too! Just name it!
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+
+NOTE: Some conversions/color values (like dyepy.Colors.hsv, hsl) may be
+inaccurate due to floating point properties and type conversions.
+They can't be removed completely (although optimizations are being done)
+But they shouldn't be much of a problem since the errors are very small
+
+Therefore, there is no need to worry. It is not a bug, just a software \
+limitation. In that case, try not to use those functions if you want accuracy
+"""
+
+# Postpone the evaluation of annotations, so `typing` is only imported
+# along with the submodules that need it
+from __future__ import annotations
+
+
+__author__ = 'SFM61319'
+__email__ = 'svasssakavi@gmail.com'
+__github__ = 'https://github.com/SFM61319/DyePy'
+__version__ = '1.0.1'
+__desc__ = 'A Python module for all colors and related functions'
+
+
+# Import `typing` for type-hinting, only when type checking (annotations
+# are not evaluated, and `typing` alone takes longer to import than this)
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import typing
+
+
+def clamp(
+    value: typing.Union[int, float] = 0.5,
+    minimum: typing.Union[int, float] = 0,
+    maximum: typing.Union[int, float] = 1
+) -> typing.Union[int, float]:
+    """
+    Returns the clamped value between *minimum* and *maximum*
+
+    A clamped value is the value itself when it lies
+    between the minimum and the maximum, and if the
+    value crosses the extremes, then the extremity
+    closer to the value becomes the clamped value.
+    
+    E.g.:
+    clamp() -> clamp(0.5, 0, 1) -> 0.5;
+    clamp(2, 0, 1) -> 1;
+    clamp(-1, 0, 1) -> 0;
+    """
+
+    if value < minimum:
+        return minimum
+    
+    if value > maximum:
+        return maximum
+    
+    return value
+
+
+# A class to print in different colors (command-line only)
+class Styles:
+    """
+    Styles class
+
+    A class to help print both foreground and background in different
+    styles and colors (both as variables) on a command-line.
+    
+    NOTE: All methods and sub-methods are `static`
+    
+    Print blue text with green background
+    E.g.: print(Styles.Bg.GREEN, Styles.Fg.BLUE, 'Blue text', Styles.RESET)
+    
+    Or print the text in italics
+    E.g.: print(Styles.ITALIC, 'Italic text', Styles.RESET)
+    
+    Here's what the constants are supposed to do:
+    ---- Reset ----
+    RESET: resets all the colors and styles used in the preceding text
+
+    ---- Styles ----
+    BOLD: bolds all the succeeding text
+    DISABLE: reduces intensity (not widely supported)
+    ITALIC: writes text in italics (not widely supported)
+    UNDERLINE: underlines succeeding text
+    SLOWBLINK: makes the text blink slowly (< 150 per minute)
+    RAPIDBLINK: makes the text blink > 150/min (not widely supported)
+    REVERSE: swaps default foreground and background colors and styles
+    INVISIBLE: makes the foreground transparent
+    STRIKETHROUGH: strikes through the text
+    REVEAL: switches Conceal off (not widely supported)
+    FRAME: frames the succeeding text
+    ENCIRCLE: encircles the succeeding text
+    OVERLINE: prints an overline on the succeeding text
+
+    ---- Colors ----
+        -- Foreground (Fg) --
+        Fg.<COLOR_NAME>: sets the color to the succeeding fg
+        Fg.n(<intensity>): sets the pre-selected color to fg
+        Fg.rgb(<r>, <g>, <b>): sets the calculated color to fg
+
+        -- Background (Bg) --
+        Bg.<COLOR_NAME>: sets the color to the succeding bg
+        Bg.n(<intensity>): sets the pre-selected color to bg
+        Bg.rgb(<r>, <g>, <b>): sets the calculated color to bg
+
+    For more info on `n`, refer to this table:
+        https://i.stack.imgur.com/KTSQa.png
+    
+    Please do not attempt to change these constants in the module
+    or the Python file this is being imported to, as it may affect
+    the output of the colors and may even corrupt and work irregularly
+    and not as expected when being ran in a Python environment
+    
+    For more information on command-line styling, refer to:
+        http://ascii-table.com/ansi-escape-sequences-vt-100.php
+    """
+
+    # Reset
+    RESET = reset = '\x1b[00m'
+
+    # Styles
+    BOLD = bold = '\x1b[01m'
+    DISABLE = disable = '\x1b[02m'
+    ITALIC = italic = '\x1b[03m'
+    UNDERLINE = underline = '\x1b[04m'
+    SLOWBLINK = slowblink = '\x1b[05m'
+    RAPIDBLINK = rapidblink = '\x1b[06m'
+    REVERSE = reverse = '\x1b[07m'
+    INVISIBLE = invisible = '\x1b[08m'
+    STRIKETHROUGH = strikethrough = '\x1b[09m'
+    REVEAL = reveal = '\x1b[28m'
+    FRAME = frame = '\x1b[51m'
+    ENCIRCLE = encircle = '\x1b[52m'
+    OVERLINE = overline = '\x1b[53m'
+
+    # Foreground colors
+    class Foreground:
+        """
+        Foreground (Fg) sub-class to set foreground
+        colors of succeeding text occurences
+        """
+
+        BLACK = black = '\x1b[30m'
+        RED = red = '\x1b[31m'
+        GREEN = green = '\x1b[32m'
+        ORANGE = orange = '\x1b[33m'
+        BLUE = blue = '\x1b[34m'
+        PURPLE = purple = '\x1b[35m'
+        CYAN = cyan = '\x1b[36m'
+        LIGHTGREY = lightgrey = '\x1b[37m'
+        DARKGREY = darkgrey = '\x1b[90m'
+        LIGHTRED = lightred = '\x1b[91m'
+        LIGHTGREEN = lightgreen = '\x1b[92m'
+        YELLOW = yellow = '\x1b[93m'
+        LIGHTBLUE = lightblue = '\x1b[94m'
+        PINK = pink = '\x1b[95m'
+        LIGHTCYAN = lightcyan = '\x1b[96m'
+
+        WHITE = white = '\x1b[38;2;255;255;255m'
+        SPOTIFYGREEN = spotifygreen = '\x1b[38;2;29;185;84m'
+        WINDOWSBLUE = '\x1b[38;2;0;120;215m'
+
+        @staticmethod
+        def n(intensity: typing.Union[int, float] = 0) -> str:
+            """
+            Returns calculated ANSI color code for unnamed bg colors
+
+            Can be used as follow:
+            print(Styles.Fg.n(255), 'Some random color', Styles.RESET)
+            
+            Refer to https://i.stack.imgur.com/KTSQa.png for more
+            information on how to use the function to get a color
+            """
+
+            return f'\x1b[38;5;{clamp(round(intensity), 0, 255)}m'
+
+        @staticmethod
+        def rgb(
+            red: typing.Union[int, float] = 0, 
+            blue: typing.Union[int, float] = 0, 
+            green: typing.Union[int, float] = 0
+        ) -> str:
+            """
+            Returns calculated ANSI color code for unnamed fg colors
+
+            Can be used as follows:
+            print(Styles.Fg.rgb(0, 120, 215), 'Windows Default Blue', Styles.RESET)
+            print(Styles.Fg.rgb(29, 185, 84), 'Spotify Green', Styles.RESET)
+            
+            NOTE: 0 ≤ r, g, b ≤ 255
+            """
+
+            return (
+                f'\x1b[38;2;'
+                f'{clamp(round(red), 0, 255)};'
+                f'{clamp(round(blue), 0, 255)};'
+                f'{clamp(round(green), 0, 255)}m'
+            )
+
+    Fg = Foreground
+
+    # Background colors
+    class Background:
+        """
+        Background (Bg) sub-class to set background
+        colors of succeeding text occurences
+        """
+
+        BLACK = black = '\x1b[40m'
+        RED = red = '\x1b[41m'
+        GREEN = green = '\x1b[42m'
+        ORANGE = orange = '\x1b[43m'
+        BLUE = blue = '\x1b[44m'
+        PURPLE = purple = '\x1b[45m'
+        CYAN = cyan = '\x1b[46m'
+        LIGHTGREY = lightgrey = '\x1b[47m'
+        DARKGREY = darkgrey = '\x1b[100m'
+        LIGHTRED = lightred = '\x1b[101m'
+        LIGHTGREEN = lightgreen = '\x1b[102m'
+        YELLOW = yellow = '\x1b[103m'
+        LIGHTBLUE = lightblue = '\x1b[104m'
+        PINK = pink = '\x1b[105m'
+        LIGHTCYAN = lightcyan = '\x1b[106m'
+
+        WHITE = white = '\x1b[48;2;255;255;255m'
+        SPOTIFYGREEN = spotifygreen = '\x1b[48;2;29;185;84m'
+        WINDOWSBLUE = '\x1b[48;2;0;120;215m'
+
+        @staticmethod
+        def n(intensity: typing.Union[int, float] = 255) -> str:
+            """
+            Returns calculated ANSI color code for unnamed bg colors
+
+            Can be used as follow:
+            print(Styles.Bg.n(255), 'Some random color', Styles.RESET)
+            
+            Refer to https://i.stack.imgur.com/KTSQa.png for more
+            information on how to use the function to get a color
+            """
+
+            return f'\x1b[48;5;{clamp(round(intensity), 0, 255)}m'
+
+        @staticmethod
+        def rgb(
+            red: typing.Union[int, float] = 255,
+            blue: typing.Union[int, float] = 255,
+            green: typing.Union[int, float] = 255
+        ) -> str:
+            """
+            Returns calculated ANSI color code for unnamed bg colors
+
+            Can be used as follows:
+            print(Styles.Bg.rgb(0, 120, 215), 'Windows Default Blue', Styles.RESET)
+            print(Styles.Bg.rgb(29, 185, 84), 'Spotify Green', Styles.RESET)
+            
+            NOTE: 0 ≤ red, green, blue ≤ 255
+            """
+
+            return (
+                f'\x1b[48;2;'
+                f'{clamp(round(red), 0, 255)};'
+                f'{clamp(round(blue), 0, 255)};'
+                f'{clamp(round(green), 0, 255)}m'
+            )
+
+    Bg = Background
+
+
+# The submodule defining each name imported the first time it is used
+# (`import dyepy` alone only defines `clamp` and `Styles`)
+_LAZY = {
+    '_HEX': 'converters', '_YIQ': 'converters', '_YIQ_INVERSE': 'converters',
+    '_YCBCR': 'converters', '_YCBCR_TRANSFORMS': 'converters',
+    '_ycbcr': 'converters', '_XTERM': 'converters', '_pack_rgb': 'converters',
+    '_unpack_rgb': 'converters', 'Colors': 'converters',
+    'Converters': 'converters', '_QuantizedTable': 'converters',
+    '_packed': 'converters',
+    '_HIGH': 'arrays', '_LOW': 'arrays', '_lut2': 'arrays',
+    '_FORMULAS': 'arrays', '_TABLES': 'arrays', '_table': 'arrays',
+    'Blend': 'arrays', 'Transform': 'arrays', 'ColorArray': 'arrays',
+    'LUT3D': 'arrays', 'YCbCr': 'arrays',
+    '_ImageFile': 'images', 'PPMReader': 'images', 'PPMWriter': 'images',
+    'PNGReader': 'images', 'PNGWriter': 'images', 'Images': 'images',
+    'Colormap': 'palettes', 'apply_colormap': 'palettes',
+    'ColorHistogram': 'palettes', 'Palette': 'palettes',
+    '_Nearest': 'palettes', 'Dither': 'palettes',
+    '_ANSI': 'ansi', '_ANSI_PARTIAL': 'ansi', '_ANSI_TOKENS': 'ansi',
+    '_NOT_PRINTABLE_ASCII': 'ansi', '_ANSI_CARRY': 'ansi', '_Widths': 'ansi',
+    '_WIDTHS': 'ansi', '_ansi_cut': 'ansi', 'strip_ansi': 'ansi', 'iter_strip_ansi': 'ansi',
+    'visible_width': 'ansi', 'wrap': 'ansi', 'AnsiHtml': 'ansi',
+    'Style': 'ansi', '_CATEGORIES': 'ansi', '_first_bytes': 'ansi',
+    'Colorizer': 'ansi',
+    'Screen': 'renderers', 'Tween': 'renderers', 'TweenScheduler': 'renderers',
+    'ProgressBar': 'renderers', 'Sparkline': 'renderers',
+    'ProgressGroup': 'renderers',
+    'Server': 'server', '_ServerError': 'server',
+    'main': 'repl', 'cli': 'repl', '_Namespace': 'repl',
+}
+
+__all__ = [
+    'clamp', 'Styles', *(name for name in _LAZY if not name.startswith('_'))
+]
+
+
+# A function to import the names of the submodules on first use (PEP 562)
+def __getattr__(name: str) -> typing.Any:
+    """
+    Returns the attribute *name* of the module, importing the submodule
+    defining it (see `_LAZY`) the first time it is used
+    """
+
+    from importlib import import_module
+
+    module = _LAZY.get(name)
+
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = globals()[name] = getattr(import_module(f'.{module}', __name__), name)
+
+    return value
+
+
+# A function to list the lazily imported names too
+def __dir__() -> typing.List[str]:
+    """
+    Returns the names of the module, including the ones not imported yet
+    """
+
+    return sorted({*globals(), *_LAZY})
@@ -0,0 +1,10 @@
+"""
+Runs the command-line of the module: `python -m dyepy`
+"""
+
+
+from .repl import cli
+
+
+if __name__ == '__main__':
+    cli()
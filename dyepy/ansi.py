@@ -0,0 +1,1067 @@
+"""
+Text with escape sequences: stripping, measuring and wrapping it,
+`AnsiHtml`, `Style` and `Colorizer`
+"""
+
+
+# Import `typing` for type-hinting
+import typing
+
+# Import `re` as `_re` (for escape sequences)
+import re as _re
+
+# Import `category`, `combining` and `east_asian_width` from `unicodedata`
+# as `_category`, `_combining` and `_east_asian_width`
+from unicodedata import (
+    category as _category,
+    combining as _combining,
+    east_asian_width as _east_asian_width
+)
+
+# Import the parser of `re` as `_sre_parse` (for `Colorizer` rules)
+try:
+    from re import _parser as _sre_parse
+except ImportError:     # Python < 3.11
+    import sre_parse as _sre_parse
+
+from . import Styles, clamp
+from .converters import Colors, _XTERM, _packed
+
+
+# A single escape sequence: CSI (like SGR), OSC (like hyperlinks), or a
+# two-character escape, all of which take no room on a terminal
+_ANSI = _re.compile(
+    r'\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])'
+)
+
+# The start of an escape sequence cut at the end of a chunk (an OSC cut
+# within its `ESC \` terminator starts at the ESC before the last one)
+_ANSI_PARTIAL = _re.compile(r'\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*\x1b?)?\Z')
+
+# The tokens of `wrap`: escape sequences, whitespace and words
+_ANSI_TOKENS = _re.compile(_ANSI.pattern + r'|\s+|[^\s\x1b]+|\x1b')
+
+# The characters that may not take exactly one column
+_NOT_PRINTABLE_ASCII = _re.compile(r'[^ -~]')
+
+# The longest cut escape sequence carried over to the next chunk
+_ANSI_CARRY = 4096
+
+
+# The terminal width of every character, computed the first time it is seen
+class _Widths(dict):
+    def __missing__(self, char: str) -> int:
+        if _category(char) in ('Mn', 'Me', 'Cf', 'Cc') or _combining(char):
+            width = 0
+
+        else:
+            width = 2 if _east_asian_width(char) in ('W', 'F') else 1
+
+        self[char] = width
+
+        return width
+
+
+_WIDTHS = _Widths()
+
+
+# A function to find an escape sequence cut at the end of a chunk
+def _ansi_cut(chunk: str) -> int:
+    """
+    Returns the index of the escape sequence started but not terminated
+    at the end of *chunk* (within its last 4096 characters), or -1
+    """
+
+    match = _ANSI_PARTIAL.search(chunk, max(len(chunk) - _ANSI_CARRY, 0))
+
+    return match.start() if match else -1
+
+
+# A function to remove the escape sequences of a string
+def strip_ansi(text: str) -> str:
+    """
+    Returns *text* without its escape sequences (everything `Styles`
+    and `Screen` emit included)
+    """
+
+    return _ANSI.sub('', text) if '\x1b' in text else text
+
+
+# A function to remove the escape sequences of a stream of strings
+def iter_strip_ansi(chunks: typing.Iterable[str]) -> typing.Iterator[str]:
+    """
+    Yields the chunks of text of *chunks* without their escape
+    sequences, scanning every character once: a sequence cut between
+    two chunks is carried over (up to 4096 characters) instead of
+    rescanning the chunks
+    """
+
+    carry = ''
+
+    for chunk in chunks:
+        if carry:
+            chunk = carry + chunk
+            carry = ''
+
+        start = _ansi_cut(chunk)
+
+        if start >= 0:
+            chunk, carry = chunk[:start], chunk[start:]
+
+        if chunk:
+            yield strip_ansi(chunk)
+
+    if carry:
+        yield strip_ansi(carry)
+
+
+# A function to measure a string on a terminal
+def visible_width(text: str) -> int:
+    """
+    Returns the number of columns *text* takes on a terminal: escape
+    sequences, combining and control characters take none, and wide
+    (East Asian) characters take two
+    """
+
+    text = strip_ansi(text)
+
+    if text.isascii() and text.isprintable():
+        return len(text)
+
+    others = _NOT_PRINTABLE_ASCII.findall(text)
+
+    return len(text) - len(others) + sum(map(_WIDTHS.__getitem__, others))
+
+
+# A function to wrap a string with escape sequences to a width
+def wrap(text: str, width: int = 70) -> typing.List[str]:
+    """
+    Returns the lines of *text* wrapped (at whitespace, or within
+    words longer than a line) to *width* visible columns, keeping the
+    newlines of *text*
+
+    Every line stands on its own: lines ending with active styles end
+    with `Styles.RESET`, and the next line starts by re-applying them
+    """
+
+    if width < 1:
+        raise ValueError(f'invalid width {width!r}')
+
+    lines = []
+    widths = _WIDTHS
+    active = []
+
+    for paragraph in text.split('\n'):
+        if lines and active:
+            # Styles also continue past the newlines of *text*
+            lines[-1] += Styles.RESET
+
+        line, used, space = list(active), 0, ''
+
+        for token in _ANSI_TOKENS.findall(paragraph):
+            if token[0] == '\x1b' and len(token) > 1:
+                line.append(token)
+
+                if token[-1] == 'm' and token[1] == '[':
+                    if token[2:-1].strip('0;'):
+                        active.append(token)
+
+                    else:
+                        active = []
+
+                continue
+
+            if token.isspace():
+                space = token
+                continue
+
+            size = len(token) if token.isascii() else sum(map(widths.__getitem__, token))
+            gap = visible_width(space) if used else 0
+
+            if used and used + gap + size > width:
+                if active:
+                    line.append(Styles.RESET)
+
+                lines.append(''.join(line))
+                line, used, space = list(active), 0, ''
+
+            # Whitespace taking no columns (like tabs) is kept too
+            if used and space:
+                line.append(space)
+                used += gap
+
+            space = ''
+
+            while used + size > width:
+                # Break words longer than a line
+                cut, room = 0, width - used
+
+                for char in token:
+                    if widths[char] > room:
+                        break
+
+                    room -= widths[char]
+                    cut += 1
+
+                if not cut and not used:
+                    cut = 1
+
+                line.append(token[:cut])
+
+                if active:
+                    line.append(Styles.RESET)
+
+                lines.append(''.join(line))
+                token = token[cut:]
+                size = sum(map(widths.__getitem__, token))
+                line, used = list(active), 0
+
+            line.append(token)
+            used += size
+
+        lines.append(''.join(line))
+
+    return lines
+
+
+# A class to convert styled text to HTML, chunk by chunk
+class AnsiHtml:
+    """
+    A streaming converter of text with SGR sequences (the ones `Styles`
+    and `Screen` emit: attributes, the 16 colors, `38;5`/`48;5` and
+    `38;2`/`48;2`) to HTML spans, every distinct style getting a CSS
+    class shared by all of its spans
+    
+    Memory stays bounded whatever the length of the input: only a
+    sequence cut between two chunks is carried over, and past
+    *max_classes* distinct styles, spans get inline styles instead.
+    
+    Usage:
+        converter = AnsiHtml()
+        with open('build.log') as log, open('build.html', 'w') as html:
+            converter.write(log, html)
+    """
+
+    # The style of text without SGR sequences, as (fg, bg, attrs)
+    DEFAULT = (-1, -1, 0)
+
+    # CSS declarations of the attribute bits (those of `Screen`, and overline)
+    _DECLARATIONS = (
+        'font-weight: bold', 'opacity: 0.5', 'font-style: italic',
+        'text-decoration: underline', 'text-decoration: blink',
+        'text-decoration: blink', '', 'visibility: hidden',
+        'text-decoration: line-through', 'text-decoration: overline'
+    )
+
+    # The bit of the overline attribute (SGR 53)
+    _OVERLINE = 1 << 9
+
+    # The bit of the reverse attribute (`Screen.REVERSE`, not imported so
+    # that the ANSI helpers don't load the renderers)
+    _REVERSE = 1 << 6
+
+    # The bits turned off by the SGR codes 21 to 29 and 55
+    _OFF = {
+        21: 1 | 2, 22: 1 | 2, 23: 4, 24: 8, 25: 16 | 32,
+        27: 64, 28: 128, 29: 256, 55: 1 << 9
+    }
+
+    # Text and (captured) escape sequences, alternately
+    _SPLIT = _re.compile(f'({_ANSI.pattern})')
+
+    def __init__(
+        self,
+        prefix: str = 'ansi',
+        max_classes: int = 4096,
+        foreground: str = '#e5e5e5',
+        background: str = '#000000'
+    ) -> None:
+        """
+        Makes a converter naming its CSS classes *prefix* followed by a
+        number, with *foreground* and *background* as the default
+        colors (used by reversed styles)
+        """
+
+        self.prefix = prefix
+        self.max_classes = max_classes
+        self.foreground = _packed(foreground)
+        self.background = _packed(background)
+        self._classes = {}
+        self._spans = {}
+        self._transitions = {}
+        self._style = self._shown = AnsiHtml.DEFAULT
+        self._carry = ''
+
+    # A function to apply the parameters of an SGR sequence to a style
+    @staticmethod
+    def _apply(style: typing.Tuple[int, int, int], parameters: str) -> typing.Tuple[int, int, int]:
+        """
+        Returns *style* after the SGR sequence of *parameters*
+        """
+
+        codes = [int(code) if code.isdigit() else 0 for code in parameters.split(';')]
+        fg, bg, attrs = style
+        index = 0
+
+        while index < len(codes):
+            code = codes[index]
+            index += 1
+
+            if code == 0:
+                fg, bg, attrs = AnsiHtml.DEFAULT
+
+            elif code < 10:
+                attrs |= 1 << (code - 1)
+
+            elif code in AnsiHtml._OFF:
+                attrs &= ~AnsiHtml._OFF[code]
+
+            elif code == 53:
+                attrs |= AnsiHtml._OVERLINE
+
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                fg = _XTERM[code - 30 if code < 90 else code - 82]
+
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                bg = _XTERM[code - 40 if code < 100 else code - 92]
+
+            elif code == 39:
+                fg = -1
+
+            elif code == 49:
+                bg = -1
+
+            elif code in (38, 48) and index < len(codes):
+                if codes[index] == 5 and index + 1 < len(codes):
+                    color = _XTERM[clamp(codes[index + 1], 0, 255)]
+                    index += 2
+
+                elif codes[index] == 2 and index + 3 < len(codes):
+                    red, green, blue = (clamp(value, 0, 255) for value in codes[index + 1:index + 4])
+                    color = red << 16 | green << 8 | blue
+                    index += 4
+
+                else:
+                    break
+
+                if code == 38:
+                    fg = color
+
+                else:
+                    bg = color
+
+        return (fg, bg, attrs)
+
+    # A function to get the CSS declarations of a style
+    def _declarations(self, fg: int, bg: int, attrs: int) -> str:
+        if attrs & AnsiHtml._REVERSE:
+            fg, bg = (
+                self.background if bg < 0 else bg,
+                self.foreground if fg < 0 else fg
+            )
+
+        declarations = []
+        decorations = []
+
+        if fg >= 0:
+            declarations.append(f'color: {Colors.rgb(fg >> 16, fg >> 8 & 255, fg & 255)}')
+
+        if bg >= 0:
+            declarations.append(f'background-color: {Colors.rgb(bg >> 16, bg >> 8 & 255, bg & 255)}')
+
+        for bit, declaration in enumerate(AnsiHtml._DECLARATIONS):
+            if attrs >> bit & 1 and declaration:
+                if declaration.startswith('text-decoration'):
+                    decorations.append(declaration.split(': ')[1])
+
+                elif declaration not in declarations:
+                    declarations.append(declaration)
+
+        if decorations:
+            declarations.append('text-decoration: ' + ' '.join(dict.fromkeys(decorations)))
+
+        return '; '.join(declarations)
+
+    # A function to switch from the open span to the one of a style
+    def _span(self, style: typing.Tuple[int, int, int]) -> str:
+        html = '' if self._shown == AnsiHtml.DEFAULT else '</span>'
+        self._shown = style
+
+        if style == AnsiHtml.DEFAULT:
+            return html
+
+        span = self._spans.get(style)
+
+        if span is None:
+            if len(self._classes) < self.max_classes:
+                name = self._classes[style] = f'{self.prefix}{len(self._classes)}'
+                span = self._spans[style] = f'<span class="{name}">'
+
+            else:
+                span = f'<span style="{self._declarations(*style)}">'
+
+        return html + span
+
+    # A function to convert a chunk of text
+    def feed(self, chunk: str) -> str:
+        """
+        Returns the HTML of the chunk of text *chunk* (a sequence cut at
+        its end being converted with the next chunk)
+        """
+
+        if self._carry:
+            chunk = self._carry + chunk
+            self._carry = ''
+
+        start = _ansi_cut(chunk)
+
+        if start >= 0:
+            chunk, self._carry = chunk[:start], chunk[start:]
+
+        parts = AnsiHtml._SPLIT.split(chunk)
+        transitions = self._transitions
+        style = self._style
+        html = []
+
+        for index in range(0, len(parts), 2):
+            if index:
+                sequence = parts[index - 1]
+
+                if sequence[-1] == 'm' and sequence[1] == '[':
+                    key = (style, sequence)
+                    following = transitions.get(key)
+
+                    if following is None:
+                        if len(transitions) > 4 * self.max_classes:
+                            transitions.clear()
+
+                        following = transitions[key] = AnsiHtml._apply(style, sequence[2:-1])
+
+                    style = following
+
+            text = parts[index]
+
+            if text:
+                if style != self._shown:
+                    html.append(self._span(style))
+
+                if '&' in text or '<' in text or '>' in text:
+                    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+                html.append(text)
+
+        self._style = style
+
+        return ''.join(html)
+
+    # A function to end the conversion
+    def close(self) -> str:
+        """
+        Returns the end of the HTML (that of the open span, if any),
+        dropping an unfinished sequence left at the end of the input
+        """
+
+        html = self._span(AnsiHtml.DEFAULT)
+        self._style = AnsiHtml.DEFAULT
+        self._carry = ''
+
+        return html
+
+    # A function to get the stylesheet of the classes used so far
+    def css(self) -> str:
+        """
+        Returns the CSS rules of the classes of the styles seen so far
+        """
+
+        return ''.join(
+            f'.{name} {{ {self._declarations(*style)} }}\n'
+            for style, name in self._classes.items()
+        )
+
+    # A function to convert a whole stream of text
+    def convert(self, chunks: typing.Iterable[str]) -> typing.Iterator[str]:
+        """
+        Yields the HTML of every chunk of *chunks*, then its end
+        """
+
+        for chunk in chunks:
+            html = self.feed(chunk)
+
+            if html:
+                yield html
+
+        yield self.close()
+
+    # A function to write a whole stream of text as an HTML snippet
+    def write(self, chunks: typing.Iterable[str], file: typing.TextIO) -> None:
+        """
+        Writes *chunks* converted to HTML to *file*, in a `<pre>`
+        element followed by the `<style>` element of its classes
+        """
+
+        file.write(f'<pre class="{self.prefix}">')
+
+        for html in self.convert(chunks):
+            file.write(html)
+
+        file.write(f'</pre>\n<style>\n{self.css()}</style>\n')
+
+
+# A class of compiled (and interned) combinations of styles and colors
+class Style:
+    """
+    A combination of `Styles` attributes, a foreground and a background
+    color, compiled once into a single SGR sequence
+    
+    Styles are interned: making the same style twice returns the very
+    same object (up to `Style.CACHE_SIZE` styles), so they can be made
+    in hot loops, and calling one just concatenates three strings.
+    
+    Usage:
+        alert = Style(bold=True, fg=Colors.WHITE, bg=(215, 0, 0))
+        alert.sequence          # '\x1b[1;38;2;255;255;255;48;2;215;0;0m'
+        print(alert('ERROR'), 'something went wrong')
+        note = Style(Styles.ITALIC, Styles.Fg.CYAN) | Style(underline=True)
+    """
+
+    # The SGR codes of the attributes
+    ATTRIBUTES = {
+        'bold': 1, 'disable': 2, 'italic': 3, 'underline': 4,
+        'slowblink': 5, 'rapidblink': 6, 'reverse': 7, 'invisible': 8,
+        'strikethrough': 9, 'frame': 51, 'encircle': 52, 'overline': 53
+    }
+
+    # The most interned styles (all of them are forgotten past it)
+    CACHE_SIZE = 4096
+
+    # The interned styles, by (attribute codes, fg codes, bg codes)
+    _cache = {}
+
+    # The interned styles, by the arguments they were made with
+    _made = {}
+
+    __slots__ = ('codes', 'fg', 'bg', 'sequence', '_reset')
+
+    def __new__(
+        cls,
+        *sequences: str,
+        fg: typing.Union[str, int, typing.Sequence[int], None] = None,
+        bg: typing.Union[str, int, typing.Sequence[int], None] = None,
+        **attributes: bool
+    ) -> 'Style':
+        """
+        Returns the style of the SGR *sequences* (like `Styles.BOLD` or
+        `Styles.Fg.n(196)`) in order, then of the *fg* and *bg* colors
+        (SGR sequences, Hex values, RGB tuples or packed colors) and of
+        the *attributes* (names of `Style.ATTRIBUTES` set to True to add
+        them, False to remove them)
+        """
+
+        try:
+            arguments = (sequences, fg, bg, tuple(attributes.items()))
+            style = Style._made.get(arguments)
+
+        except TypeError:   # Unhashable colors (like lists) are just not cached
+            arguments = style = None
+
+        if style is not None:
+            return style
+
+        codes, front, back = set(), '', ''
+
+        for sequence in sequences:
+            codes, front, back = Style._parse(sequence, codes, front, back)
+
+        if fg is not None:
+            front = Style._color(fg, '38')
+
+        if bg is not None:
+            back = Style._color(bg, '48')
+
+        for name, value in attributes.items():
+            try:
+                code = Style.ATTRIBUTES[name]
+
+            except KeyError:
+                raise TypeError(f'Unknown style attribute {name!r}') from None
+
+            if value:
+                codes.add(code)
+
+            else:
+                codes.discard(code)
+
+        style = Style._intern(tuple(sorted(codes)), front, back)
+
+        if arguments is not None:
+            if len(Style._made) >= Style.CACHE_SIZE:
+                Style._made.clear()
+
+            Style._made[arguments] = style
+
+        return style
+
+    # A function to get the interned style of codes
+    @staticmethod
+    def _intern(codes: typing.Tuple[int, ...], fg: str, bg: str) -> 'Style':
+        key = (codes, fg, bg)
+        style = Style._cache.get(key)
+
+        if style is None:
+            if len(Style._cache) >= Style.CACHE_SIZE:
+                Style._cache.clear()
+                Style._made.clear()
+
+            style = object.__new__(Style)
+            style.codes, style.fg, style.bg = key
+            parameters = ';'.join([*map(str, codes), *filter(None, (fg, bg))])
+            style.sequence = f'\x1b[{parameters}m' if parameters else ''
+            style._reset = Styles.RESET if parameters else ''
+            Style._cache[key] = style
+
+        return style
+
+    # A function to read the codes of an SGR sequence
+    @staticmethod
+    def _parse(
+        sequence: str, codes: typing.Set[int], fg: str, bg: str
+    ) -> typing.Tuple[typing.Set[int], str, str]:
+        """
+        Returns the attribute codes, foreground and background parameters
+        (*codes*, *fg* and *bg*) updated with the SGR *sequence* (or SGR
+        sequences concatenated, like `Styles.BOLD + Styles.Fg.RED`)
+        """
+
+        parts = _ANSI.findall(sequence)
+
+        if not parts or ''.join(parts) != sequence or not all(
+            part.startswith('\x1b[') and part.endswith('m') for part in parts
+        ):
+            raise ValueError(f'Not an SGR sequence: {sequence!r}')
+
+        parameters = [
+            int(code) if code else 0 for part in parts for code in part[2:-1].split(';')
+        ]
+        index = 0
+
+        while index < len(parameters):
+            code = parameters[index]
+            index += 1
+
+            if code in (38, 48):
+                size = 2 if parameters[index:index + 1] == [5] else 4
+                color = ';'.join(map(str, parameters[index - 1:index + size]))
+                index += size
+
+            else:
+                color = str(code)
+
+            if code == 0:
+                codes, fg, bg = set(), '', ''
+
+            elif 30 <= code <= 38 or 90 <= code <= 97:
+                fg = color
+
+            elif 40 <= code <= 48 or 100 <= code <= 107:
+                bg = color
+
+            elif code == 39:
+                fg = ''
+
+            elif code == 49:
+                bg = ''
+
+            else:
+                codes = codes | {code}
+
+        return codes, fg, bg
+
+    # A function to get the SGR parameters of a color
+    @staticmethod
+    def _color(color: typing.Union[str, int, typing.Sequence[int]], prefix: str) -> str:
+        if isinstance(color, str) and color.startswith('\x1b'):
+            _, fg, bg = Style._parse(color, set(), '', '')
+
+            return fg or bg
+
+        color = _packed(color)
+
+        return f'{prefix};2;{color >> 16};{color >> 8 & 255};{color & 255}'
+
+    def __call__(self, text: str) -> str:
+        """
+        Returns *text* in this style (followed by `Styles.RESET`)
+        """
+
+        return self.sequence + text + self._reset
+
+    def __or__(self, other: 'Style') -> 'Style':
+        """
+        Returns the style with the attributes of both styles, and the
+        colors of *other* (those of this style if *other* has none)
+        """
+
+        return Style._intern(
+            tuple(sorted({*self.codes, *other.codes})),
+            other.fg or self.fg,
+            other.bg or self.bg
+        )
+
+    def __str__(self) -> str:
+        return self.sequence
+
+    def __repr__(self) -> str:
+        return f'Style({self.sequence!r})'
+
+    def __reduce__(self) -> tuple:
+        return (Style, (self.sequence,) if self.sequence else ())
+
+
+# The bytes of the character categories of bytes patterns (ASCII)
+_CATEGORIES = {
+    'DIGIT': frozenset(b'0123456789'),
+    'WORD': frozenset(
+        b'0123456789_ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+    ),
+    'SPACE': frozenset(b' \t\n\r\f\v'),
+}
+
+
+def _first_bytes(
+    items: typing.Sequence[tuple], ignorecase: bool = False
+) -> typing.Tuple[typing.Optional[typing.Set[int]], bool]:
+    """
+    Returns the bytes a match of the parsed regular expression *items*
+    can start with (None if any byte) and whether it can match nothing
+    """
+
+    first = set()
+    everything = frozenset(range(256))
+
+    for op, av in items:
+        found = None
+
+        if op is _sre_parse.AT or op in (_sre_parse.ASSERT, _sre_parse.ASSERT_NOT):
+            continue
+
+        if op is _sre_parse.LITERAL:
+            found = {av}
+
+        elif op is _sre_parse.NOT_LITERAL:
+            found = everything - {av}
+
+        elif op is _sre_parse.IN:
+            found = set()
+            negate = False
+
+            for kind, value in av:
+                if kind is _sre_parse.NEGATE:
+                    negate = True
+
+                elif kind is _sre_parse.LITERAL:
+                    found.add(value)
+
+                elif kind is _sre_parse.RANGE:
+                    found.update(range(value[0], min(value[1], 255) + 1))
+
+                elif kind is _sre_parse.CATEGORY:
+                    name = str(value)[len('CATEGORY_'):]
+                    category = _CATEGORIES.get(name[len('NOT_'):] if name.startswith('NOT_') else name)
+
+                    if category is None:
+                        return (None, False)
+
+                    found.update(everything - category if name.startswith('NOT_') else category)
+
+                else:
+                    return (None, False)
+
+            if negate:
+                found = everything - found
+
+        elif op is _sre_parse.SUBPATTERN:
+            add_flags, del_flags = av[1], av[2]
+            found, empty = _first_bytes(
+                av[-1],
+                (ignorecase or bool(add_flags & _sre_parse.SRE_FLAG_IGNORECASE))
+                and not del_flags & _sre_parse.SRE_FLAG_IGNORECASE
+            )
+
+            if found is None:
+                return (None, False)
+
+            if empty:
+                first |= found
+                continue
+
+        elif op is _sre_parse.BRANCH:
+            found, empty = set(), False
+
+            for branch in av[1]:
+                start, nothing = _first_bytes(branch, ignorecase)
+
+                if start is None:
+                    return (None, False)
+
+                found |= start
+                empty = empty or nothing
+
+            if empty:
+                first |= found
+                continue
+
+        elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+            found, empty = _first_bytes(av[2], ignorecase)
+
+            if found is None:
+                return (None, False)
+
+            if empty or not av[0]:
+                first |= found
+                continue
+
+        else:
+            return (None, False)
+
+        if ignorecase:
+            found = found | {
+                byte ^ 32 for byte in found if 65 <= byte <= 90 or 97 <= byte <= 122
+            }
+
+        return (first | found, False)
+
+    return (first, True)
+
+
+# A class to colorize log streams with regex rules
+class Colorizer:
+    """
+    A rule-based log colorizer (like grc or ccze): every rule is a
+    regular expression and the `Style` of its matches
+    
+    The rules are compiled into a single alternation, so every chunk
+    of lines is scanned once whatever the number of rules (the first
+    rule matching at a position wins), and the scanning works on bytes,
+    so streams are never decoded. Escape sequences already in the
+    stream are passed through as they are.
+    
+    Usage:
+        colorizer = Colorizer([(r'\\bGET\\b', 'bold green'), *Colorizer.RULES])
+        colorizer(b'2020-10-12 12:00:00 ERROR GET /index.html\n')
+        colorizer.stream(sys.stdin.buffer, sys.stdout.buffer)
+        $ journalctl -f | dyepy colorize --rule 'fg=#ff8800' 'sshd\\[\\d+\\]'
+    
+    Styles are `Style` objects, SGR sequences (like `Styles.Fg.RED` or
+    `Styles.Fg.rgb(0, 120, 215)`) or specifications (see `style`).
+    """
+
+    # The default rules, for the usual log lines
+    RULES = (
+        (r'\b(?:EMERG|ALERT|CRIT(?:ICAL)?|FATAL|ERR(?:OR)?)\b', 'bold red'),
+        (r'\b(?i:fail(?:ed|ure)?)\b', 'red'),
+        (r'\bWARN(?:ING)?\b', 'bold yellow'),
+        (r'\b(?:INFO|NOTICE)\b', 'green'),
+        (r'\b(?:DEBUG|TRACE)\b', 'darkgrey'),
+        (r'\b\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d(?:[.,]\d+)?(?:Z|[+-]\d\d:?\d\d)?', 'blue'),
+        (r'^[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d', 'blue'),
+        (r'\bhttps?://[^\s"\'<>]+', 'underline lightblue'),
+        (r'\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b', 'cyan'),
+        (r'"[^"\n]*"', 'purple'),
+    )
+
+    # Leading global flags, and escapes or named groups and backreferences
+    _FLAGS = _re.compile(rb'\(\?([aiLmsux]+)\)')
+    _NAMES = _re.compile(rb'\\.|\(\?P([<=])(\w+)')
+
+    def __init__(
+        self,
+        rules: typing.Optional[typing.Iterable[typing.Tuple[
+            typing.Union[str, bytes], typing.Union['Style', str]
+        ]]] = None
+    ) -> None:
+        """
+        Makes a colorizer of the (pattern, style) *rules*, in order of
+        precedence (`Colorizer.RULES` by default)
+
+        NOTE: Patterns are matched line by line (with re.MULTILINE) and
+        shouldn't match newlines nor use numbered backreferences; their
+        leading global flags (like `(?i)`) only apply to themselves and
+        their named groups are renamed (`name` becomes `r<rule>_name`)
+        """
+
+        self.rules = [
+            (pattern, Colorizer.style(style))
+            for pattern, style in (Colorizer.RULES if rules is None else rules)
+        ]
+        # Group 1 is the escape sequences, passed through as they are
+        alternatives = [b'(' + _ANSI.pattern.encode() + b')']
+        self._styles = {1: (b'', b'')}
+        starts = {0x1b}
+        group = 2
+
+        for rule, (pattern, style) in enumerate(self.rules):
+            if isinstance(pattern, str):
+                pattern = pattern.encode()
+
+            pattern = Colorizer._scoped(pattern, rule)
+            alternatives.append(b'(' + pattern + b')')
+            self._styles[group] = (style.sequence.encode(), style._reset.encode())
+            group += _re.compile(pattern).groups + 1
+
+            if starts is not None:
+                parsed = _sre_parse.parse(pattern, _re.MULTILINE)
+                first, empty = _first_bytes(
+                    parsed, bool(parsed.state.flags & _re.IGNORECASE)
+                )
+                starts = None if first is None or empty else starts | first
+
+        pattern = b'|'.join(alternatives)
+
+        # Most positions can't start any match: a lookahead of the bytes
+        # matches can start with spares trying every rule there
+        if starts is not None:
+            pattern = b'(?=[' + b''.join(
+                b'\\x%02x' % byte for byte in sorted(starts)
+            ) + b'])(?:' + pattern + b')'
+
+        self.pattern = _re.compile(pattern, _re.MULTILINE)
+
+    # A function to make a pattern usable within the alternation of the rules
+    @staticmethod
+    def _scoped(pattern: bytes, rule: int) -> bytes:
+        """
+        Returns *pattern* with its leading global flags turned into a
+        scoped group (`(?i)a` -> `(?i:a)`) and its named groups (and
+        their backreferences) renamed after the index of the *rule*, so
+        that it can be combined with other patterns
+        """
+
+        flags = b''
+        match = Colorizer._FLAGS.match(pattern)
+
+        while match:
+            flags += match.group(1)
+            pattern = pattern[match.end():]
+            match = Colorizer._FLAGS.match(pattern)
+
+        pattern = Colorizer._NAMES.sub(
+            lambda match: match.group() if match.group(1) is None else (
+                b'(?P' + match.group(1) + b'r%d_' % rule + match.group(2)
+            ),
+            pattern
+        )
+
+        if flags:
+            # A comment of a verbose pattern would hide the closing parenthesis
+            pattern = b'(?' + flags + b':' + pattern + (b'\n)' if b'x' in flags else b')')
+
+        return pattern
+
+    # A function to read a style specification
+    @staticmethod
+    def style(spec: typing.Union['Style', str]) -> 'Style':
+        """
+        Returns the style *spec*: a `Style`, SGR sequences (like
+        `Styles.BOLD + Styles.Fg.rgb(0, 120, 215)`) or words separated
+        by spaces or commas, each a `Style.ATTRIBUTES` name, a
+        `Styles.Fg` color name, `fg=COLOR` or `bg=COLOR` (a `Styles.Fg`
+        or `Styles.Bg` color name or a Hex value)
+        
+        E.g.: Colorizer.style('bold red'), Colorizer.style('fg=#ff8800,bg=blue')
+        """
+
+        if isinstance(spec, Style):
+            return spec
+
+        if spec.startswith('\x1b'):
+            return Style(*_ANSI.findall(spec))
+
+        style = Style()
+
+        for word in spec.replace(',', ' ').split():
+            key, _, value = word.partition('=')
+            key = key.lower()
+
+            if value and key in ('fg', 'bg'):
+                named = getattr(Styles.Fg if key == 'fg' else Styles.Bg, value.upper(), None)
+                style |= Style(named) if isinstance(named, str) else Style(**{key: value})
+
+            elif not value and key in Style.ATTRIBUTES:
+                style |= Style(**{key: True})
+
+            elif not value and isinstance(getattr(Styles.Fg, key.upper(), None), str):
+                style |= Style(getattr(Styles.Fg, key.upper()))
+
+            else:
+                raise ValueError(f'Unknown style {word!r}')
+
+        return style
+
+    def _replace(self, match: typing.Match[bytes]) -> bytes:
+        start, end = self._styles[match.lastindex]
+
+        return start + match[0] + end
+
+    # A function to colorize lines
+    def __call__(self, data: bytes) -> bytes:
+        """
+        Returns the whole lines *data* (UTF-8 or any ASCII compatible
+        encoding) with the matches of the rules styled
+        """
+
+        return self.pattern.sub(self._replace, data)
+
+    # A function to colorize a string
+    def text(self, text: str) -> str:
+        """
+        Returns the lines *text* with the matches of the rules styled
+        """
+
+        return self(text.encode('utf-8', 'surrogateescape')).decode('utf-8', 'surrogateescape')
+
+    # A function to colorize a stream
+    def stream(
+        self,
+        source: typing.BinaryIO,
+        sink: typing.BinaryIO,
+        size: int = 1 << 20
+    ) -> None:
+        """
+        Returns nothing, writes every line of the binary stream *source*
+        colorized to *sink*, reading and writing up to *size* bytes at
+        a time (whatever is available from pipes like `tail -f`, which
+        is written and flushed right away)
+        """
+
+        read = getattr(source, 'read1', source.read)
+        write = sink.write
+        carry = b''
+
+        while True:
+            chunk = read(size)
+
+            if not chunk:
+                break
+
+            end = chunk.rfind(b'\n') + 1
+
+            if not end:
+                carry += chunk
+
+                if len(carry) < size:
+                    continue
+
+                # A very long line, colorized in pieces
+                chunk, carry, end = carry, b'', len(carry)
+
+            elif carry:
+                chunk = carry + chunk
+                end += len(carry)
+
+            carry = chunk[end:]
+            write(self(chunk[:end]))
+            sink.flush()
+
+        if carry:
+            write(self(carry))
+            sink.flush()
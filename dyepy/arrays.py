@@ -0,0 +1,1632 @@
+"""
+Whole buffers of colors at once: `Blend`, `Transform`, `ColorArray`,
+`LUT3D` and `YCbCr`
+"""
+
+
+# Import `typing` for type-hinting
+import typing
+
+# Import `array` from `array` as `_array`
+from array import array as _array
+
+# Import `byteorder` from `sys` as `_byteorder`
+from sys import byteorder as _byteorder
+
+# Import `chain` from `itertools` as `_chain`
+from itertools import chain as _chain
+
+from . import clamp
+from .converters import (
+    Colors, Converters, _YIQ, _YIQ_INVERSE, _pack_rgb, _unpack_rgb, _ycbcr
+)
+
+
+# Offsets of the high and low bytes of a native unsigned short
+_HIGH, _LOW = (1, 0) if _byteorder == 'little' else (0, 1)
+
+
+def _lut2(
+    table: typing.Sequence[int],
+    first: typing.Union[bytes, bytearray, memoryview],
+    second: typing.Union[bytes, bytearray, memoryview]
+) -> bytes:
+    """
+    Returns table[first[i] << 8 | second[i]] for every byte of two
+    equally long buffers, i.e. any binary operation on 8-bit values
+    precomputed as a 65536-entry *table* (a list is the fastest)
+
+    The bytes are interleaved into native unsigned shorts with strided
+    slice assignments and looked up with `map`, so no Python code
+    runs per byte
+    """
+
+    pairs = bytearray(2 * len(first))
+    pairs[_HIGH::2] = first
+    pairs[_LOW::2] = second
+
+    indices = _array('H')
+    indices.frombytes(pairs)
+
+    return bytes(map(table.__getitem__, indices))
+
+
+# Formulas of the binary operations on 8-bit values used with `_lut2`
+_FORMULAS = {
+    'multiply': lambda x, y: (x * y + 127) // 255,
+    'add': lambda x, y: min(x + y, 255),
+    'screen': lambda x, y: x + y - (x * y + 127) // 255,
+    # overlay(backdrop, source) = hard light(source, backdrop)
+    'overlay': lambda b, s: (
+        (2 * b * s + 127) // 255 if b < 128
+        else 255 - (2 * (255 - b) * (255 - s) + 127) // 255
+    ),
+    'divide': lambda c, a: min((c * 255 + a // 2) // a, 255) if a else 0,
+    'add_mod': lambda x, y: (x + y) & 255,
+    'subtract_mod': lambda x, y: (x - y) & 255,
+    'average': lambda x, y: (x + y) >> 1,
+    'average_up': lambda x, y: (x + y + 1) >> 1,
+}
+
+# Lookup tables of the formulas, built the first time they are used
+_TABLES = {}
+
+
+def _table(name: str) -> typing.List[int]:
+    """
+    Returns the 65536-entry lookup table of the operation *name*
+    (see `_FORMULAS`), to be used with `_lut2`
+    """
+
+    table = _TABLES.get(name)
+
+    if table is None:
+        formula = _FORMULAS[name]
+        table = _TABLES[name] = [
+            formula(x, y) for x in range(256) for y in range(256)
+        ]
+
+    return table
+
+
+# A class to composite (alpha blend) whole RGBA buffers
+class Blend:
+    """
+    Blend class
+
+    A class to composite buffers of interleaved 8-bit RGBA pixels
+    (straight alpha, as read from images) in whole-buffer passes,
+    following the W3C Compositing and Blending specification:
+        https://www.w3.org/TR/compositing-1/
+    
+    Every operation on 8-bit values is precomputed once as a lookup
+    table, so compositing never runs Python code per pixel.
+    
+    NOTE: All methods in this class are `static` methods
+    
+    Usage:
+        Blend.over(thumbnail, overlay)
+        Blend.composite(thumbnail, overlay, 'multiply')
+    
+    Supported modes: normal, multiply, screen, overlay
+    """
+
+    # Inverts 8-bit values (255 - x) with `bytes.translate`
+    _INVERT = bytes(range(255, -1, -1))
+
+    # A function to repeat each byte of a buffer a few times
+    @staticmethod
+    def _spread(values: typing.Union[bytes, memoryview], times: int) -> bytearray:
+        """
+        Returns *values* with every byte repeated *times* times, e.g. to
+        apply an alpha channel to every color channel
+        """
+
+        spread = bytearray(times * len(values))
+
+        for offset in range(times):
+            spread[offset::times] = values
+
+        return spread
+
+    # A function to split an RGBA buffer into its colors and alpha
+    @staticmethod
+    def _split(
+        pixels: typing.Union[bytes, bytearray, memoryview]
+    ) -> typing.Tuple[bytearray, bytes]:
+        """
+        Returns the interleaved RGB bytes and the alpha bytes of *pixels*
+        """
+
+        pixels = memoryview(pixels).cast('B')
+
+        if len(pixels) % 4:
+            raise ValueError('RGBA buffers must hold 4 bytes per pixel')
+
+        colors = bytearray(3 * (len(pixels) // 4))
+        colors[0::3] = pixels[0::4]
+        colors[1::3] = pixels[1::4]
+        colors[2::3] = pixels[2::4]
+
+        return colors, bytes(pixels[3::4])
+
+    # A function to join colors and alpha into an RGBA buffer
+    @staticmethod
+    def _join(
+        colors: typing.Union[bytes, bytearray],
+        alpha: typing.Union[bytes, bytearray],
+        out: typing.Optional[typing.Union[bytearray, memoryview]] = None
+    ) -> typing.Union[bytearray, memoryview]:
+        """
+        Returns an RGBA buffer (*out* if given) from RGB bytes and alpha bytes
+        """
+
+        if out is None:
+            out = bytearray(4 * len(alpha))
+
+        view = memoryview(out).cast('B')
+        view[0::4] = colors[0::3]
+        view[1::4] = colors[1::3]
+        view[2::4] = colors[2::3]
+        view[3::4] = alpha
+
+        return out
+
+    # A function to premultiply the colors of an RGBA buffer by their alpha
+    @staticmethod
+    def premultiply(
+        pixels: typing.Union[bytes, bytearray, memoryview]
+    ) -> bytearray:
+        """
+        Returns the RGBA buffer *pixels* with premultiplied alpha
+        """
+
+        colors, alpha = Blend._split(pixels)
+
+        return Blend._join(
+            _lut2(_table('multiply'), colors, Blend._spread(alpha, 3)),
+            alpha
+        )
+
+    # A function to divide the colors of an RGBA buffer by their alpha
+    @staticmethod
+    def unpremultiply(
+        pixels: typing.Union[bytes, bytearray, memoryview]
+    ) -> bytearray:
+        """
+        Returns the premultiplied RGBA buffer *pixels* with straight alpha
+        """
+
+        colors, alpha = Blend._split(pixels)
+
+        return Blend._join(
+            _lut2(_table('divide'), colors, Blend._spread(alpha, 3)),
+            alpha
+        )
+
+    # A function to put a premultiplied RGBA buffer over another
+    @staticmethod
+    def over_premultiplied(
+        backdrop: typing.Union[bytes, bytearray, memoryview],
+        source: typing.Union[bytes, bytearray, memoryview]
+    ) -> bytes:
+        """
+        Returns *source* over *backdrop*, both being premultiplied RGBA
+        buffers of the same size (the result is premultiplied too)
+
+        All four channels follow the same formula, source + backdrop ×
+        (1 - source alpha), so the whole buffer is done in three passes
+        """
+
+        source = memoryview(source).cast('B')
+
+        if len(source) != len(memoryview(backdrop).cast('B')):
+            raise ValueError('Both buffers must have the same size')
+
+        inverse = Blend._spread(bytes(source[3::4]).translate(Blend._INVERT), 4)
+
+        return _lut2(
+            _table('add'),
+            source,
+            _lut2(_table('multiply'), backdrop, inverse)
+        )
+
+    # A function to composite an RGBA buffer onto another
+    @staticmethod
+    def composite(
+        backdrop: typing.Union[bytes, bytearray, memoryview],
+        source: typing.Union[bytes, bytearray, memoryview],
+        mode: str = 'normal',
+        out: typing.Optional[typing.Union[bytearray, memoryview]] = None
+    ) -> typing.Union[bytearray, memoryview]:
+        """
+        Returns *source* blended with *mode* and composited over *backdrop*
+        (straight-alpha RGBA buffers of the same size), into *out* if given
+        (which may be *backdrop* itself)
+        
+        mode: normal, multiply, screen or overlay
+        """
+
+        if mode != 'normal' and mode not in ('multiply', 'screen', 'overlay'):
+            raise ValueError(f'Unknown blend mode {mode!r}')
+
+        multiply = _table('multiply')
+        add = _table('add')
+
+        backdrop_colors, backdrop_alpha = Blend._split(backdrop)
+        source_colors, source_alpha = Blend._split(source)
+
+        if len(backdrop_alpha) != len(source_alpha):
+            raise ValueError('Both buffers must have the same size')
+
+        count = len(source_alpha)
+        opaque_backdrop = backdrop_alpha.count(255) == count
+
+        # Cs' = (1 - αb) × Cs + αb × B(Cb, Cs)
+        if mode != 'normal':
+            blended = _lut2(_table(mode), backdrop_colors, source_colors)
+
+            if opaque_backdrop:
+                source_colors = blended
+
+            else:
+                backdrop_alpha3 = Blend._spread(backdrop_alpha, 3)
+                source_colors = _lut2(
+                    add,
+                    _lut2(
+                        multiply, source_colors,
+                        backdrop_alpha3.translate(Blend._INVERT)
+                    ),
+                    _lut2(multiply, blended, backdrop_alpha3)
+                )
+
+        if source_alpha.count(255) == count:
+            return Blend._join(source_colors, source_alpha, out)
+
+        # co = αs × Cs' + αb × (1 - αs) × Cb, αo = αs + αb × (1 - αs)
+        visible = _lut2(
+            multiply, backdrop_alpha, source_alpha.translate(Blend._INVERT)
+        )
+        colors = _lut2(
+            add,
+            _lut2(multiply, source_colors, Blend._spread(source_alpha, 3)),
+            _lut2(multiply, backdrop_colors, Blend._spread(visible, 3))
+        )
+
+        if opaque_backdrop:
+            return Blend._join(colors, backdrop_alpha, out)
+
+        alpha = _lut2(add, source_alpha, visible)
+
+        return Blend._join(
+            _lut2(_table('divide'), colors, Blend._spread(alpha, 3)),
+            alpha,
+            out
+        )
+
+    # A function to put an RGBA buffer over another
+    @staticmethod
+    def over(
+        backdrop: typing.Union[bytes, bytearray, memoryview],
+        source: typing.Union[bytes, bytearray, memoryview],
+        out: typing.Optional[typing.Union[bytearray, memoryview]] = None
+    ) -> typing.Union[bytearray, memoryview]:
+        """
+        Returns *source* composited over *backdrop* (see `composite`)
+        """
+
+        return Blend.composite(backdrop, source, 'normal', out)
+
+    # A function to multiply an RGBA buffer onto another
+    @staticmethod
+    def multiply(
+        backdrop: typing.Union[bytes, bytearray, memoryview],
+        source: typing.Union[bytes, bytearray, memoryview],
+        out: typing.Optional[typing.Union[bytearray, memoryview]] = None
+    ) -> typing.Union[bytearray, memoryview]:
+        """
+        Returns *source* multiplied onto *backdrop* (see `composite`)
+        """
+
+        return Blend.composite(backdrop, source, 'multiply', out)
+
+    # A function to screen an RGBA buffer onto another
+    @staticmethod
+    def screen(
+        backdrop: typing.Union[bytes, bytearray, memoryview],
+        source: typing.Union[bytes, bytearray, memoryview],
+        out: typing.Optional[typing.Union[bytearray, memoryview]] = None
+    ) -> typing.Union[bytearray, memoryview]:
+        """
+        Returns *source* screened onto *backdrop* (see `composite`)
+        """
+
+        return Blend.composite(backdrop, source, 'screen', out)
+
+    # A function to overlay an RGBA buffer onto another
+    @staticmethod
+    def overlay(
+        backdrop: typing.Union[bytes, bytearray, memoryview],
+        source: typing.Union[bytes, bytearray, memoryview],
+        out: typing.Optional[typing.Union[bytearray, memoryview]] = None
+    ) -> typing.Union[bytearray, memoryview]:
+        """
+        Returns *source* overlaid onto *backdrop* (see `composite`)
+        """
+
+        return Blend.composite(backdrop, source, 'overlay', out)
+
+
+class Transform:
+    """
+    A linear color transform: a 3×3 matrix and an offset applied to
+    normalized (0 to 1) RGB vectors, `(matrix @ vector) + offset`
+    
+    Transforms compose with `then` into a single matrix and offset,
+    so a chain of adjustments costs as much per pixel as one of them.
+    
+    Usage:
+        transform = Transform.saturation(1.5).then(Transform.cvd('deuteranopia'))
+        transform.color(0, 120, 215)  # (r, g, b), 8-bit
+        transform(row)  # a row function (see `Images.pixels`)
+        Images.recolor('in.png', 'out.png', transform)
+    """
+
+    # The luma weights of `grayscale` and `saturation` (the Y row of YIQ)
+    LUMA = _YIQ[0]
+
+    # Color vision deficiency matrices at full severity (Machado et al., 2009)
+    CVD = {
+        'protanopia': (
+            (0.152286, 1.052583, -0.204868),
+            (0.114503, 0.786281, 0.099216),
+            (-0.003882, -0.048116, 1.051998)
+        ),
+        'deuteranopia': (
+            (0.367322, 0.860646, -0.227968),
+            (0.280085, 0.672501, 0.047413),
+            (-0.01182, 0.04294, 0.968881)
+        ),
+        'tritanopia': (
+            (1.255528, -0.076749, -0.178779),
+            (-0.078411, 0.930809, 0.147602),
+            (0.004733, 0.691367, 0.3039)
+        ),
+    }
+
+    def __init__(
+        self,
+        matrix: typing.Sequence[typing.Sequence[typing.Union[int, float]]] = (
+            (1, 0, 0), (0, 1, 0), (0, 0, 1)
+        ),
+        offset: typing.Sequence[typing.Union[int, float]] = (0, 0, 0)
+    ) -> None:
+        """
+        Makes a transform out of a 3×3 *matrix* (one row per output
+        channel) and an *offset* added after it
+        """
+
+        self.matrix = tuple(tuple(row) for row in matrix)
+        self.offset = tuple(offset)
+        self._tables = None
+
+        if len(self.matrix) != 3 or any(len(row) != 3 for row in self.matrix):
+            raise ValueError('expected a 3×3 matrix')
+
+        if len(self.offset) != 3:
+            raise ValueError('expected an offset of 3 values')
+
+    def __repr__(self) -> str:
+        return f'Transform({self.matrix!r}, {self.offset!r})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Transform):
+            return NotImplemented
+
+        return self.matrix == other.matrix and self.offset == other.offset
+
+    # A function to compose two transforms
+    def then(self, other: 'Transform') -> 'Transform':
+        """
+        Returns the transform applying this transform, then *other*
+        """
+
+        matrix = tuple(
+            tuple(
+                sum(row[k] * self.matrix[k][column] for k in range(3))
+                for column in range(3)
+            )
+            for row in other.matrix
+        )
+        offset = tuple(
+            sum(row[k] * self.offset[k] for k in range(3)) + extra
+            for row, extra in zip(other.matrix, other.offset)
+        )
+
+        return Transform(matrix, offset)
+
+    # A function to apply the transform to a normalized vector
+    def vector(
+        self,
+        x: typing.Union[int, float],
+        y: typing.Union[int, float],
+        z: typing.Union[int, float]
+    ) -> typing.Tuple[float, float, float]:
+        """
+        Returns the transformed vector of *x*, *y* and *z*, as is
+        (normalized, neither rounded nor clamped)
+        """
+
+        (a, b, c), (d, e, f), (g, h, i) = self.matrix
+        u, v, w = self.offset
+
+        return (a*x + b*y + c*z + u, d*x + e*y + f*z + v, g*x + h*y + i*z + w)
+
+    # A function to apply the transform to an 8-bit RGB color
+    def color(self, red: int, green: int, blue: int) -> typing.Tuple[int, int, int]:
+        """
+        Returns the transformed RGB color of *red*, *green* and *blue*
+
+        NOTE: 0 ≤ red, green, blue ≤ 255, results are rounded and clamped
+        """
+
+        return tuple(
+            clamp(round(channel * 255), 0, 255)
+            for channel in self.vector(red / 255, green / 255, blue / 255)
+        )
+
+    # A function to precompute the fixed point tables of the transform
+    def _compile(self) -> typing.List[tuple]:
+        """
+        Returns one `(kind, data)` plan per output channel, where kind is
+        'copy' (data is the input channel), 'translate' (data is
+        `(input channel, 256 byte table)`), 'same' (data is an earlier
+        output channel computed identically), 'sum' (data is three
+        16.16 fixed point tables with the offset and rounding folded
+        into the first, and a clamping table indexed by their sum >> 16)
+        or 'pair' (data is `(input channel, input channel, 65536 entry
+        table)` for `_lut2`, when only two input channels matter)
+        """
+
+        plans = []
+        seen = {}
+
+        for channel, (row, offset) in enumerate(zip(self.matrix, self.offset)):
+            if (row, offset) in seen:
+                plans.append(('same', seen[(row, offset)]))
+                continue
+
+            seen[(row, offset)] = channel
+            used = [index for index, weight in enumerate(row) if weight]
+            bias = offset * 255
+
+            if used == [channel] and row[channel] == 1 and not offset:
+                plans.append(('copy', channel))
+
+            elif len(used) <= 1:
+                source = used[0] if used else 0
+                weight = row[source] if used else 0
+                plans.append(('translate', (source, bytes(
+                    clamp(round(weight * value + bias), 0, 255) for value in range(256)
+                ))))
+
+            else:
+                tables = [
+                    [round(weight * value * 65536) for value in range(256)]
+                    for weight in row
+                ]
+                low = sum(min(table) for table in tables) + round(bias * 65536) + 32768
+                high = sum(max(table) for table in tables) + round(bias * 65536) + 32768
+                low, high = low >> 16, high >> 16
+                shift = round(bias * 65536) + 32768 - (low << 16)
+                limit = bytes(clamp(value, 0, 255) for value in range(low, high + 1))
+                pair = [index for index, table in enumerate(tables) if any(table)]
+
+                if len(pair) == 2:
+                    first, second = (tables[index] for index in pair)
+                    plans.append(('pair', (*pair, [
+                        limit[(x + y + shift) >> 16] for x in first for y in second
+                    ])))
+
+                else:
+                    tables[0] = [value + shift for value in tables[0]]
+                    plans.append(('sum', (*tables, limit)))
+
+        return plans
+
+    # A function to apply the transform to a whole row (or image) in place
+    def __call__(
+        self, row: typing.Union[bytearray, memoryview], channels: int = 3
+    ) -> typing.Union[bytearray, memoryview]:
+        """
+        Transforms every pixel of an RGB (*channels* = 3) or RGBA
+        (*channels* = 4, alpha is kept as is) buffer in place with
+        precomputed fixed point tables, and returns it
+
+        This is a row function (see `Images.pixels`), but any buffer
+        of whole pixels works the same, an image at once included
+        """
+
+        view = memoryview(row).cast('B')
+        outputs = self.planes(*(view[channel::channels] for channel in range(3)))
+
+        for channel in range(3):
+            view[channel::channels] = outputs[channel]
+
+        return row
+
+    # A function to apply the transform to planes of channels
+    def planes(
+        self,
+        first: typing.Union[bytes, bytearray, memoryview],
+        second: typing.Union[bytes, bytearray, memoryview],
+        third: typing.Union[bytes, bytearray, memoryview],
+        wanted: typing.Sequence[int] = (0, 1, 2)
+    ) -> typing.List[bytes]:
+        """
+        Returns the *wanted* output channels (all three by default) of
+        the transform of three planes (equally long 8-bit buffers) of
+        the input channels, computed with precomputed fixed point tables
+        """
+
+        if self._tables is None:
+            self._tables = self._compile()
+
+        inputs = (first, second, third)
+        outputs = {}
+
+        def plane(channel: int) -> bytes:
+            if channel not in outputs:
+                kind, data = self._tables[channel]
+
+                if kind == 'copy':
+                    outputs[channel] = bytes(inputs[data])
+
+                elif kind == 'same':
+                    outputs[channel] = plane(data)
+
+                elif kind == 'translate':
+                    outputs[channel] = bytes(inputs[data[0]]).translate(data[1])
+
+                elif kind == 'pair':
+                    outputs[channel] = _lut2(data[2], inputs[data[0]], inputs[data[1]])
+
+                else:
+                    a, b, c, limit = data
+                    outputs[channel] = bytes([
+                        limit[(a[x] + b[y] + c[z]) >> 16]
+                        for x, y, z in zip(*inputs)
+                    ])
+
+            return outputs[channel]
+
+        return [plane(channel) for channel in wanted]
+
+    # A function to invert the transform
+    def inverse(self) -> 'Transform':
+        """
+        Returns the transform undoing this one
+
+        NOTE: Raises ZeroDivisionError if the matrix is not invertible
+        (like the one of `grayscale`)
+        """
+
+        (a, b, c), (d, e, f), (g, h, i) = self.matrix
+        determinant = a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+        if not determinant:
+            raise ZeroDivisionError('the transform is not invertible')
+
+        matrix = tuple(
+            tuple(value / determinant for value in row)
+            for row in (
+                (e * i - f * h, c * h - b * i, b * f - c * e),
+                (f * g - d * i, a * i - c * g, c * d - a * f),
+                (d * h - e * g, b * g - a * h, a * e - b * d)
+            )
+        )
+        offset = tuple(-sum(row[k] * self.offset[k] for k in range(3)) for row in matrix)
+
+        return Transform(matrix, offset)
+
+    # A function to make the identity transform
+    @staticmethod
+    def identity() -> 'Transform':
+        """
+        Returns the transform leaving colors as they are
+        """
+
+        return Transform()
+
+    # A function to make the RGB -> YIQ transform
+    @staticmethod
+    def rgb2yiq() -> 'Transform':
+        """
+        Returns the transform from normalized RGB to YIQ (see
+        `Converters.rgb2yiq`, without the clamping)
+        """
+
+        return Transform(_YIQ)
+
+    # A function to make the YIQ -> RGB transform
+    @staticmethod
+    def yiq2rgb() -> 'Transform':
+        """
+        Returns the transform from YIQ to normalized RGB (see
+        `Converters.yiq2rgb`, without the clamping)
+        """
+
+        return Transform(_YIQ_INVERSE)
+
+    # A function to make a gray (luma) transform
+    @staticmethod
+    def grayscale() -> 'Transform':
+        """
+        Returns the transform setting every channel to the luma
+        (the Y of YIQ) of the color
+        """
+
+        return Transform((Transform.LUMA,) * 3)
+
+    # A function to make a saturation transform
+    @staticmethod
+    def saturation(amount: typing.Union[int, float]) -> 'Transform':
+        """
+        Returns the transform scaling the saturation of colors by
+        *amount* around their luma (0 = gray, 1 = unchanged, > 1 = more
+        saturated, < 0 = complementary)
+        """
+
+        return Transform(tuple(
+            tuple(
+                (1 - amount) * weight + amount * (row == column)
+                for column, weight in enumerate(Transform.LUMA)
+            )
+            for row in range(3)
+        ))
+
+    # A function to make a color vision deficiency simulation transform
+    @staticmethod
+    def cvd(kind: str, severity: typing.Union[int, float] = 1) -> 'Transform':
+        """
+        Returns the transform simulating how colors look with a color
+        vision deficiency: *kind* is one of 'protanopia', 'deuteranopia'
+        and 'tritanopia' (see `Transform.CVD`), *severity* ranges from
+        0 (none) to 1 (full)
+
+        NOTE: The matrices are applied to the RGB values as they are
+        (without linearizing them first), which is the usual approximation
+        """
+
+        try:
+            matrix = Transform.CVD[kind]
+
+        except KeyError:
+            raise ValueError(f'Unknown color vision deficiency {kind!r}') from None
+
+        severity = clamp(severity, 0, 1)
+
+        return Transform(tuple(
+            tuple(
+                (1 - severity) * (row == column) + severity * weight
+                for column, weight in enumerate(weights)
+            )
+            for row, weights in enumerate(matrix)
+        ))
+
+    # A function to make a channel mixer transform
+    @staticmethod
+    def mixer(
+        red: typing.Sequence[typing.Union[int, float]] = (1, 0, 0),
+        green: typing.Sequence[typing.Union[int, float]] = (0, 1, 0),
+        blue: typing.Sequence[typing.Union[int, float]] = (0, 0, 1),
+        offset: typing.Sequence[typing.Union[int, float]] = (0, 0, 0)
+    ) -> 'Transform':
+        """
+        Returns the transform making every output channel out of the
+        weights of the input channels given for it, e.g.
+        `Transform.mixer(red=(0, 0, 1), blue=(1, 0, 0))` swaps red and blue
+
+        *offset* is added to the output channels (normalized, 1 = 255)
+        """
+
+        return Transform((red, green, blue), offset)
+
+
+class ColorArray:
+    """
+    A contiguous array of colors of one color space, stored flat (one
+    channel after another) in a bytearray for RGB and in an array of
+    doubles for every other color space
+    
+    Slices share the memory of the array they are taken from, and the
+    array exposes `__array_interface__` and its memory, so NumPy and
+    Pillow can use it without copying. Classes written in Python can
+    only implement the buffer protocol from Python 3.12 (PEP 688): on
+    older versions, `memoryview(colors)` and `bytes(colors)` raise
+    TypeError, use `colors.data` (a memoryview of the same memory)
+    instead, which works on every version.
+    
+    Usage:
+        colors = ColorArray.from_colors([(0, 120, 215), (29, 185, 84)])
+        hsv = colors.convert('hsv')
+        hsv[1:].convert('rgb', out=colors[1:])
+        numpy.asarray(colors)  # shape (2, 3), uint8
+        image = PIL.Image.frombuffer('RGB', (2, 1), colors.data)
+    """
+
+    # Number of channels of the built-in color spaces
+    CHANNELS = {'rgb': 3, 'hsv': 3, 'hsl': 3, 'yiq': 3, 'ycbcr': 3, 'cmyk': 4}
+
+    def __init__(
+        self,
+        buffer: typing.Any = None,
+        space: str = 'rgb',
+        channels: typing.Optional[int] = None
+    ) -> None:
+        """
+        Makes an array of *space* colors on top of *buffer* without
+        copying it (a bytearray, array or memoryview of bytes for RGB,
+        of doubles otherwise), or an empty array if None
+
+        Read-only buffers (like bytes) are copied, so that every array
+        can be converted to in place
+
+        *channels* is only needed for color spaces missing from
+        `ColorArray.CHANNELS`
+        """
+
+        if channels is None:
+            try:
+                channels = ColorArray.CHANNELS[space]
+
+            except KeyError:
+                raise ValueError(f'Unknown number of channels of {space!r}') from None
+
+        self.space = space
+        self.channels = channels
+        self.typecode = 'B' if space == 'rgb' else 'd'
+
+        if buffer is None:
+            buffer = bytearray() if self.typecode == 'B' else _array('d')
+
+        view = memoryview(buffer)
+
+        if view.readonly:
+            view = memoryview(bytearray(view.cast('B')))
+
+        if view.format != self.typecode:
+            view = view.cast('B').cast(self.typecode)
+
+        if view.ndim != 1 or len(view) % channels:
+            raise ValueError(f'expected a flat buffer of whole {space} colors')
+
+        self._view = view
+
+    # A function to make an array of a given length
+    @staticmethod
+    def zeros(count: int, space: str = 'rgb', channels: typing.Optional[int] = None) -> 'ColorArray':
+        """
+        Returns an array of *count* *space* colors with all channels at 0
+        """
+
+        colors = ColorArray(None, space, channels)
+        size = count * colors.channels
+
+        return ColorArray(
+            bytearray(size) if colors.typecode == 'B' else _array('d', bytes(8 * size)),
+            space, colors.channels
+        )
+
+    # A function to make an array out of colors
+    @staticmethod
+    def from_colors(
+        colors: typing.Iterable[typing.Sequence[typing.Union[int, float]]],
+        space: str = 'rgb',
+        channels: typing.Optional[int] = None
+    ) -> 'ColorArray':
+        """
+        Returns an array of the *space* colors *colors* (tuples), RGB
+        colors being also accepted as Hex values and packed integers
+        """
+
+        if space == 'rgb':
+            colors = [
+                Converters.hex2rgb(color) if isinstance(color, (str, int)) else color
+                for color in colors
+            ]
+
+            return ColorArray(bytearray(_chain.from_iterable(colors)), space, channels)
+
+        return ColorArray(_array('d', _chain.from_iterable(colors)), space, channels)
+
+    def __len__(self) -> int:
+        return len(self._view) // self.channels
+
+    def __repr__(self) -> str:
+        return f'<ColorArray of {len(self)} {self.space} colors>'
+
+    def __iter__(self) -> typing.Iterator[tuple]:
+        view, channels = self._view, self.channels
+
+        return zip(*(view[channel::channels] for channel in range(channels)))
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[tuple, 'ColorArray']:
+        """
+        Returns the color at *index* as a tuple, or a slice of the array
+        sharing its memory (slices with a step are copied)
+        """
+
+        channels = self.channels
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step == 1:
+                view = self._view[start * channels:max(start, stop) * channels]
+
+            else:
+                view = bytearray() if self.typecode == 'B' else _array('d')
+                view.extend(_chain.from_iterable(
+                    self._view[position * channels:(position + 1) * channels]
+                    for position in range(start, stop, step)
+                ))
+
+            return ColorArray(view, self.space, channels)
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('ColorArray index out of range')
+
+        return tuple(self._view[index * channels:(index + 1) * channels].tolist())
+
+    def __setitem__(
+        self,
+        index: typing.Union[int, slice],
+        value: typing.Union[typing.Sequence[typing.Union[int, float]], 'ColorArray']
+    ) -> None:
+        channels = self.channels
+
+        if isinstance(index, slice):
+            target = self[index]
+
+            if index.step not in (None, 1):
+                raise ValueError('cannot assign to a ColorArray slice with a step')
+
+            if isinstance(value, ColorArray):
+                value = value._view
+
+            else:
+                value = _array(self.typecode, _chain.from_iterable(value))
+
+            target._view[:] = value
+
+            return
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('ColorArray index out of range')
+
+        self._view[index * channels:(index + 1) * channels] = _array(self.typecode, value)
+
+    # The buffer protocol, only used by Python 3.12+ (see `data` before)
+    def __buffer__(self, flags: int) -> memoryview:
+        return self._view.__buffer__(flags)
+
+    # The flat (one channel after another) memoryview of the colors, the
+    # buffer of the array on every version of Python
+    @property
+    def data(self) -> memoryview:
+        return self._view
+
+    # The number of bytes taken by the colors
+    @property
+    def nbytes(self) -> int:
+        return self._view.nbytes
+
+    # The description of the memory of the array, for NumPy
+    @property
+    def __array_interface__(self) -> dict:
+        # Imported here so that only NumPy users pay for `ctypes`
+        import ctypes
+
+        view = self._view
+        address = ctypes.addressof((ctypes.c_char * view.nbytes).from_buffer(view))
+        order = '<' if _byteorder == 'little' else '>'
+
+        return {
+            'version': 3,
+            'shape': (len(self), self.channels),
+            'typestr': '|u1' if self.typecode == 'B' else order + 'f8',
+            'data': (address, False),
+        }
+
+    # A function to get the colors as tuples
+    def tolist(self) -> typing.List[tuple]:
+        """
+        Returns the colors of the array as a list of tuples
+        """
+
+        return list(self)
+
+    # A function to get the Hex values of RGB colors
+    def hex(self) -> typing.List[str]:
+        """
+        Returns the Hex values of the colors (see `Colors.rgb_many`)
+        """
+
+        if self.space != 'rgb':
+            return self.convert('rgb').hex()
+
+        return Colors.rgb_many(self._view.tobytes()) if len(self) else []
+
+    # A function to convert the array to another color space
+    def convert(self, space: str, out: typing.Optional['ColorArray'] = None) -> 'ColorArray':
+        """
+        Returns the colors of the array converted to *space* (through
+        `Converters.convert`), written to *out* if given (an array of
+        *space* colors as long as this one, which may be this very
+        array if both spaces have the same storage, for in place
+        conversions)
+
+        RGB colors are converted once per distinct color
+        """
+
+        if out is None:
+            out = ColorArray.zeros(len(self), space)
+
+        elif out.space != space or len(out) != len(self):
+            raise ValueError(f'expected an array of {len(self)} {space} colors')
+
+        if space == self.space:
+            out._view[:] = memoryview(self._view.tobytes()).cast(self.typecode)
+
+            return out
+
+        function = Converters._paths.get((self.space, space))
+
+        if function is None:
+            function = Converters.resolve(self.space, space)
+
+        if self.space == 'rgb':
+            packed = _pack_rgb(self._view)
+            converted = {
+                color: function((color >> 16, color >> 8 & 255, color & 255))
+                for color in set(packed)
+            }
+            results = map(converted.__getitem__, packed)
+
+        else:
+            results = map(function, iter(self))
+
+        values = _chain.from_iterable(results)
+
+        if out.typecode == 'B':
+            values = list(values)
+
+            try:
+                values = bytes(values)
+
+            except (TypeError, ValueError):
+                values = bytes(clamp(round(value), 0, 255) for value in values)
+
+        else:
+            values = _array('d', values)
+
+        out._view[:] = values
+
+        return out
+
+
+# A class of 3D color lookup tables (like the .cube files of color grading)
+class LUT3D:
+    """
+    A 3D lookup table: a *size*×*size*×*size* lattice of output RGB
+    colors (normalized, 0 to 1) over the input RGB cube, applied with
+    trilinear or tetrahedral interpolation
+    
+    Usage:
+        look = LUT3D.load('film.cube')
+        look.color(0, 120, 215)                   # (r, g, b), 8-bit
+        Images.recolor('in.png', 'out.png', look)
+        warmer = look.then(lambda r, g, b: (r * 1.1, g, b * 0.9))
+        Images.recolor('in.png', 'out.png', warmer.bake(6))
+    
+    Applying a LUT to rows interpolates every distinct color once, or,
+    once the LUT is baked (see `bake`), looks every pixel up in a dense
+    table without interpolating at all.
+    """
+
+    METHODS = ('tetrahedral', 'trilinear')
+
+    def __init__(
+        self,
+        size: int,
+        table: typing.Iterable[float],
+        domain_min: typing.Sequence[float] = (0, 0, 0),
+        domain_max: typing.Sequence[float] = (1, 1, 1),
+        title: str = '',
+        method: str = 'tetrahedral'
+    ) -> None:
+        """
+        Makes a LUT out of the *size*³ RGB outputs of *table* (flat, red
+        varying the fastest, then green, then blue, like in .cube files)
+        over the input domain [*domain_min*, *domain_max*]
+        """
+
+        if method not in LUT3D.METHODS:
+            raise ValueError(f'Unknown interpolation method {method!r}')
+
+        self.size = size
+        self.table = _array('d', table)
+        self.domain_min = tuple(domain_min)
+        self.domain_max = tuple(domain_max)
+        self.title = title
+        self.method = method
+        self._baked = None
+        self._bits = 0
+        self._indices = []
+        self._cache = {}
+
+        if size < 2 or len(self.table) != 3 * size ** 3:
+            raise ValueError(f'expected {size}³ RGB values for a LUT of size {size}')
+
+    def __repr__(self) -> str:
+        return f'<LUT3D {self.title!r} of size {self.size}>'
+
+    # A function to make a LUT leaving colors as they are
+    @staticmethod
+    def identity(size: int = 33) -> 'LUT3D':
+        """
+        Returns the LUT of size *size* mapping every color to itself
+        """
+
+        steps = [index / (size - 1) for index in range(size)]
+
+        return LUT3D(size, [
+            channel
+            for blue in steps for green in steps for red in steps
+            for channel in (red, green, blue)
+        ])
+
+    # A function to make a LUT out of a color function
+    @staticmethod
+    def from_function(
+        function: typing.Callable[[float, float, float], typing.Sequence[float]],
+        size: int = 33
+    ) -> 'LUT3D':
+        """
+        Returns the LUT of size *size* sampling *function(red, green,
+        blue) -> (red, green, blue)*, a function of 0 to 255 values
+        (like the ones of `Converters` and `Images.pixels`)
+        """
+
+        return LUT3D.identity(size).then(function)
+
+    # A function to parse the lines of a .cube file
+    @staticmethod
+    def parse(lines: typing.Iterable[str]) -> 'LUT3D':
+        """
+        Returns the LUT of the lines of a .cube file (only 3D LUTs)
+        """
+
+        size, title, table = 0, '', []
+        domain_min, domain_max = (0.0, 0.0, 0.0), (1.0, 1.0, 1.0)
+
+        for line in lines:
+            line = line.strip()
+
+            if not line or line.startswith('#'):
+                continue
+
+            if line[0].isalpha():
+                keyword, _, value = line.partition(' ')
+
+                if keyword == 'TITLE':
+                    title = value.strip().strip('"')
+
+                elif keyword == 'LUT_3D_SIZE':
+                    size = int(value)
+
+                elif keyword == 'DOMAIN_MIN':
+                    domain_min = tuple(map(float, value.split()))
+
+                elif keyword == 'DOMAIN_MAX':
+                    domain_max = tuple(map(float, value.split()))
+
+                elif keyword == 'LUT_1D_SIZE':
+                    raise ValueError('1D LUTs are not supported')
+
+                continue
+
+            table.extend(map(float, line.split()))
+
+        if not size:
+            raise ValueError('LUT_3D_SIZE is missing')
+
+        return LUT3D(size, table, domain_min, domain_max, title)
+
+    # A function to load a .cube file
+    @staticmethod
+    def load(file: typing.Union[str, typing.TextIO]) -> 'LUT3D':
+        """
+        Returns the LUT of the .cube file *file* (a path or a text file)
+        """
+
+        if hasattr(file, 'read'):
+            return LUT3D.parse(file)
+
+        with open(file, encoding='utf-8') as handle:
+            return LUT3D.parse(handle)
+
+    # A function to write the LUT as a .cube file
+    def to_cube(self) -> str:
+        """
+        Returns the LUT as the text of a .cube file
+        """
+
+        lines = [f'TITLE "{self.title}"'] if self.title else []
+        lines.append(f'LUT_3D_SIZE {self.size}')
+
+        if self.domain_min != (0, 0, 0) or self.domain_max != (1, 1, 1):
+            lines.append('DOMAIN_MIN ' + ' '.join(map(repr, map(float, self.domain_min))))
+            lines.append('DOMAIN_MAX ' + ' '.join(map(repr, map(float, self.domain_max))))
+
+        table = self.table
+        lines.extend(
+            f'{table[index]:.6f} {table[index + 1]:.6f} {table[index + 2]:.6f}'
+            for index in range(0, len(table), 3)
+        )
+
+        return '\n'.join(lines) + '\n'
+
+    # A function to look a normalized color up
+    def sample(
+        self, red: float, green: float, blue: float
+    ) -> typing.Tuple[float, float, float]:
+        """
+        Returns the (normalized) output of the LUT for the input color
+        *red*, *green* and *blue* (in the domain of the LUT, 0 to 1
+        by default), interpolated with the method of the LUT
+        """
+
+        last = self.size - 1
+        (lr, lg, lb), (hr, hg, hb) = self.domain_min, self.domain_max
+
+        return self._interpolate(
+            (red - lr) / (hr - lr) * last,
+            (green - lg) / (hg - lg) * last,
+            (blue - lb) / (hb - lb) * last
+        )
+
+    # A function to interpolate the LUT at a position of its lattice
+    def _interpolate(
+        self, red: float, green: float, blue: float
+    ) -> typing.Tuple[float, float, float]:
+        """
+        Returns the output of the LUT at the lattice position *red*,
+        *green* and *blue* (0 to size - 1, clamped)
+        """
+
+        size, table = self.size, self.table
+        last = size - 1
+        red = 0.0 if red < 0 else last if red > last else red
+        green = 0.0 if green < 0 else last if green > last else green
+        blue = 0.0 if blue < 0 else last if blue > last else blue
+        r = int(red) if red < last else last - 1
+        g = int(green) if green < last else last - 1
+        b = int(blue) if blue < last else last - 1
+        fr, fg, fb = red - r, green - g, blue - b
+        sr, sg, sb = 3, 3 * size, 3 * size * size
+        i000 = sr * r + sg * g + sb * b
+        i111 = i000 + sr + sg + sb
+
+        if self.method == 'trilinear':
+            corners = [
+                i000, i000 + sr, i000 + sg, i000 + sr + sg,
+                i000 + sb, i000 + sr + sb, i000 + sg + sb, i111
+            ]
+            weights = [
+                (1 - fr) * (1 - fg) * (1 - fb), fr * (1 - fg) * (1 - fb),
+                (1 - fr) * fg * (1 - fb), fr * fg * (1 - fb),
+                (1 - fr) * (1 - fg) * fb, fr * (1 - fg) * fb,
+                (1 - fr) * fg * fb, fr * fg * fb
+            ]
+
+        else:
+            # Tetrahedral: walk from the (0, 0, 0) corner to the (1, 1, 1)
+            # corner of the cell along its axes, by decreasing fractions
+            if fr >= fg >= fb:
+                first, second, t1, t2, t3 = sr, sr + sg, fr, fg, fb
+
+            elif fr >= fb >= fg:
+                first, second, t1, t2, t3 = sr, sr + sb, fr, fb, fg
+
+            elif fb >= fr >= fg:
+                first, second, t1, t2, t3 = sb, sr + sb, fb, fr, fg
+
+            elif fg >= fr >= fb:
+                first, second, t1, t2, t3 = sg, sr + sg, fg, fr, fb
+
+            elif fg >= fb >= fr:
+                first, second, t1, t2, t3 = sg, sg + sb, fg, fb, fr
+
+            else:
+                first, second, t1, t2, t3 = sb, sg + sb, fb, fg, fr
+
+            corners = [i000, i000 + first, i000 + second, i111]
+            weights = [1 - t1, t1 - t2, t2 - t3, t3]
+
+        red = green = blue = 0.0
+
+        for index, weight in zip(corners, weights):
+            red += weight * table[index]
+            green += weight * table[index + 1]
+            blue += weight * table[index + 2]
+
+        return (red, green, blue)
+
+    # A function to apply the LUT to an 8-bit RGB color
+    def color(self, red: int, green: int, blue: int) -> typing.Tuple[int, int, int]:
+        """
+        Returns the output of the LUT for an 8-bit RGB color, as an
+        8-bit RGB color (the domain of the LUT being mapped to 0 to 255)
+        """
+
+        scale = (self.size - 1) / 255
+        red, green, blue = self._interpolate(red * scale, green * scale, blue * scale)
+        red, green, blue = round(red * 255), round(green * 255), round(blue * 255)
+
+        return (
+            0 if red < 0 else 255 if red > 255 else red,
+            0 if green < 0 else 255 if green > 255 else green,
+            0 if blue < 0 else 255 if blue > 255 else blue
+        )
+
+    # A function to compose the LUT with an adjustment
+    def then(
+        self,
+        adjustment: typing.Union['LUT3D', typing.Callable[[float, float, float], typing.Sequence[float]]]
+    ) -> 'LUT3D':
+        """
+        Returns a LUT (of the same size and domain) applying this LUT,
+        then *adjustment*: another LUT (over the 0 to 1 domain), or a
+        function of 0 to 255 RGB values returning 0 to 255 RGB values
+        (like `Converters` functions, or `Transform.color`)
+        """
+
+        table = self.table
+        outputs = []
+
+        for index in range(0, len(table), 3):
+            red, green, blue = table[index], table[index + 1], table[index + 2]
+
+            if isinstance(adjustment, LUT3D):
+                outputs.extend(adjustment.sample(red, green, blue))
+
+            else:
+                outputs.extend(
+                    value / 255 for value in adjustment(red * 255, green * 255, blue * 255)[:3]
+                )
+
+        return LUT3D(
+            self.size, outputs, self.domain_min, self.domain_max, self.title, self.method
+        )
+
+    # A function to precompute the LUT for every (quantized) 8-bit color
+    def bake(self, bits: int = 6) -> 'LUT3D':
+        """
+        Returns a copy of the LUT precomputing the output of every 8-bit
+        color, keeping only the *bits* high bits of every input channel
+        (2 ** (3 * bits) colors are interpolated: 262,144 for 6 bits,
+        all 16,777,216 for 8 bits, which takes minutes)
+
+        A baked LUT applies to rows with no interpolation at all: the
+        channels are quantized with `bytes.translate` straight into the
+        bytes of the dense index (r << 2 * bits | g << bits | b) of every
+        pixel, and looked up in a flat table with `map`
+        """
+
+        if not 1 <= bits <= 8:
+            raise ValueError(f'invalid number of bits {bits!r}')
+
+        shift = 8 - bits
+        levels = range(1 << bits)
+        centers = [level << shift | (1 << shift >> 1) for level in levels]
+        table = _array('I', bytes(4 << 3 * bits))
+        index = 0
+
+        for red in levels:
+            for green in levels:
+                for blue in levels:
+                    r, g, b = self.color(centers[red], centers[green], centers[blue])
+                    table[index] = r << 16 | g << 8 | b
+                    index += 1
+
+        baked = LUT3D(
+            self.size, self.table, self.domain_min, self.domain_max,
+            self.title, self.method
+        )
+        baked._baked = table
+        baked._bits = bits
+        # The part of the index every channel value lands in, byte by byte
+        # (low byte first), as tables of `bytes.translate`
+        baked._indices = [
+            [
+                bytes(value >> shift << position >> 8 * byte & 255 for value in range(256))
+                for byte in range(3)
+            ]
+            for position in (2 * bits, bits, 0)
+        ]
+
+        return baked
+
+    # A function to apply the LUT to a whole row (or image) in place
+    def __call__(self, row: bytearray, channels: int = 3) -> bytearray:
+        """
+        Recolors every pixel of an RGB (*channels* = 3) or RGBA row (or
+        any buffer of whole pixels) through the LUT in place, and
+        returns it, so a LUT is a row function of `Images.recolor`
+
+        Unless the LUT is baked, every distinct color is interpolated
+        once, the results being cached (up to 65536 colors) across rows
+        """
+
+        view = memoryview(row).cast('B')
+
+        if self._baked is not None:
+            count = len(view) // channels
+            indices = _array('I', bytes(4 * count))
+            view_indices = memoryview(indices).cast('B')
+            planes = [bytes(view[channel:channels * count:channels]) for channel in range(3)]
+
+            for byte in range(3):
+                # The channels' bits don't overlap, so OR the bytes as integers
+                merged = 0
+
+                for plane, tables in zip(planes, self._indices):
+                    if any(tables[byte]):
+                        merged |= int.from_bytes(plane.translate(tables[byte]), 'little')
+
+                offset = byte if _byteorder == 'little' else 3 - byte
+                view_indices[offset::4] = merged.to_bytes(count, 'little')
+
+            rgb = _unpack_rgb(_array('I', map(self._baked.__getitem__, indices)))
+
+        else:
+            cache = self._cache
+            packed = _pack_rgb(view, channels)
+
+            if len(cache) > 1 << 16:
+                cache.clear()
+
+            for color in set(packed).difference(cache):
+                red, green, blue = self.color(color >> 16, color >> 8 & 255, color & 255)
+                cache[color] = red << 16 | green << 8 | blue
+
+            rgb = _unpack_rgb(_array('I', map(cache.__getitem__, packed)))
+
+        for channel in range(3):
+            view[channel::channels] = rgb[channel::3]
+
+        return row
+
+
+# A class to convert RGB frames to and from planar YCbCr (I420 and NV12)
+class YCbCr:
+    """
+    A YCbCr (BT.601 or BT.709, full or limited range) converter of
+    whole frames between interleaved RGB and the planar 4:2:0 layouts
+    used by video: I420 (a Y plane, then a Cb and a Cr plane at half
+    the width and half the height) and NV12 (a Y plane, then one plane
+    of interleaved Cb and Cr)
+    
+    Usage:
+        video = YCbCr(709)
+        frame = video.to_i420(rgb, 1280, 720)
+        rgb = video.from_i420(frame, 1280, 720)
+        Converters.convert((0, 120, 215), 'rgb', 'ycbcr')  # one color
+    
+    Every plane is computed with the 16.16 fixed point tables of a
+    `Transform`, the chroma from 2×2 averages of the RGB frame and
+    upsampled back by duplication (nearest neighbour).
+    """
+
+    def __init__(self, standard: int = 601, full: bool = False) -> None:
+        """
+        Makes a converter of the BT.*standard* (601 or 709) YCbCr, in
+        limited (video, by default) or *full* (JPEG) range
+        """
+
+        self.standard = standard
+        self.full = full
+        self.forward, self.backward = _ycbcr(standard, full)
+
+    def __repr__(self) -> str:
+        return f'YCbCr({self.standard!r}, full={self.full!r})'
+
+    # A function to check the dimensions of a frame
+    @staticmethod
+    def _check(length: int, width: int, height: int, size: int) -> None:
+        """
+        Returns nothing, raises ValueError if the dimensions are odd or
+        don't match the *length* of a frame of *size* bytes per pixel
+        """
+
+        if width <= 0 or height <= 0 or width % 2 or height % 2:
+            raise ValueError(f'expected an even width and height, got {width}×{height}')
+
+        if length != width * height * size:
+            raise ValueError(
+                f'expected {width * height * size} bytes for {width}×{height}, got {length}'
+            )
+
+    # A function to halve a plane in both dimensions
+    @staticmethod
+    def _subsample(plane: bytes, width: int, height: int) -> bytes:
+        """
+        Returns the plane of the (rounded) averages of every 2×2 block
+        of *plane*, with `_lut2` over its even and odd rows, then columns
+        """
+
+        rows = memoryview(plane).cast('B', (height, width))
+        plane = _lut2(_table('average'), rows[0::2].tobytes(), rows[1::2].tobytes())
+
+        return _lut2(_table('average_up'), plane[0::2], plane[1::2])
+
+    # A function to double a plane in both dimensions
+    @staticmethod
+    def _upsample(plane: bytes, width: int, height: int) -> bytes:
+        """
+        Returns the *width*×*height* plane of the quarter size *plane*,
+        every value duplicated into a 2×2 block
+        """
+
+        wide = bytearray(2 * len(plane))
+        wide[0::2] = plane
+        wide[1::2] = plane
+
+        return b''.join(
+            bytes(wide[start:start + width]) * 2 for start in range(0, len(wide), width)
+        )
+
+    # A function to convert an RGB frame to planes
+    def planes(
+        self,
+        frame: typing.Union[bytes, bytearray, memoryview],
+        width: int,
+        height: int,
+        channels: int = 3
+    ) -> typing.Tuple[bytes, bytes, bytes]:
+        """
+        Returns the Y plane and the 4:2:0 subsampled Cb and Cr planes of
+        an RGB (*channels* = 3) or RGBA (*channels* = 4, alpha is
+        ignored) *frame* of *width*×*height* pixels
+
+        NOTE: The width and height must be even
+        """
+
+        view = memoryview(frame).cast('B')
+        YCbCr._check(len(view), width, height, channels)
+
+        rgb = [bytes(view[channel::channels]) for channel in range(3)]
+        (y,) = self.forward.planes(*rgb, wanted=(0,))
+        small = [YCbCr._subsample(plane, width, height) for plane in rgb]
+
+        return (y, *self.forward.planes(*small, wanted=(1, 2)))
+
+    # A function to convert an RGB frame to I420
+    def to_i420(
+        self,
+        frame: typing.Union[bytes, bytearray, memoryview],
+        width: int,
+        height: int,
+        channels: int = 3
+    ) -> bytes:
+        """
+        Returns the I420 frame (the Y, Cb and Cr planes one after the
+        other) of an RGB or RGBA *frame* (see `planes`)
+        """
+
+        return b''.join(self.planes(frame, width, height, channels))
+
+    # A function to convert an RGB frame to NV12
+    def to_nv12(
+        self,
+        frame: typing.Union[bytes, bytearray, memoryview],
+        width: int,
+        height: int,
+        channels: int = 3
+    ) -> bytes:
+        """
+        Returns the NV12 frame (the Y plane, then Cb and Cr interleaved)
+        of an RGB or RGBA *frame* (see `planes`)
+        """
+
+        y, cb, cr = self.planes(frame, width, height, channels)
+        chroma = bytearray(2 * len(cb))
+        chroma[0::2] = cb
+        chroma[1::2] = cr
+
+        return y + chroma
+
+    # A function to convert planes to an RGB frame
+    def from_planes(
+        self,
+        y: typing.Union[bytes, bytearray, memoryview],
+        cb: typing.Union[bytes, bytearray, memoryview],
+        cr: typing.Union[bytes, bytearray, memoryview],
+        width: int,
+        height: int,
+        channels: int = 3
+    ) -> bytearray:
+        """
+        Returns the RGB (*channels* = 3) or RGBA (*channels* = 4, opaque)
+        frame of a Y plane and 4:2:0 subsampled Cb and Cr planes of
+        *width*×*height* pixels
+        """
+
+        YCbCr._check(len(y), width, height, 1)
+
+        if len(cb) != len(y) // 4 or len(cr) != len(y) // 4:
+            raise ValueError(f'expected chroma planes of {len(y) // 4} bytes')
+
+        outputs = self.backward.planes(
+            y,
+            YCbCr._upsample(cb, width, height),
+            YCbCr._upsample(cr, width, height)
+        )
+
+        frame = bytearray(b'\xff' * (width * height * channels))
+
+        for channel in range(3):
+            frame[channel::channels] = outputs[channel]
+
+        return frame
+
+    # A function to convert an I420 frame to an RGB frame
+    def from_i420(
+        self,
+        frame: typing.Union[bytes, bytearray, memoryview],
+        width: int,
+        height: int,
+        channels: int = 3
+    ) -> bytearray:
+        """
+        Returns the RGB or RGBA frame (see `from_planes`) of an I420
+        *frame* of *width*×*height* pixels
+        """
+
+        view = memoryview(frame).cast('B')
+        size = width * height
+        YCbCr._check(len(view), width, height, 1.5)
+
+        return self.from_planes(
+            view[:size], view[size:size * 5 // 4], view[size * 5 // 4:],
+            width, height, channels
+        )
+
+    # A function to convert an NV12 frame to an RGB frame
+    def from_nv12(
+        self,
+        frame: typing.Union[bytes, bytearray, memoryview],
+        width: int,
+        height: int,
+        channels: int = 3
+    ) -> bytearray:
+        """
+        Returns the RGB or RGBA frame (see `from_planes`) of an NV12
+        *frame* of *width*×*height* pixels
+        """
+
+        view = memoryview(frame).cast('B')
+        size = width * height
+        YCbCr._check(len(view), width, height, 1.5)
+
+        return self.from_planes(
+            view[:size], view[size::2], view[size + 1::2], width, height, channels
+        )
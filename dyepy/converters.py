@@ -0,0 +1,1719 @@
+"""
+Conversions between color spaces, the CSS4 colors and packed colors
+
+`Colors` and `Converters` (with the quantized lookup tables of
+`Converters.enable_lut`), and the helpers that pack colors to 0xRRGGBB
+"""
+
+
+# Import `typing` for type-hinting
+import typing
+
+# Import `randint` and `Random` from `random` as `_randint` and `_Random`
+from random import randint as _randint, Random as _Random
+
+# Import `array` from `array` as `_array`
+from array import array as _array
+
+# Import `byteorder` from `sys` as `_byteorder`
+from sys import byteorder as _byteorder
+
+# Import `getpid` and `replace` from `os` as `_getpid` and `_replace`
+from os import getpid as _getpid, replace as _replace
+
+# Import `mmap` as `_mmap` (to share lookup tables between processes)
+import mmap as _mmap
+
+from . import clamp
+
+if typing.TYPE_CHECKING:
+    from .arrays import Transform
+
+
+# Two-character Hex codes of every 8-bit channel value, keyed by the value
+# (a dict instead of a list so that negative values don't index from the end)
+_HEX = {value: f'{value:02x}' for value in range(256)}
+
+# The RGB -> YIQ matrix (rows Y, I and Q) and its inverse, shared by
+# `Converters.rgb2yiq`, `Converters.yiq2rgb` and `Transform`
+_YIQ = (
+    (0.299, 0.587, 0.114),
+    (0.596, -0.274, -0.322),
+    (0.211, -0.523, 0.312)
+)
+_YIQ_INVERSE = (
+    (1, 0.956, 0.621),
+    (1, -0.272, -0.647),
+    (1, -1.11, 1.7)
+)
+
+# The luma weights (Kr, Kb) of the YCbCr standards, keyed by the ITU-R
+# BT recommendation (Kg = 1 - Kr - Kb)
+_YCBCR = {601: (0.299, 0.114), 709: (0.2126, 0.0722)}
+
+
+# The (forward, inverse) `Transform`s of every YCbCr variant, keyed by
+# (standard, full), built the first time they are used
+_YCBCR_TRANSFORMS = {}
+
+
+def _ycbcr(standard: int, full: bool) -> typing.Tuple['Transform', 'Transform']:
+    """
+    Returns the transforms from normalized RGB to normalized YCbCr of
+    the BT.*standard* (601 or 709), in full (0 to 255) or limited (16
+    to 235, 16 to 240 for the chroma) range, and back
+    """
+
+    transforms = _YCBCR_TRANSFORMS.get((standard, full))
+
+    if transforms is not None:
+        return transforms
+
+    if standard not in _YCBCR:
+        raise ValueError(f'unknown YCbCr standard {standard!r}, expected 601 or 709')
+
+    # Imported here, as `dyepy.arrays` itself depends on this module
+    from .arrays import Transform
+
+    kr, kb = _YCBCR[standard]
+    kg = 1 - kr - kb
+    luma, chroma, low = (1, 1, 0) if full else (219 / 255, 224 / 255, 16 / 255)
+    cb = chroma / (2 * (1 - kb))
+    cr = chroma / (2 * (1 - kr))
+
+    forward = Transform(
+        (
+            (luma * kr, luma * kg, luma * kb),
+            (-cb * kr, -cb * kg, cb * (1 - kb)),
+            (cr * (1 - kr), -cr * kg, -cr * kb)
+        ),
+        (low, 128 / 255, 128 / 255)
+    )
+    transforms = _YCBCR_TRANSFORMS[(standard, full)] = (forward, forward.inverse())
+
+    return transforms
+
+
+# The packed colors of the 256 xterm colors (see `Styles.Fg.n`): the 16
+# system colors (xterm defaults), the 6×6×6 color cube and the 24 grays
+_XTERM = _array('I', [
+    0x000000, 0xcd0000, 0x00cd00, 0xcdcd00, 0x0000ee, 0xcd00cd, 0x00cdcd, 0xe5e5e5,
+    0x7f7f7f, 0xff0000, 0x00ff00, 0xffff00, 0x5c5cff, 0xff00ff, 0x00ffff, 0xffffff
+])
+_XTERM.extend(
+    red << 16 | green << 8 | blue
+    for red in (0, 95, 135, 175, 215, 255)
+    for green in (0, 95, 135, 175, 215, 255)
+    for blue in (0, 95, 135, 175, 215, 255)
+)
+_XTERM.extend(gray * 0x010101 for gray in range(8, 248, 10))
+
+
+def _pack_rgb(
+    buffer: typing.Union[bytes, bytearray, memoryview],
+    channels: int = 3
+) -> _array:
+    """
+    Returns an `array('I')` of packed 24-bit colors (0xRRGGBB) from a
+    buffer of interleaved 8-bit RGB values (RGBA if *channels* is 4,
+    the alpha channel is left out)
+
+    The channels are scattered into the native byte order with strided
+    slice assignments, so no Python code runs per color
+    """
+
+    buffer = memoryview(buffer).cast('B')
+    count = len(buffer) // channels
+
+    packed = _array('I', bytes(4 * count))
+    view = memoryview(packed).cast('B')
+    end = channels * count
+    red = buffer[0:end:channels]
+    green = buffer[1:end:channels]
+    blue = buffer[2:end:channels]
+
+    if _byteorder == 'little':
+        view[0::4], view[1::4], view[2::4] = blue, green, red
+
+    else:
+        view[3::4], view[2::4], view[1::4] = blue, green, red
+
+    return packed
+
+
+def _unpack_rgb(packed: typing.Iterable[int]) -> bytearray:
+    """
+    Returns a buffer of interleaved 8-bit RGB values from packed
+    24-bit colors (the inverse of `_pack_rgb`)
+    """
+
+    if not isinstance(packed, _array) or packed.typecode != 'I':
+        packed = _array('I', packed)
+
+    view = memoryview(packed).cast('B')
+    buffer = bytearray(3 * len(packed))
+
+    if _byteorder == 'little':
+        buffer[0::3], buffer[1::3], buffer[2::3] = view[2::4], view[1::4], view[0::4]
+
+    else:
+        buffer[0::3], buffer[1::3], buffer[2::3] = view[1::4], view[2::4], view[3::4]
+
+    return buffer
+
+
+# A class to use pre-defined colors from CSS4 and get HEX values
+class Colors:
+    """
+    Colors class
+
+    A class of named Hex color codes as constants
+    (that can be used simply by referencing them), and
+    static methods to convert ABC colorspaces to Hex
+    
+    These names and values have been inherited from CSS4,
+    and there are some extra built-in colors like the
+    Windows Default Blue color and the Spotify Green color.
+    
+    This class is completely different from the class
+    `Styles` (which can be used for font-styling and coloring)
+    """
+
+    ALICEBLUE = '#f0f8ff'
+    ANTIQUEWHITE = '#faebd7'
+    AQUA = '#00ffff'
+    AQUAMARINE = '#7fffd4'
+    AZURE = '#f0ffff'
+    BEIGE = '#f5f5dc'
+    BISQUE = '#ffe4c4'
+    BLACK = '#000000'
+    BLANCHEDALMOND = '#ffebcd'
+    BLUE = '#0000ff'
+    BLUEVIOLET = '#8a2be2'
+    BROWN = '#a52a2a'
+    BURLYWOOD = '#deb887'
+    CADETBLUE = '#5f9ea0'
+    CHARTREUSE = '#7fff00'
+    CHOCOLATE = '#d2691e'
+    CORAL = '#ff7f50'
+    CORNFLOWERBLUE = '#6495ed'
+    CORNSILK = '#fff8dc'
+    CRIMSON = '#dc143c'
+    CYAN = '#00ffff'
+    DARKBLUE = '#00008b'
+    DARKCYAN = '#008b8b'
+    DARKGOLDENROD = '#b8860b'
+    DARKGRAY = '#a9a9a9'
+    DARKGREEN = '#006400'
+    DARKKHAKI = '#bdb76b'
+    DARKMAGENTA = '#8b008b'
+    DARKOLIVEGREEN = '#556b2f'
+    DARKORANGE = '#ff8c00'
+    DARKORCHID = '#9932cc'
+    DARKRED = '#8b0000'
+    DARKSALMON = '#e9967a'
+    DARKSEAGREEN = '#8fbc8f'
+    DARKSLATEBLUE = '#483d8b'
+    DARKSLATEGRAY = '#2f4f4f'
+    DARKTURQUOISE = '#00ced1'
+    DARKVIOLET = '#9400d3'
+    DEEPPINK = '#ff1493'
+    DEEPSKYBLUE = '#00bfff'
+    DIMGRAY = '#696969'
+    DODGERBLUE = '#1e90ff'
+    FIREBRICK = '#b22222'
+    FLORALWHITE = '#fffaf0'
+    FORESTGREEN = '#228b22'
+    FUCHSIA = '#ff00ff'
+    GAINSBORO = '#dcdcdc'
+    GHOSTWHITE = '#f8f8ff'
+    GOLD = '#ffd700'
+    GOLDENROD = '#daa520'
+    GRAY = '#808080'
+    GREEN = '#008000'
+    GREENYELLOW = '#adff2f'
+    HONEYDEW = '#f0fff0'
+    HOTPINK = '#ff69b4'
+    INDIANRED = '#cd5c5c'
+    INDIGO = '#4b0082'
+    IVORY = '#fffff0'
+    KHAKI = '#f0e68c'
+    LAVENDER = '#e6e6fa'
+    LAVENDERBLUSH = '#fff0f5'
+    LAWNGREEN = '#7cfc00'
+    LEMONCHIFFON = '#fffacd'
+    LIGHTBLUE = '#add8e6'
+    LIGHTCORAL = '#f08080'
+    LIGHTCYAN = '#e0ffff'
+    LIGHTGOLDENRODYELLOW = '#fafad2'
+    LIGHTGREEN = '#90ee90'
+    LIGHTGREY = '#d3d3d3'
+    LIGHTPINK = '#ffb6c1'
+    LIGHTSALMON = '#ffa07a'
+    LIGHTSEAGREEN = '#20b2aa'
+    LIGHTSKYBLUE = '#87cefa'
+    LIGHTSLATEGRAY = '#778899'
+    LIGHTSTEELBLUE = '#b0c4de'
+    LIGHTYELLOW = '#ffffe0'
+    LIME = '#00ff00'
+    LIMEGREEN = '#32cd32'
+    LINEN = '#faf0e6'
+    MAGENTA = '#ff00ff'
+    MAROON = '#800000'
+    MEDIUMAQUAMARINE = '#66cdaa'
+    MEDIUMBLUE = '#0000cd'
+    MEDIUMORCHID = '#ba55d3'
+    MEDIUMPURPLE = '#9370d8'
+    MEDIUMSEAGREEN = '#3cb371'
+    MEDIUMSLATEBLUE = '#7b68ee'
+    MEDIUMSPRINGGREEN = '#00fa9a'
+    MEDIUMTURQUOISE = '#48d1cc'
+    MEDIUMVIOLETRED = '#c71585'
+    MIDNIGHTBLUE = '#191970'
+    MINTCREAM = '#f5fffa'
+    MISTYROSE = '#ffe4e1'
+    MOCCASIN = '#ffe4b5'
+    NAVAJOWHITE = '#ffdead'
+    NAVY = '#000080'
+    OLDLACE = '#fdf5e6'
+    OLIVE = '#808000'
+    OLIVEDRAB = '#6b8e23'
+    ORANGE = '#ffa500'
+    ORANGERED = '#ff4500'
+    ORCHID = '#da70d6'
+    PALEGOLDENROD = '#eee8aa'
+    PALEGREEN = '#98fb98'
+    PALETURQUOISE = '#afeeee'
+    PALEVIOLETRED = '#d87093'
+    PAPAYAWHIP = '#ffefd5'
+    PEACHPUFF = '#ffdab9'
+    PERU = '#cd853f'
+    PINK = '#ffc0cb'
+    PLUM = '#dda0dd'
+    POWDERBLUE = '#b0e0e6'
+    PURPLE = '#800080'
+    REBECCAPURPLE = '#663399'
+    RED = '#ff0000'
+    ROSYBROWN = '#bc8f8f'
+    ROYALBLUE = '#4169e1'
+    SADDLEBROWN = '#8b4513'
+    SALMON = '#fa8072'
+    SANDYBROWN = '#f4a460'
+    SEAGREEN = '#2e8b57'
+    SEASHELL = '#fff5ee'
+    SIENNA = '#a0522d'
+    SILVER = '#c0c0c0'
+    SKYBLUE = '#87ceeb'
+    SLATEBLUE = '#6a5acd'
+    SLATEGRAY = '#708090'
+    SNOW = '#fffafa'
+    SPOTIFYGREEN = '#1db954'
+    SPRINGGREEN = '#00ff7f'
+    STEELBLUE = '#4682b4'
+    TAN = '#d2b48c'
+    TEAL = '#008080'
+    THISTLE = '#d8bfd8'
+    TOMATO = '#ff6347'
+    TURQUOISE = '#40e0d0'
+    VIOLET = '#ee82ee'
+    WHEAT = '#f5deb3'
+    WHITE = '#ffffff'
+    WHITESMOKE = '#f5f5f5'
+    WINDOWSBLUE = '#0078d7'
+    YELLOW = '#ffff00'
+    YELLOWGREEN = '#9acd32'
+
+    # A function to convert RGB values to Hex values
+    @staticmethod
+    def rgb(
+        red: typing.Union[int, float] = 0,
+        green: typing.Union[int, float] = 0,
+        blue: typing.Union[int, float] = 0
+    ) -> str:
+        """
+        Returns the Hex value from an RGB value for many modules use
+        Hex values as their default or accepted color code values
+        
+        NOTE: 0 ≤ red, green, blue ≤ 255
+        
+        Can also be used as a RGB-to-Hex converter
+        """
+
+        # Fast path for 8-bit channels (including floats like 255.0)
+        if red in _HEX and green in _HEX and blue in _HEX:
+            return f'#{_HEX[red]}{_HEX[green]}{_HEX[blue]}'
+
+        return (
+            f'#{clamp(round(red), 0, 255):02x}'
+            f'{clamp(round(green), 0, 255):02x}'
+            f'{clamp(round(blue), 0, 255):02x}'
+        )
+
+    # A function to convert many RGB values to Hex values at once
+    @staticmethod
+    def rgb_many(
+        colors: typing.Union[typing.Iterable, bytes, bytearray, memoryview],
+        sep: typing.Optional[str] = None,
+        as_bytes: bool = False
+    ) -> typing.Union[typing.List[str], str, bytes]:
+        """
+        Returns the Hex values of all the *colors*, either as a list or,
+        if *sep* is given, as a single string joined with *sep*
+        (encoded to ASCII bytes when *as_bytes* is True)
+
+        *colors* can be an iterable of (red, green, blue) tuples, an
+        iterable of packed 24-bit integers (0xRRGGBB) or a bytes-like
+        buffer of interleaved 8-bit RGB values (the fastest)
+
+        E.g.:
+        Colors.rgb_many([(0, 120, 215), (29, 185, 84)]) -> ['#0078d7', '#1db954']
+        Colors.rgb_many([0x0078d7, 0x1db954], ',') -> '#0078d7,#1db954'
+        Colors.rgb_many(b'\\x00\\x78\\xd7', ',', True) -> b'#0078d7'
+        """
+
+        if isinstance(colors, (bytes, bytearray, memoryview)):
+            codes = Colors._rgb_buffer(colors)
+
+        else:
+            if not isinstance(colors, (list, tuple)):
+                colors = list(colors)
+
+            if colors and isinstance(colors[0], int):
+                try:
+                    codes = [
+                        f'#{_HEX[v >> 16]}{_HEX[v >> 8 & 255]}{_HEX[v & 255]}'
+                        for v in colors
+                    ]
+
+                except KeyError:
+                    raise ValueError(
+                        'Packed colors must lie between 0x000000 and 0xffffff'
+                    ) from None
+
+            else:
+                try:
+                    codes = [
+                        f'#{_HEX[red]}{_HEX[green]}{_HEX[blue]}'
+                        for red, green, blue in colors
+                    ]
+
+                except KeyError:
+                    codes = [Colors.rgb(*color) for color in colors]
+
+        if sep is None:
+            return codes
+
+        joined = sep.join(codes)
+
+        return joined.encode('ascii') if as_bytes else joined
+
+    # A function to convert a buffer of interleaved RGB values to Hex values
+    @staticmethod
+    def _rgb_buffer(
+        buffer: typing.Union[bytes, bytearray, memoryview]
+    ) -> typing.List[str]:
+        """
+        Returns the Hex values of a buffer of interleaved 8-bit RGB values,
+        encoding the whole buffer with a single `bytes.hex` call
+        """
+
+        buffer = memoryview(buffer).cast('B')
+
+        if len(buffer) % 3:
+            raise ValueError('RGB buffers must hold 3 bytes per color')
+
+        if not buffer:
+            return []
+
+        try:
+            return ('#' + buffer.hex(' ', 3).replace(' ', ' #')).split(' ')
+
+        except TypeError:   # `sep` was added to `hex` in Python 3.8
+            text = buffer.hex()
+
+            return ['#' + text[i:i + 6] for i in range(0, len(text), 6)]
+
+    # A function to convert HSV values to Hex values
+    @staticmethod
+    def hsv(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        value: typing.Union[int, float] = 0
+    ) -> str:
+        """
+        Returns the Hex value from an HSV value for many modules use
+        Hex values as their default or accepted color code values
+        
+        0 ≤ hue ≤ 360; although other values are also acceptable
+        0 ≤ saturation, value ≤ 1; any other value will be clamped
+        
+        NOTE: both HSB and HSV are the same colorspaces
+        
+        Can also be used as a HSV-to-Hex converter
+        """
+
+        return Colors.rgb(*Converters.hsv2rgb(hue, saturation, value))
+
+    hsb = hsv  # Since both are the same
+
+    # A function to convert HSL values to Hex values
+    @staticmethod
+    def hsl(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        luminance: typing.Union[int, float] = 0
+    ) -> str:
+        """
+        Returns the Hex value from an HSL value for many modules use
+        Hex values as their default or accepted color code values
+        
+        0 ≤ hue ≤ 360; although a other values are also acceptable
+        0 ≤ saturation, luminance ≤ 1; any other value will be clamped
+        
+        NOTE: HSV and HSL are different colorspaces, for more information
+        refer to:
+            https://en.wikipedia.org/wiki/HSL_and_HSV
+        
+        Can also be used as a HSL-to-Hex converter
+        """
+
+        return Colors.rgb(*Converters.hsl2rgb(hue, saturation, luminance))
+
+    # A function to convert a YIQ color to Hex values
+    @staticmethod
+    def yiq(
+        y: typing.Union[int, float] = 0,
+        i: typing.Union[int, float] = 0,
+        q: typing.Union[int, float] = 0
+    ) -> str:
+        """
+        Returns the Hex value from a YIQ color space for many modules
+        use Hex values as their default or accepted color code values
+        
+        NOTE: The following are the acceptable values:
+            0 ≤ y ≤ 1,
+            -0.5959 ≤ i ≤ 0.5959,
+            -0.5229 ≤ q ≤ 0.5229
+        
+        All other values will be clamped between these ranges
+        
+        Can also be used as a YIQ-to-Hex converter
+        """
+
+        return Colors.rgb(*Converters.yiq2rgb(y, i, q))
+
+    # A function to convert a CMYK color to Hex values
+    @staticmethod
+    def cmyk(
+        cyan: typing.Union[int, float] = 0,
+        magenta: typing.Union[int, float] = 0,
+        yellow: typing.Union[int, float] = 0,
+        black_key: typing.Union[int, float] = 0
+    ) -> str:
+        """
+        Returns the Hex value from a CMYK color space for many modules
+        use Hex values as their default or accepted color code values
+        
+        0 ≤ cyan, magenta, yellow, black_key ≤ 1, other values will be clamped
+        
+        Can also be used as a CMYK-to-Hex converter
+        """
+
+        return Colors.rgb(*Converters.cmyk2rgb(cyan, magenta, yellow, black_key))
+    
+    # A function to convert RGBA values to Hex values (with alpha)
+    @staticmethod
+    def rgba(
+        red: typing.Union[int, float] = 0,
+        green: typing.Union[int, float] = 0,
+        blue: typing.Union[int, float] = 0,
+        alpha: typing.Union[int, float] = 255
+    ) -> str:
+        """
+        Returns the #rrggbbaa Hex value from an RGBA value, as
+        supported by CSS4 and many other modules
+
+        NOTE: 0 ≤ red, green, blue, alpha ≤ 255
+        """
+
+        if alpha in _HEX:
+            return Colors.rgb(red, green, blue) + _HEX[alpha]
+
+        return Colors.rgb(red, green, blue) + f'{clamp(round(alpha), 0, 255):02x}'
+
+    @staticmethod
+    def getrandomcolor() -> str:
+        return Colors.rgb(_randint(0, 255), _randint(0, 255), _randint(0, 255))
+
+    # A function to get many random colors at once
+    @staticmethod
+    def random_colors(
+        count: int = 1,
+        seed: typing.Optional[typing.Hashable] = None,
+        packed: bool = False
+    ) -> typing.Union[typing.List[str], _array]:
+        """
+        Returns *count* random Hex colors, or an `array('I')` of packed
+        24-bit colors (0xRRGGBB) if *packed* is True
+
+        All the colors are drawn at once from a private random number
+        generator, so passing a *seed* gives reproducible colors without
+        touching the global state of the `random` module
+
+        E.g.: Colors.random_colors(3, seed=42)
+        """
+
+        if count <= 0:
+            return _array('I') if packed else []
+
+        rng = _Random(seed)
+        buffer = rng.getrandbits(24 * count).to_bytes(3 * count, 'big')
+
+        return _pack_rgb(buffer) if packed else Colors._rgb_buffer(buffer)
+
+    # A function to get well-separated colors (e.g. for chart series)
+    @staticmethod
+    def distinct_colors(
+        count: int = 1,
+        seed: typing.Optional[typing.Hashable] = None,
+        avoid: typing.Iterable[typing.Union[str, int]] = (),
+        candidates: int = 4096
+    ) -> typing.List[str]:
+        """
+        Returns *count* Hex colors that are as far from each other
+        as possible, e.g. to label the series of a chart
+
+        The colors are picked by farthest-point sampling over a pool of
+        random *candidates* (at least 2 per color), measuring distances
+        in the YIQ color space whose luma roughly follows perception.
+        It takes O(count × candidates) time, about a second per 500 colors.
+        The colors in *avoid* (like the background) are treated as if
+        they were already picked, so the result stays away from them.
+
+        E.g.: Colors.distinct_colors(5, seed=0, avoid=[Colors.WHITE])
+        """
+
+        if count <= 0:
+            return []
+
+        pool = Colors.random_colors(max(candidates, 2 * count), seed, True)
+        rgb2yiq = Converters.rgb2yiq
+
+        points = [
+            rgb2yiq(color >> 16, color >> 8 & 255, color & 255) for color in pool
+        ]
+
+        # Squared distance of every candidate to the closest picked color
+        distances = [float('inf')] * len(points)
+
+        for color in avoid:
+            y0, i0, q0 = Converters.hex2yiq(color)
+            distances = [
+                min(d, (y-y0) * (y-y0) + (i-i0) * (i-i0) + (q-q0) * (q-q0))
+                for d, (y, i, q) in zip(distances, points)
+            ]
+
+        picked = []
+
+        for _ in range(count):
+            index = distances.index(max(distances))
+            picked.append(pool[index])
+
+            y0, i0, q0 = points[index]
+            distances = [
+                min(d, (y-y0) * (y-y0) + (i-i0) * (i-i0) + (q-q0) * (q-q0))
+                for d, (y, i, q) in zip(distances, points)
+            ]
+
+        return Colors.rgb_many(picked)
+
+
+# A class to convert colors to-fro different colorspaces
+class Converters:
+    """
+    A class of color space converters
+    
+    NOTE: All methods in this class are `static` methods
+    
+    Usage:
+        dyepy.Converters.hex2rgb(0xffffff)
+    """
+    
+    # A function to convert Hex values to RGB colors
+    @staticmethod
+    def hex2rgb(hexcode: typing.Union[str, int] = '#000000')\
+        -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent RGB values of a hex color *hexcode*
+        """
+        
+        if isinstance(hexcode, int):
+            hexcode = f'#{hexcode:06x}'     # Keeps the leading zeros
+        
+        hexcode = hexcode.replace('0x', '#')
+
+        if len(hexcode) in (4, 5):  # Repetative shortcut (alpha ignored)
+            hexcode = f'#{hexcode[1]*2}{hexcode[2]*2}{hexcode[3]*2}'
+
+        return (
+            int(hexcode[1:3], 16),
+            int(hexcode[3:5], 16),
+            int(hexcode[5:7], 16)
+        )
+
+    # A function to convert Hex values (with alpha) to RGBA colors
+    @staticmethod
+    def hex2rgba(hexcode: typing.Union[str, int] = '#000000ff')\
+        -> typing.Tuple[int, int, int, int]:
+        """
+        Returns the equivalent RGBA values of a hex color *hexcode*
+
+        Accepts #rgb, #rgba, #rrggbb and #rrggbbaa codes (and integers,
+        as 0xRRGGBB up to 0xffffff and as 0xRRGGBBAA above it), colors
+        without an alpha channel being opaque
+        
+        NOTE: 0 ≤ alpha ≤ 255, just like the other channels
+        """
+
+        if isinstance(hexcode, int):
+            hexcode = f'#{hexcode:06x}' if hexcode <= 0xffffff else f'#{hexcode:08x}'
+
+        hexcode = hexcode.replace('0x', '#')
+
+        if len(hexcode) in (4, 5):  # Repetative shortcut
+            hexcode = '#' + ''.join(digit * 2 for digit in hexcode[1:])
+
+        return (
+            int(hexcode[1:3], 16),
+            int(hexcode[3:5], 16),
+            int(hexcode[5:7], 16),
+            int(hexcode[7:9], 16) if len(hexcode) == 9 else 255
+        )
+
+    # A function to convert Hex values to HSV colors
+    @staticmethod
+    def hex2hsv(hexcode: typing.Union[str, int] = '#000000')\
+        -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSV/HSB values of a hex color *hexcode*
+        """
+
+        return Converters.rgb2hsv(*Converters.hex2rgb(hexcode))
+
+    # A function to convert Hex values to HSL colors
+    @staticmethod
+    def hex2hsl(hexcode: typing.Union[str, int] = '#000000')\
+        -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSL values of a hex color *hexcode*
+        """
+
+        return Converters.rgb2hsl(*Converters.hex2rgb(hexcode))
+
+    # A function to convert Hex values to YIQ colors
+    @staticmethod
+    def hex2yiq(hexcode: typing.Union[str, int] = '#000000')\
+        -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent YIQ values of a hex color *hexcode*
+        """
+
+        return Converters.rgb2yiq(*Converters.hex2rgb(hexcode))
+
+    # A function to convert Hex values to CMYK colors
+    @staticmethod
+    def hex2cmyk(hexcode: typing.Union[str, int] = '#000000')\
+        -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent CMYK values of a hex color *hexcode*
+        """
+
+        return Converters.rgb2cmyk(*Converters.hex2rgb(hexcode))
+
+    # A function to convert RGB colors to HSV colors
+    @staticmethod
+    def rgb2hsv(
+        red: typing.Union[int, float] = 0,
+        green: typing.Union[int, float] = 0,
+        blue: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSV values of an RGB color value
+        
+        NOTE: 0 ≤ red, green, blue ≤ 255, all other values will be clamped
+        """
+        
+        red = clamp(round(red), 0, 255) / 255
+        green = clamp(round(green), 0, 255) / 255
+        blue = clamp(round(blue), 0, 255) / 255
+
+        cmax = max(red, green, blue)
+        cmin = min(red, green, blue)
+
+        diff = cmax - cmin
+        
+        # Value calculation
+        value = cmax
+        
+        # Saturation calculation
+        saturation = 0 if cmax == 0 else diff / cmax
+
+        # Hue calculation
+        if diff == 0:
+            hue = 0
+            
+            return (hue, saturation, value)
+
+        if cmax == red:
+            hue = round(60 * (((green - blue) / diff) % 6))
+            
+            return (hue, saturation, value)
+
+        if cmax == green:
+            hue = round(60 * (((blue - red) / diff) + 2))
+            
+            return (hue, saturation, value)
+
+        if cmax == blue:
+            hue = round(60 * (((red - green) / diff) + 4))
+            
+            return (hue, saturation, value)
+
+    # A function to convert an RGB color to an HSL color
+    @staticmethod
+    def rgb2hsl(
+        red: typing.Union[int, float] = 0,
+        green: typing.Union[int, float] = 0,
+        blue: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSL values of an RGB color value
+        
+        NOTE: 0 ≤ red, green, blue ≤ 255, all other values will be clamped
+        """
+
+        red = clamp(round(red), 0, 255) / 255
+        green = clamp(round(green), 0, 255) / 255
+        blue = clamp(round(blue), 0, 255) / 255
+
+        cmax = max(red, green, blue)
+        cmin = min(red, green, blue)
+
+        diff = cmax - cmin
+
+        # Luminance calculation
+        luminance = (cmax + cmin) / 2
+        
+        # Saturation calculation
+        saturation = diff / (1 - abs(2 * luminance - 1)) if diff else 0
+
+        # Hue calculation
+        if diff == 0:
+            hue = 0
+            
+            return (hue, saturation, luminance)
+
+        if cmax == red:
+            hue = round(60 * (((green - blue) / diff) % 6))
+            
+            return (hue, saturation, luminance)
+
+        if cmax == green:
+            hue = round(60 * (((blue - red) / diff) + 2))
+            
+            return (hue, saturation, luminance)
+
+        if cmax == blue:
+            hue = round(60 * (((red - green) / diff) + 4))
+            
+            return (hue, saturation, luminance)
+
+    # A function to convert an RGB color to YIQ color
+    @staticmethod
+    def rgb2yiq(
+        red: typing.Union[int, float] = 0,
+        green: typing.Union[int, float] = 0,
+        blue: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent YIQ values of an RGB color value
+        
+        NOTE: 0 ≤ red, green, blue ≤ 255, all other values will be clamped
+        """
+
+        red = clamp(round(red), 0, 255) / 255
+        green = clamp(round(green), 0, 255) / 255
+        blue = clamp(round(blue), 0, 255) / 255
+
+        (yr, yg, yb), (ir, ig, ib), (qr, qg, qb) = _YIQ
+
+        y = clamp(yr*red+yg*green+yb*blue)
+        i = clamp(ir*red+ig*green+ib*blue, -0.5959, 0.5959)
+        q = clamp(qr*red+qg*green+qb*blue, -0.5229, 0.5229)
+
+        return (y, i, q)
+
+    # A function to convert an RGB color to YCbCr color
+    @staticmethod
+    def rgb2ycbcr(
+        red: typing.Union[int, float] = 0,
+        green: typing.Union[int, float] = 0,
+        blue: typing.Union[int, float] = 0,
+        standard: int = 601,
+        full: bool = True
+    ) -> typing.Tuple[float, float, float]:
+        """
+        Returns the equivalent YCbCr values (0 to 255, unrounded) of an
+        RGB color value, BT.601 full range (as in JPEG) by default
+
+        NOTE: 0 ≤ red, green, blue ≤ 255, all other values will be clamped
+        *standard* is 601 or 709, limited (*full* = False) range puts
+        Y between 16 and 235 and Cb and Cr between 16 and 240
+        """
+
+        red = clamp(round(red), 0, 255) / 255
+        green = clamp(round(green), 0, 255) / 255
+        blue = clamp(round(blue), 0, 255) / 255
+
+        forward, _ = _ycbcr(standard, full)
+
+        return tuple(
+            clamp(channel * 255, 0, 255) for channel in forward.vector(red, green, blue)
+        )
+
+    # A function to convert an RGB color to CMYK color
+    @staticmethod
+    def rgb2cmyk(
+        red: typing.Union[int, float] = 0,
+        green: typing.Union[int, float] = 0,
+        blue: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent CMYK values of an RGB color value
+        
+        NOTE: 0 ≤ red, green, blue ≤ 255, all other values will be clamped
+        """
+
+        red = clamp(round(red), 0, 255) / 255
+        green = clamp(round(green), 0, 255) / 255
+        blue = clamp(round(blue), 0, 255) / 255
+
+        black_key = 1 - max(red, green, blue)
+        
+        if black_key == 1:
+            return (0, 0, 0, 1)
+
+        cyan = (1 - black_key - red) / (1 - black_key)
+        magenta = (1 - black_key - green) / (1 - black_key)
+        yellow = (1 - black_key - blue) / (1 - black_key)
+
+        return (cyan, magenta, yellow, black_key)
+
+    # A function to convert an HSV color to an RGB color
+    @staticmethod
+    def hsv2rgb(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        value: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent RGB values of an HSV color value
+        
+        0 ≤ hue ≤ 360; although other values are also acceptable
+        0 ≤ saturation, value ≤ 1; any other value will be clamped
+
+        Quantized values are looked up once enabled (see `enable_lut`)
+        """
+
+        table = Converters._luts.get('hsv')
+
+        if table is not None:
+            color = table.lookup(hue, saturation, value)
+
+            if color is not None:
+                return color
+
+        # Cycle clamping *hue* in [0, 360)
+        hue = hue-360*(hue//360) if hue >= 0 else hue+360*(-hue//360+1)
+
+        saturation = clamp(saturation)
+        value = clamp(value)
+        
+        c = value * saturation
+        x = c * (1 - abs((hue / 60) % 2 - 1))
+        m = value - c
+        
+        if 0 <= hue < 60:
+            return (round((c+m)*255), round((x+m)*255), round(m*255))
+        
+        if 60 <= hue < 120:
+            return (round((x+m)*255), round((c+m)*255), round(m*255))
+        
+        if 120 <= hue < 180:
+            return (round(m*255), round((c+m)*255), round((x+m)*255))
+        
+        if 180 <= hue < 240:
+            return (round(m*255), round((x+m)*255), round((c+m)*255))
+        
+        if 240 <= hue < 300:
+            return (round((x+m)*255), round(m*255), round((c+m)*255))
+        
+        if 300 <= hue < 360:
+            return (round((c+m)*255), round(m*255), round((x+m)*255))
+
+    # A function to convert an HSV color to an HSL color
+    @staticmethod
+    def hsv2hsl(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        value: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSL values of an HSV color value
+        
+        0 ≤ hue ≤ 360; although other values are also acceptable
+        0 ≤ saturation, value ≤ 1; any other value will be clamped
+        """
+
+        return Converters.rgb2hsl(*Converters.hsv2rgb(hue, saturation, value))
+
+    # A function to convert an HSV color to a YIQ color
+    @staticmethod
+    def hsv2yiq(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        value: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent YIQ values of an HSV color value
+        
+        0 ≤ hue ≤ 360; although other values are also acceptable
+        0 ≤ saturation, value ≤ 1; any other value will be clamped
+        """
+
+        return Converters.rgb2yiq(*Converters.hsv2rgb(hue, saturation, value))
+
+    # A function to convert an HSV color to a CMYK color
+    @staticmethod
+    def hsv2cmyk(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        value: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent CMYK values of an HSV color value
+        
+        0 ≤ hue ≤ 360; although other values are also acceptable
+        0 ≤ saturation, value ≤ 1; any other value will be clamped
+        """
+
+        return Converters.rgb2cmyk(*Converters.hsv2rgb(hue, saturation, value))
+
+    # A function to convert HSL color to an RGB color
+    @staticmethod
+    def hsl2rgb(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        luminance: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent RGB values of an HSL color value
+        
+        0 ≤ hue ≤ 360; although other values are also acceptable
+        0 ≤ saturation, luminance ≤ 1; any other value will be clamped
+
+        Quantized values are looked up once enabled (see `enable_lut`)
+        """
+
+        table = Converters._luts.get('hsl')
+
+        if table is not None:
+            color = table.lookup(hue, saturation, luminance)
+
+            if color is not None:
+                return color
+
+        # Cycling clamping *hue* in [0, 360)
+        hue = hue-360*(hue//360) if hue >= 0 else hue+360*(-hue//360+1)
+
+        saturation = clamp(saturation)
+        luminance = clamp(luminance)
+
+        c = (1 - abs(2 * luminance - 1)) * saturation
+        x = c * (1 - abs((hue / 60) % 2 - 1))
+        m = luminance - c / 2
+
+        if 0 <= hue < 60:
+            return (round((c+m)*255), round((x+m)*255), round(m*255))
+
+        if 60 <= hue < 120:
+            return (round((x+m)*255), round((c+m)*255), round(m*255))
+
+        if 120 <= hue < 180:
+            return (round(m*255), round((c+m)*255), round((x+m)*255))
+
+        if 180 <= hue < 240:
+            return (round(m*255), round((x+m)*255), round((c+m)*255))
+
+        if 240 <= hue < 300:
+            return (round((x+m)*255), round(m*255), round((c+m)*255))
+
+        if 300 <= hue < 360:
+            return (round((c+m)*255), round(m*255), round((x+m)*255))
+
+    # A function to convert an HSL color to an HSV color
+    @staticmethod
+    def hsl2hsv(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        luminance: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSV values of an HSL color value
+        
+        0 ≤ hue ≤ 360; although other values are also acceptable
+        0 ≤ saturation, luminance ≤ 1; any other value will be clamped
+        """
+
+        return Converters.rgb2hsv(*Converters.hsl2rgb(hue, saturation, luminance))
+
+    # A function to convert an HSL color to a YIQ color
+    @staticmethod
+    def hsl2yiq(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        luminance: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent YIQ values of an HSL color value
+        
+        0 ≤ hue ≤ 360; although other values are also acceptable
+        0 ≤ saturation, luminance ≤ 1; any other value will be clamped
+        """
+
+        return Converters.rgb2yiq(*Converters.hsl2rgb(hue, saturation, luminance))
+
+    # A function to convert an HSL color to a CMYK color
+    @staticmethod
+    def hsl2cmyk(
+        hue: typing.Union[int, float] = 0,
+        saturation: typing.Union[int, float] = 0,
+        luminance: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent CMYK values of an HSL color value
+        
+        0 ≤ hue ≤ 360; although other values are also acceptable
+        0 ≤ saturation, luminance ≤ 1; any other value will be clamped
+        """
+
+        return Converters.rgb2cmyk(*Converters.hsl2rgb(hue, saturation, luminance))
+
+    # A function to convert a YIQ color to an RGB color
+    @staticmethod
+    def yiq2rgb(
+        y: typing.Union[int, float] = 0,
+        i: typing.Union[int, float] = 0,
+        q: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent RGB values of a YIQ color value
+        
+        NOTE: The following are the acceptable values:
+            0 ≤ y ≤ 1
+            -0.5959 ≤ i ≤ 0.5959
+            -0.5229 ≤ q ≤ 0.5229
+        
+        The values will be clamped between these ranges
+        """
+
+        y = clamp(y)
+        i = clamp(i, -0.5959, 0.5959)
+        q = clamp(q, -0.5229, 0.5229)
+
+        (ry, ri, rq), (gy, gi, gq), (by, bi, bq) = _YIQ_INVERSE
+
+        red = ry * y + ri * i + rq * q
+        green = gy * y + gi * i + gq * q
+        blue = by * y + bi * i + bq * q
+
+        return (
+            round(clamp(red) * 255),
+            round(clamp(green) * 255),
+            round(clamp(blue) * 255)
+        )
+
+    # A function to convert a YCbCr color to an RGB color
+    @staticmethod
+    def ycbcr2rgb(
+        y: typing.Union[int, float] = 0,
+        cb: typing.Union[int, float] = 128,
+        cr: typing.Union[int, float] = 128,
+        standard: int = 601,
+        full: bool = True
+    ) -> typing.Tuple[int, int, int]:
+        """
+        Returns the equivalent RGB values of a YCbCr color value, BT.601
+        full range (as in JPEG) by default (see `Converters.rgb2ycbcr`)
+
+        NOTE: 0 ≤ y, cb, cr ≤ 255, all other values will be clamped
+        """
+
+        _, inverse = _ycbcr(standard, full)
+
+        return tuple(
+            round(clamp(channel) * 255)
+            for channel in inverse.vector(
+                clamp(y, 0, 255) / 255, clamp(cb, 0, 255) / 255, clamp(cr, 0, 255) / 255
+            )
+        )
+
+    # A function to convert a YIQ color to an HSV color
+    @staticmethod
+    def yiq2hsv(
+        y: typing.Union[int, float] = 0,
+        i: typing.Union[int, float] = 0,
+        q: typing.Union[int, float] = 0,
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSV values of a YIQ color value
+        
+        NOTE: The following are the acceptable values:
+            0 ≤ y ≤ 1
+            -0.5959 ≤ i ≤ 0.5959
+            -0.5229 ≤ q ≤ 0.5229
+        
+        The values will be clamped between these ranges
+        """
+
+        return Converters.rgb2hsv(*Converters.yiq2rgb(y, i, q))
+
+    # A function to convert a YIQ color to an HSL color
+    @staticmethod
+    def yiq2hsl(
+        y: typing.Union[int, float] = 0,
+        i: typing.Union[int, float] = 0,
+        q: typing.Union[int, float] = 0,
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSL values of a YIQ color value
+        
+        NOTE: The following are the acceptable values:
+            0 ≤ y ≤ 1
+            -0.5959 ≤ i ≤ 0.5959
+            -0.5229 ≤ q ≤ 0.5229
+        
+        The values will be clamped between these ranges
+        """
+
+        return Converters.rgb2hsl(*Converters.yiq2rgb(y, i, q))
+
+    # A function to convert a YIQ color to a CMYK color
+    @staticmethod
+    def yiq2cmyk(
+        y: typing.Union[int, float] = 0,
+        i: typing.Union[int, float] = 0,
+        q: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent CMYK values of a YIQ color value
+        
+        NOTE: The following are the acceptable values:
+            0 ≤ y ≤ 1
+            -0.5959 ≤ i ≤ 0.5959
+            -0.5229 ≤ q ≤ 0.5229
+        
+        The values will be clamped between these ranges
+        """
+
+        return Converters.rgb2cmyk(*Converters.yiq2rgb(y, i, q))
+
+    # A function to convert a CMYK color to an RGB color
+    @staticmethod
+    def cmyk2rgb(
+        cyan: typing.Union[int, float] = 0,
+        magenta: typing.Union[int, float] = 0,
+        yellow: typing.Union[int, float] = 0,
+        black_key: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent RGB values of an CMYK color value
+        
+        NOTE: The following are the acceptable values:
+            0 ≤ y ≤ 1
+            -0.5959 ≤ i ≤ 0.5959
+            -0.5229 ≤ q ≤ 0.5229
+        
+        The values will be clamped between these ranges
+        """
+
+        cyan = clamp(cyan)
+        magenta = clamp(magenta)
+        yellow = clamp(yellow)
+        black_key = clamp(black_key)
+
+        return (
+            round(255 * (1 - cyan) * (1 - black_key)),
+            round(255 * (1 - magenta) * (1 - black_key)),
+            round(255 * (1 - yellow) * (1 - black_key))
+        )
+
+    # A function to convert a CMYK color to an HSV color
+    @staticmethod
+    def cmyk2hsv(
+        cyan: typing.Union[int, float] = 0,
+        magenta: typing.Union[int, float] = 0,
+        yellow: typing.Union[int, float] = 0,
+        black_key: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSV values of an CMYK color value
+        
+        NOTE: 0 ≤ cyan, magenta, yellow, black_key ≤ 1
+        """
+
+        return Converters.rgb2hsv(*Converters.cmyk2rgb(cyan, magenta, yellow, black_key))
+
+    # A function to convert a CMYK color to an HSL color
+    @staticmethod
+    def cmyk2hsl(
+        cyan: typing.Union[int, float] = 0,
+        magenta: typing.Union[int, float] = 0,
+        yellow: typing.Union[int, float] = 0,
+        black_key: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent HSL values of an CMYK color value
+        
+        NOTE: 0 ≤ cyan, magenta, yellow, black_key ≤ 1
+        """
+
+        return Converters.rgb2hsl(*Converters.cmyk2rgb(cyan, magenta, yellow, black_key))
+
+    # A function to convert a CMYK color to a YIQ color
+    @staticmethod
+    def cmyk2yiq(
+        cyan: typing.Union[int, float] = 0,
+        magenta: typing.Union[int, float] = 0,
+        yellow: typing.Union[int, float] = 0,
+        black_key: typing.Union[int, float] = 0
+    ) -> typing.Tuple[typing.Union[int, float]]:
+        """
+        Returns the equivalent YIQ values of an CMYK color value
+        
+        NOTE: 0 ≤ cyan, magenta, yellow, black_key ≤ 1
+        """
+
+        return Converters.rgb2yiq(*Converters.cmyk2rgb(cyan, magenta, yellow, black_key))
+
+    # Registered color spaces, mapping each name to whether its values
+    # are scalars (like Hex codes) instead of tuples of components
+    _spaces = {}
+
+    # Direct conversion kernels, as {source: {target: (kernel, cost)}}
+    _kernels = {}
+
+    # Resolved conversions, as {(source, target): composed function}
+    _paths = {}
+
+    # The enabled lookup tables of quantized inputs, by model (see `enable_lut`)
+    _luts = {}
+
+    # A function to register a new color space
+    @staticmethod
+    def register_space(name: str, scalar: bool = False) -> None:
+        """
+        Registers the color space *name* so that kernels can be
+        registered to and from it with `Converters.register`
+
+        scalar (bool) = False - True if the values of the color space are
+        single values (like Hex codes) instead of tuples of components
+        """
+
+        Converters._spaces[name] = scalar
+        Converters._kernels.setdefault(name, {})
+        Converters._paths.clear()
+
+    # A function to register a direct conversion between two color spaces
+    @staticmethod
+    def register(
+        source: str,
+        target: str,
+        kernel: typing.Callable,
+        cost: typing.Union[int, float] = 1
+    ) -> None:
+        """
+        Registers *kernel* as a direct conversion from *source* to *target*
+
+        The kernel takes the components of a *source* color as positional
+        arguments (or the value itself for scalar color spaces) and returns
+        the *target* color. *cost* is used to pick the fastest path
+        when a conversion has to go through other color spaces.
+
+        E.g.:
+        Converters.register('rgb', 'gray', lambda r, g, b: (r+g+b) / 765)
+        """
+
+        for name in (source, target):
+            if name not in Converters._spaces:
+                raise ValueError(f'Unknown color space {name!r}')
+
+        Converters._kernels[source][target] = (kernel, cost)
+        Converters._paths.clear()
+
+    # A function to find the cheapest path between two color spaces
+    @staticmethod
+    def path(source: str, target: str) -> typing.List[str]:
+        """
+        Returns the color spaces (both ends included) of the cheapest chain
+        of registered kernels converting from *source* to *target*
+
+        E.g.: Converters.path('hex', 'cmyk') -> ['hex', 'rgb', 'cmyk']
+        """
+
+        for name in (source, target):
+            if name not in Converters._spaces:
+                raise ValueError(f'Unknown color space {name!r}')
+
+        # Dijkstra's algorithm, since the graph is tiny
+        costs = {source: 0}
+        previous = {}
+        pending = {source}
+        done = set()
+
+        while pending:
+            current = min(pending, key=costs.__getitem__)
+            pending.remove(current)
+            done.add(current)
+
+            if current == target:
+                break
+
+            for name, (_, cost) in Converters._kernels[current].items():
+                total = costs[current] + cost
+
+                if name not in done and total < costs.get(name, total + 1):
+                    costs[name] = total
+                    previous[name] = current
+                    pending.add(name)
+
+        if target not in done:
+            raise ValueError(f'No conversion from {source!r} to {target!r}')
+
+        path = [target]
+
+        while path[-1] != source:
+            path.append(previous[path[-1]])
+
+        return path[::-1]
+
+    # A function to build (and cache) a conversion between two color spaces
+    @staticmethod
+    def resolve(source: str, target: str) -> typing.Callable:
+        """
+        Returns a function converting a single *source* color to *target*
+
+        The function is composed once from the registered kernels and
+        cached, so that later lookups cost a single dict lookup
+        """
+
+        steps = []
+        path = Converters.path(source, target)
+
+        for start, end in zip(path, path[1:]):
+            kernel = Converters._kernels[start][end][0]
+            steps.append((kernel, not Converters._spaces[start]))
+
+        if not steps:
+            def function(value):
+                return value
+
+        elif len(steps) == 1 and not steps[0][1]:
+            function = steps[0][0]
+
+        elif len(steps) == 1:
+            kernel = steps[0][0]
+
+            def function(value):
+                return kernel(*value)
+
+        else:
+            steps = tuple(steps)
+
+            def function(value):
+                for kernel, unpack in steps:
+                    value = kernel(*value) if unpack else kernel(value)
+
+                return value
+
+        Converters._paths[source, target] = function
+
+        return function
+
+    # A function to convert a color between any two registered color spaces
+    @staticmethod
+    def convert(value: typing.Any, source: str, target: str) -> typing.Any:
+        """
+        Returns the *target* equivalent of the *source* color *value*
+
+        Can be used as follows:
+        Converters.convert('#0078d7', 'hex', 'hsl')
+        Converters.convert((207, 1, 0.84), 'hsv', 'cmyk')
+
+        Built-in color spaces: hex, rgb, hsv, hsl, yiq, ycbcr, cmyk
+        """
+
+        function = Converters._paths.get((source, target))
+
+        if function is None:
+            function = Converters.resolve(source, target)
+
+        return function(value)
+
+    # A function to convert many colors between two registered color spaces
+    @staticmethod
+    def convert_many(
+        values: typing.Iterable,
+        source: str,
+        target: str
+    ) -> typing.List[typing.Any]:
+        """
+        Returns the *target* equivalents of all the *source* colors in
+        *values*, resolving the conversion only once for all of them
+        """
+
+        function = Converters._paths.get((source, target))
+
+        if function is None:
+            function = Converters.resolve(source, target)
+
+        return list(map(function, values))
+
+    # A function to enable the lookup table of quantized HSV or HSL colors
+    @staticmethod
+    def enable_lut(model: str = 'hsv', cache: typing.Optional[str] = None) -> None:
+        """
+        Makes `hsv2rgb` (*model* 'hsv') or `hsl2rgb` ('hsl') look
+        quantized colors (integer hues from 0 to 359, saturations and
+        values or luminances in hundredths, like those of sliders) up
+        in a table of their 360×101×101 packed RGB values, and compute
+        any other color as usual, with the very same results
+
+        The table (about 15 MB) is built the first time it is needed,
+        in a couple of seconds. If *cache* is the path of a file, the table
+        is mapped from it instead (shared by every process mapping it)
+        and the file is (re)written after building it when missing
+        """
+
+        if model not in _QuantizedTable.MODELS:
+            raise ValueError(f'Unknown model {model!r}, expected one of {_QuantizedTable.MODELS}')
+
+        Converters._luts[model] = _QuantizedTable(model, cache)
+
+    # A function to disable the lookup table of quantized HSV or HSL colors
+    @staticmethod
+    def disable_lut(model: str = 'hsv') -> None:
+        """
+        Makes `hsv2rgb` (*model* 'hsv') or `hsl2rgb` ('hsl') compute
+        every color again (see `enable_lut`)
+        """
+
+        Converters._luts.pop(model, None)
+
+
+# A class of lookup tables of quantized HSV or HSL colors
+class _QuantizedTable:
+    """
+    The packed RGB values of the 360×101×101 quantized HSV or HSL
+    colors (see `Converters.enable_lut`), indexed by
+    (saturation × 101 + value) × 360 + hue, built or mapped lazily
+    """
+
+    MODELS = ('hsv', 'hsl')
+
+    # The first bytes of a table file, followed by the model (8 bytes)
+    SIGNATURE = b'DYELUT\x00\x01'
+
+    SIZE = 101 * 101 * 360
+
+    # The index offsets of the quantized hues, saturations and values
+    _HUES = {hue: hue for hue in range(360)}
+    _SATURATIONS = {s / 100: s * 101 * 360 for s in range(101)}
+    _VALUES = {v / 100: v * 360 for v in range(101)}
+
+    # The hue factors (1 - |(hue / 60) % 2 - 1|) and the positions of
+    # (chroma, x, m) in (red, green, blue) of every 60° sector
+    _FACTORS = [1 - abs((hue / 60) % 2 - 1) for hue in range(360)]
+    _SECTORS = ((16, 8, 0), (8, 16, 0), (8, 0, 16), (0, 8, 16), (0, 16, 8), (16, 0, 8))
+
+    def __init__(self, model: str, cache: typing.Optional[str] = None) -> None:
+        self.model = model
+        self.cache = cache
+        self.table = None
+        self._map = None
+
+    # A function to look a color up
+    def lookup(
+        self,
+        hue: typing.Union[int, float],
+        saturation: typing.Union[int, float],
+        value: typing.Union[int, float]
+    ) -> typing.Optional[typing.Tuple[int, int, int]]:
+        """
+        Returns the RGB values of a quantized color, None for any
+        other color
+        """
+
+        # Exactly quantized values are found in dicts of the offsets
+        # of their indices, `round` would cost more than everything else
+        try:
+            offset = _QuantizedTable._HUES.get(hue)
+
+            if offset is None:
+                return None
+
+            s = _QuantizedTable._SATURATIONS.get(saturation)
+            v = _QuantizedTable._VALUES.get(value)
+
+        except TypeError:   # Unhashable values are never quantized
+            return None
+
+        if s is None or v is None:
+            return None
+
+        table = self.table
+
+        if table is None:
+            table = self._load()
+
+        packed = table[offset + s + v]
+
+        return (packed >> 16, packed >> 8 & 255, packed & 255)
+
+    # A function to compute the table
+    def build(self) -> _array:
+        """
+        Returns the table, computed with the very same arithmetic as
+        `Converters.hsv2rgb` or `Converters.hsl2rgb`
+        """
+
+        table = _array('I')
+        factors = _QuantizedTable._FACTORS
+        sectors = [
+            _QuantizedTable._SECTORS[sector]
+            for sector in range(6) for _ in range(60)
+        ]
+        hsv = self.model == 'hsv'
+
+        for s in range(101):
+            saturation = s / 100
+
+            for v in range(101):
+                value = v / 100
+
+                if hsv:
+                    c = value * saturation
+                    m = value - c
+
+                else:
+                    c = (1 - abs(2 * value - 1)) * saturation
+                    m = value - c / 2
+
+                high, low = round((c+m)*255), round(m*255)
+                table.extend([
+                    high << a | round((c * factor + m) * 255) << b | low << d
+                    for factor, (a, b, d) in zip(factors, sectors)
+                ])
+
+        return table
+
+    # A function to get the table, through its cache file
+    def _load(self) -> typing.Union[_array, memoryview]:
+        """
+        Returns the table, mapped from the cache file if valid, built
+        (and written to the cache file) otherwise
+        """
+
+        header = _QuantizedTable.SIGNATURE + self.model.encode().ljust(8, b'\x00')
+        size = len(header) + 4 * _QuantizedTable.SIZE
+
+        if self.cache is not None and _byteorder == 'little':
+            try:
+                with open(self.cache, 'rb') as file:
+                    mapped = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+
+                if len(mapped) == size and mapped[:len(header)] == header:
+                    self._map = mapped
+                    self.table = memoryview(mapped)[len(header):].cast('I')
+
+                    return self.table
+
+                mapped.close()
+
+            except (OSError, ValueError):
+                pass
+
+        self.table = table = self.build()
+
+        if self.cache is not None:
+            data = _array('I', table)
+
+            if _byteorder == 'big':
+                data.byteswap()
+
+            temporary = f'{self.cache}.{_getpid()}.tmp'
+
+            try:
+                with open(temporary, 'wb') as file:
+                    file.write(header)
+                    file.write(data.tobytes())
+
+                _replace(temporary, self.cache)
+
+            except OSError:     # A read-only cache location only costs speed
+                pass
+
+        return table
+
+
+for _name in ('rgb', 'hsv', 'hsl', 'yiq', 'ycbcr', 'cmyk'):
+    Converters.register_space(_name)
+
+del _name
+
+Converters.register_space('hex', scalar=True)
+
+Converters.register('hex', 'rgb', Converters.hex2rgb)
+Converters.register('rgb', 'hex', Colors.rgb)
+Converters.register('rgb', 'hsv', Converters.rgb2hsv)
+Converters.register('hsv', 'rgb', Converters.hsv2rgb)
+Converters.register('rgb', 'hsl', Converters.rgb2hsl)
+Converters.register('hsl', 'rgb', Converters.hsl2rgb)
+Converters.register('rgb', 'yiq', Converters.rgb2yiq)
+Converters.register('yiq', 'rgb', Converters.yiq2rgb)
+Converters.register('rgb', 'ycbcr', Converters.rgb2ycbcr)
+Converters.register('ycbcr', 'rgb', Converters.ycbcr2rgb)
+Converters.register('rgb', 'cmyk', Converters.rgb2cmyk)
+Converters.register('cmyk', 'rgb', Converters.cmyk2rgb)
+
+
+# A function to pack any color (Hex value, RGB tuple or packed) to 0xRRGGBB
+def _packed(color: typing.Union[str, int, typing.Sequence[int], None]) -> int:
+    """
+    Returns the packed 24-bit value of *color*, -1 for None (no color)
+    """
+
+    if color is None:
+        return -1
+
+    if isinstance(color, int):
+        return color
+
+    if isinstance(color, str):
+        color = Converters.hex2rgb(color)
+
+    return (
+        clamp(round(color[0]), 0, 255) << 16
+        | clamp(round(color[1]), 0, 255) << 8
+        | clamp(round(color[2]), 0, 255)
+    )
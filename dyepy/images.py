@@ -0,0 +1,610 @@
+"""
+Streaming readers and writers of PPM and PNG images, and `Images`
+"""
+
+
+# Import `typing` for type-hinting
+import typing
+
+# Import `array` from `array` as `_array`
+from array import array as _array
+
+# Import `struct` and `zlib` as `_struct` and `_zlib` (for images)
+import struct as _struct
+import zlib as _zlib
+
+from . import clamp
+from .arrays import _lut2, _table
+from .converters import Converters, _pack_rgb, _unpack_rgb
+
+
+# A base class of the streaming image readers and writers
+class _ImageFile:
+    """
+    Opens *file* (a path or a binary file object) in *mode* and
+    closes it when done if (and only if) it was opened here
+    """
+
+    def __init__(self, file: typing.Union[str, typing.BinaryIO], mode: str) -> None:
+        if hasattr(file, 'read' if 'r' in mode else 'write'):
+            self.file, self._owned = file, False
+
+        else:
+            self.file, self._owned = open(file, mode), True
+
+    def close(self) -> None:
+        if self._owned:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# A class to read binary PPM (P6) and PGM (P5) images row by row
+class PPMReader(_ImageFile):
+    """
+    PPMReader class
+
+    Streams the rows of a binary PPM (or PGM, expanded to RGB) image
+    as buffers of interleaved 8-bit RGB values, reading one row at a time
+    
+    E.g.:
+    with PPMReader('image.ppm') as image:
+        for row in image:
+            ...
+    """
+
+    def __init__(self, file: typing.Union[str, typing.BinaryIO]) -> None:
+        super().__init__(file, 'rb')
+
+        fields = []
+
+        while len(fields) < 4:
+            token = b''
+            byte = self.file.read(1)
+
+            while byte.isspace():
+                byte = self.file.read(1)
+
+            while byte == b'#':     # Comments run until the end of the line
+                while byte not in (b'\n', b''):
+                    byte = self.file.read(1)
+
+                while byte.isspace():
+                    byte = self.file.read(1)
+
+            while byte and not byte.isspace():
+                token += byte
+                byte = self.file.read(1)
+
+            if not token:
+                raise ValueError('Truncated PPM header')
+
+            fields.append(token)
+
+        magic, width, height, maxval = fields
+
+        if magic not in (b'P5', b'P6'):
+            raise ValueError('Only binary PPM (P6) and PGM (P5) images are supported')
+
+        if int(maxval) != 255:
+            raise ValueError('Only 8-bit PPM images are supported')
+
+        self.width = int(width)
+        self.height = int(height)
+        self.channels = 3
+        self._gray = magic == b'P5'
+
+    def __iter__(self) -> typing.Iterator[bytearray]:
+        size = self.width if self._gray else 3 * self.width
+
+        for _ in range(self.height):
+            row = bytearray(size)
+
+            if self.file.readinto(row) != size:
+                raise ValueError('Truncated PPM image')
+
+            yield Images._expand(row, 1) if self._gray else row
+
+
+# A class to write binary PPM (P6) images row by row
+class PPMWriter(_ImageFile):
+    """
+    PPMWriter class
+
+    Writes a binary PPM image of *width* × *height* pixels row by row,
+    each row being a buffer of 8-bit RGB values (RGBA if *channels*
+    is 4, the alpha channel being dropped)
+    """
+
+    def __init__(
+        self,
+        file: typing.Union[str, typing.BinaryIO],
+        width: int,
+        height: int,
+        channels: int = 3
+    ) -> None:
+        super().__init__(file, 'wb')
+
+        self.width, self.height, self.channels = width, height, channels
+        self._rows = 0
+        self.file.write(f'P6\n{width} {height}\n255\n'.encode('ascii'))
+
+    def write_row(self, row: typing.Union[bytes, bytearray, memoryview]) -> None:
+        if len(row) != self.channels * self.width:
+            raise ValueError('The row does not match the width of the image')
+
+        if self._rows == self.height:
+            raise ValueError('All the rows of the image were already written')
+
+        if self.channels == 4:
+            row = Images._drop_alpha(row)
+
+        self.file.write(row)
+        self._rows += 1
+
+    def write_rows(self, rows: typing.Iterable) -> None:
+        for row in rows:
+            self.write_row(row)
+
+    def close(self) -> None:
+        super().close()
+
+        if self._rows != self.height:
+            raise ValueError(f'{self._rows} rows were written instead of {self.height}')
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+
+        # Only release the file: an incomplete image error would replace
+        # the error raised within the `with` block
+        else:
+            super().close()
+
+
+# A class to read PNG images row by row
+class PNGReader(_ImageFile):
+    """
+    PNGReader class
+
+    Streams the rows of a non-interlaced 8-bit PNG image as buffers of
+    interleaved RGB values (RGBA for images with an alpha channel, see
+    `channels`), decompressing and unfiltering one row at a time, so
+    memory stays bounded to a few rows whatever the image size.
+    
+    Grayscale and palette images are expanded to RGB (RGBA with alpha).
+    
+    E.g.:
+    with PNGReader('image.png') as image:
+        for row in image:
+            ...
+    """
+
+    SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+    def __init__(self, file: typing.Union[str, typing.BinaryIO]) -> None:
+        super().__init__(file, 'rb')
+
+        if self.file.read(8) != self.SIGNATURE:
+            raise ValueError('Not a PNG image')
+
+        kind, data = self._chunk()
+
+        if kind != b'IHDR':
+            raise ValueError('The PNG image does not start with IHDR')
+
+        (
+            self.width, self.height, depth, self.color_type,
+            _, _, interlace
+        ) = _struct.unpack('>IIBBBBB', data)
+
+        if depth != 8 or interlace:
+            raise ValueError('Only non-interlaced 8-bit PNG images are supported')
+
+        # Channels per pixel in the file, and in the rows yielded
+        self._samples = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[self.color_type]
+        self.channels = 4 if self.color_type in (4, 6) else 3
+        self._palette = None
+        self._pending = None     # Data of the first IDAT chunk
+
+        while True:
+            kind, data = self._chunk()
+
+            if kind == b'PLTE':
+                self._palette = [data[i:i + 3] for i in range(0, len(data), 3)]
+
+            elif kind == b'IDAT':
+                self._pending = data
+
+                break
+
+            elif kind == b'IEND':
+                raise ValueError('The PNG image has no IDAT chunk')
+
+        if self.color_type == 3 and self._palette is None:
+            raise ValueError('The PNG image has no palette')
+
+    def _chunk(self) -> typing.Tuple[bytes, bytes]:
+        """
+        Returns the type and data of the next chunk, checking its CRC
+        """
+
+        header = self.file.read(8)
+
+        if len(header) != 8:
+            raise ValueError('Truncated PNG image')
+
+        length, kind = _struct.unpack('>I4s', header)
+        data = self.file.read(length)
+        crc = self.file.read(4)
+
+        if len(data) != length or len(crc) != 4 or (
+            _zlib.crc32(data, _zlib.crc32(kind)) != _struct.unpack('>I', crc)[0]
+        ):
+            raise ValueError(f'Corrupted PNG chunk {kind!r}')
+
+        return kind, data
+
+    def _data(self) -> typing.Iterator[bytes]:
+        """
+        Yields the compressed data of every IDAT chunk
+        """
+
+        yield self._pending
+        self._pending = None
+
+        while True:
+            kind, data = self._chunk()
+
+            if kind == b'IDAT':
+                yield data
+
+            elif kind == b'IEND':
+                return
+
+    def __iter__(self) -> typing.Iterator[bytearray]:
+        bpp = self._samples
+        stride = bpp * self.width
+        limit = 4 * (stride + 1)    # Bounds the decompressed data kept
+        add_mod = _table('add_mod')
+
+        decompressor = _zlib.decompressobj()
+        chunks = self._data()
+        buffer = bytearray()
+        prior = bytearray(stride)
+
+        for _ in range(self.height):
+            while len(buffer) < stride + 1:
+                if decompressor.unconsumed_tail:
+                    data = decompressor.unconsumed_tail
+
+                else:
+                    data = next(chunks, None)
+
+                    if data is None:
+                        raise ValueError('Truncated PNG image data')
+
+                buffer += decompressor.decompress(data, limit)
+
+            kind = buffer[0]
+            row = buffer[1:stride + 1]
+            del buffer[:stride + 1]
+
+            if kind == 1:       # Sub
+                for i in range(bpp, stride):
+                    row[i] = (row[i] + row[i - bpp]) & 255
+
+            elif kind == 2:     # Up
+                row = bytearray(_lut2(add_mod, row, prior))
+
+            elif kind == 3:     # Average
+                for i in range(stride):
+                    left = row[i - bpp] if i >= bpp else 0
+                    row[i] = (row[i] + ((left + prior[i]) >> 1)) & 255
+
+            elif kind == 4:     # Paeth
+                for i in range(stride):
+                    a = row[i - bpp] if i >= bpp else 0
+                    b = prior[i]
+                    c = prior[i - bpp] if i >= bpp else 0
+                    p = a + b - c
+                    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+
+                    if pa <= pb and pa <= pc:
+                        row[i] = (row[i] + a) & 255
+
+                    elif pb <= pc:
+                        row[i] = (row[i] + b) & 255
+
+                    else:
+                        row[i] = (row[i] + c) & 255
+
+            elif kind:
+                raise ValueError(f'Unknown PNG filter type {kind}')
+
+            prior = row
+
+            if self.color_type == 3:
+                yield bytearray(b''.join(map(self._palette.__getitem__, row)))
+
+            elif self.color_type in (0, 4):
+                yield Images._expand(row, bpp)
+
+            else:
+                yield bytearray(row)    # The caller may modify it in place
+
+
+# A class to write PNG images row by row
+class PNGWriter(_ImageFile):
+    """
+    PNGWriter class
+
+    Writes an 8-bit RGB (or RGBA if *channels* is 4) PNG image of
+    *width* × *height* pixels row by row, compressing the rows as they
+    come and flushing IDAT chunks of about *chunk_size* bytes, so memory
+    stays bounded whatever the image size.
+    
+    Rows are filtered with the Up filter (cheap, and usually smaller than
+    no filter at all) unless *up_filter* is False
+    """
+
+    def __init__(
+        self,
+        file: typing.Union[str, typing.BinaryIO],
+        width: int,
+        height: int,
+        channels: int = 3,
+        level: int = 6,
+        up_filter: bool = True,
+        chunk_size: int = 1 << 16
+    ) -> None:
+        if channels not in (3, 4):
+            raise ValueError('PNG images can only be written as RGB or RGBA')
+
+        super().__init__(file, 'wb')
+
+        self.width, self.height, self.channels = width, height, channels
+        self._rows = 0
+        self._compressor = _zlib.compressobj(level)
+        self._pending = []
+        self._pending_size = 0
+        self._chunk_size = chunk_size
+        self._prior = bytes(channels * width) if up_filter else None
+
+        self.file.write(PNGReader.SIGNATURE)
+        self._write_chunk(b'IHDR', _struct.pack(
+            '>IIBBBBB', width, height, 8, 6 if channels == 4 else 2, 0, 0, 0
+        ))
+
+    def _write_chunk(self, kind: bytes, data: bytes) -> None:
+        self.file.write(_struct.pack('>I4s', len(data), kind))
+        self.file.write(data)
+        self.file.write(_struct.pack('>I', _zlib.crc32(data, _zlib.crc32(kind))))
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._write_chunk(b'IDAT', b''.join(self._pending))
+            self._pending, self._pending_size = [], 0
+
+    def write_row(self, row: typing.Union[bytes, bytearray, memoryview]) -> None:
+        if len(row) != self.channels * self.width:
+            raise ValueError('The row does not match the width of the image')
+
+        if self._prior is None:
+            data = self._compressor.compress(b'\x00' + bytes(row))
+
+        else:
+            row = bytes(row)
+            data = self._compressor.compress(
+                b'\x02' + _lut2(_table('subtract_mod'), row, self._prior)
+            )
+            self._prior = row
+
+        self._rows += 1
+
+        if data:
+            self._pending.append(data)
+            self._pending_size += len(data)
+
+            if self._pending_size >= self._chunk_size:
+                self._flush()
+
+    def write_rows(self, rows: typing.Iterable) -> None:
+        for row in rows:
+            self.write_row(row)
+
+    def close(self) -> None:
+        if self._compressor is not None:
+            self._pending.append(self._compressor.flush())
+            self._compressor = None
+            self._flush()
+            self._write_chunk(b'IEND', b'')
+
+        super().close()
+
+        if self._rows != self.height:
+            raise ValueError(f'{self._rows} rows were written instead of {self.height}')
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+
+        # Only release the file: an incomplete image error would replace
+        # the error raised within the `with` block
+        else:
+            super().close()
+
+
+# A class to stream images through color conversions
+class Images:
+    """
+    A class of helpers to recolor images row by row with `PPMReader`,
+    `PPMWriter`, `PNGReader` and `PNGWriter`
+    
+    NOTE: All methods in this class are `static` methods
+    
+    Usage:
+        Images.recolor('in.png', 'out.png', Images.grayscale)
+        Images.recolor('in.ppm', 'out.png', Images.hue_shift(180))
+    """
+
+    # A function to expand gray (and gray + alpha) rows to RGB (and RGBA)
+    @staticmethod
+    def _expand(row: typing.Union[bytes, bytearray], samples: int) -> bytearray:
+        """
+        Returns a gray (*samples* = 1) or gray + alpha (*samples* = 2)
+        row as an RGB or RGBA row
+        """
+
+        channels = 3 if samples == 1 else 4
+        gray = row[0::samples]
+        expanded = bytearray(channels * len(gray))
+        expanded[0::channels] = expanded[1::channels] = expanded[2::channels] = gray
+
+        if samples == 2:
+            expanded[3::4] = row[1::2]
+
+        return expanded
+
+    # A function to drop the alpha channel of an RGBA row
+    @staticmethod
+    def _drop_alpha(row: typing.Union[bytes, bytearray, memoryview]) -> bytearray:
+        row = memoryview(row).cast('B')
+        rgb = bytearray(3 * (len(row) // 4))
+        rgb[0::3], rgb[1::3], rgb[2::3] = row[0::4], row[1::4], row[2::4]
+
+        return rgb
+
+    # A function to open an image for reading
+    @staticmethod
+    def open(file: typing.Union[str, typing.BinaryIO]) -> typing.Union[PPMReader, PNGReader]:
+        """
+        Returns a `PNGReader` or a `PPMReader` depending on the
+        first bytes of *file* (a path or a seekable binary file object)
+        """
+
+        if hasattr(file, 'read'):
+            magic = file.read(2)
+            file.seek(-len(magic), 1)
+
+        else:
+            with open(file, 'rb') as handle:
+                magic = handle.read(2)
+
+        return PNGReader(file) if magic == b'\x89P' else PPMReader(file)
+
+    # A function to make a row function out of a pixel function
+    @staticmethod
+    def pixels(
+        function: typing.Callable[[int, int, int], typing.Tuple[int, int, int]],
+        cache_size: int = 1 << 16
+    ) -> typing.Callable:
+        """
+        Returns a function recoloring a row (in place) by calling
+        *function(red, green, blue) -> (red, green, blue)* once per
+        distinct color, the results being cached (up to *cache_size*
+        colors) across rows
+
+        The returned function takes a row and its number of channels
+        (3 or 4, alpha is kept as is) and returns the row
+        """
+
+        cache = {}
+
+        def recolor(row: bytearray, channels: int = 3) -> bytearray:
+            packed = _pack_rgb(row, channels)
+
+            if len(cache) > cache_size:
+                cache.clear()
+
+            for color in set(packed).difference(cache):
+                red, green, blue = function(color >> 16, color >> 8 & 255, color & 255)
+                cache[color] = (
+                    clamp(round(red), 0, 255) << 16
+                    | clamp(round(green), 0, 255) << 8
+                    | clamp(round(blue), 0, 255)
+                )
+
+            rgb = _unpack_rgb(_array('I', map(cache.__getitem__, packed)))
+            view = memoryview(row).cast('B')
+
+            for channel in range(3):
+                view[channel::channels] = rgb[channel::3]
+
+            return row
+
+        return recolor
+
+    # The row function of `grayscale`, made the first time it is used
+    _grayscale = None
+
+    # A function to convert a row to gray
+    @staticmethod
+    def grayscale(row: bytearray, channels: int = 3) -> bytearray:
+        """
+        Recolors a row (in place) to gray with the Y (luma) channel of
+        the YIQ color space, and returns it (see `pixels`)
+        """
+
+        if Images._grayscale is None:
+            Images._grayscale = Images.pixels(Images._gray)
+
+        return Images._grayscale(row, channels)
+
+    # A function to convert a color to its gray equivalent
+    @staticmethod
+    def _gray(
+        red: int, green: int, blue: int
+    ) -> typing.Tuple[int, int, int]:
+        luma = round(Converters.rgb2yiq(red, green, blue)[0] * 255)
+
+        return (luma, luma, luma)
+
+    # A function to make a hue shifting pixel function
+    @staticmethod
+    def hue_shift(degrees: typing.Union[int, float]) -> typing.Callable:
+        """
+        Returns a row function (see `pixels`) rotating the hue of
+        every pixel by *degrees* through the HSV color space
+        """
+
+        def shift(red: int, green: int, blue: int) -> typing.Tuple[int, int, int]:
+            hue, saturation, value = Converters.rgb2hsv(red, green, blue)
+
+            return Converters.hsv2rgb(hue + degrees, saturation, value)
+
+        return Images.pixels(shift)
+
+    # A function to copy an image through row functions
+    @staticmethod
+    def recolor(
+        source: typing.Union[str, typing.BinaryIO],
+        target: typing.Union[str, typing.BinaryIO],
+        *functions: typing.Callable,
+        png: typing.Optional[bool] = None
+    ) -> None:
+        """
+        Streams the image *source* into *target*, passing every row
+        through the row *functions* (like `Images.grayscale`) in order
+
+        *target* is written as a PNG image if *png* is True, or if *png*
+        is None and the *target* path ends with .png; as a PPM otherwise
+        """
+
+        if png is None:
+            png = isinstance(target, str) and target.lower().endswith('.png')
+
+        with Images.open(source) as reader:
+            writer_class = PNGWriter if png else PPMWriter
+            channels = reader.channels
+
+            with writer_class(target, reader.width, reader.height, channels) as writer:
+                for row in reader:
+                    for function in functions:
+                        row = function(row, channels)
+
+                    writer.write_row(row)
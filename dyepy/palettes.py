@@ -0,0 +1,1118 @@
+"""
+Colormaps, color histograms, palettes and `Dither`
+"""
+
+
+# Import `typing` for type-hinting
+import typing
+
+# Import `array` from `array` as `_array`
+from array import array as _array
+
+# Import `byteorder` from `sys` as `_byteorder`
+from sys import byteorder as _byteorder
+
+# Import `Counter` from `collections` as `_Counter`
+from collections import Counter as _Counter
+
+# Import `struct` as `_struct`
+import struct as _struct
+
+# Import `getpid`, `replace` and `stat` from `os` as `_getpid`, `_replace`
+# and `_stat`
+from os import getpid as _getpid, replace as _replace, stat as _stat
+
+# Import `bisect_left` from `bisect` as `_bisect_left`
+from bisect import bisect_left as _bisect_left
+
+# Import `repeat` from `itertools` as `_repeat`
+from itertools import repeat as _repeat
+
+# Import `add` and `mul` from `operator` as `_add` and `_mul`
+from operator import add as _add, mul as _mul
+
+# Import `json` and `csv` as `_json` and `_csv` (for palettes)
+import json as _json
+import csv as _csv
+
+from . import Styles, clamp
+from .arrays import _lut2
+from .converters import (
+    Colors, Converters, _XTERM, _pack_rgb, _packed, _unpack_rgb
+)
+
+
+# A class of precomputed colormaps (lookup tables) for scalar data
+class Colormap:
+    """
+    Colormap class
+
+    A lookup table (LUT) of *size* colors interpolated between the
+    color stops *colors* (Hex values), with its Hex values and ANSI
+    cells precomputed the first time they are used, so that mapping
+    scalar data (like the frames of a heatmap) never converts colors.
+    
+    E.g.:
+    heat = Colormap(Colormap.HEAT)
+    cells = apply_colormap(values, heat, 0, 100, 'ansi')
+    print(''.join(cells), Styles.RESET)
+    
+    *space* is the color space (registered to `Converters`) the stops
+    are interpolated in, RGB by default
+    """
+
+    # Color stops of the built-in colormaps
+    GRAYS = (Colors.BLACK, Colors.WHITE)
+    HEAT = ('#000000', '#800000', '#ff0000', '#ff8000', '#ffff00', '#ffffff')
+    COOLWARM = ('#3b4cc0', '#8db0fe', '#dddddd', '#f49a7b', '#b40426')
+    VIRIDIS = (
+        '#440154', '#482878', '#3e4989', '#31688e', '#26828e',
+        '#1f9e89', '#35b779', '#6ece58', '#b5de2b', '#fde725'
+    )
+
+    def __init__(
+        self,
+        colors: typing.Sequence[typing.Union[str, int]] = GRAYS,
+        size: int = 256,
+        space: str = 'rgb'
+    ) -> None:
+        if len(colors) < 2 or size < 2:
+            raise ValueError('A colormap needs at least 2 colors and 2 entries')
+
+        stops = Converters.convert_many(colors, 'hex', space)
+        to_rgb = Converters.resolve(space, 'rgb')
+        packed = _array('I')
+
+        for index in range(size):
+            position = index * (len(stops) - 1) / (size - 1)
+            stop = min(int(position), len(stops) - 2)
+            t = position - stop
+
+            red, green, blue = to_rgb(tuple(
+                a + (b - a) * t for a, b in zip(stops[stop], stops[stop + 1])
+            ))[:3]
+            packed.append(
+                clamp(round(red), 0, 255) << 16
+                | clamp(round(green), 0, 255) << 8
+                | clamp(round(blue), 0, 255)
+            )
+
+        self.packed = packed
+        self._hex = None
+        self._ansi = {}
+
+    @classmethod
+    def from_packed(cls, packed: typing.Iterable[int]) -> 'Colormap':
+        """
+        Returns a colormap using the packed 24-bit colors *packed* as is
+        """
+
+        colormap = cls.__new__(cls)
+        colormap.packed = _array('I', packed)
+        colormap._hex = None
+        colormap._ansi = {}
+
+        return colormap
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    @property
+    def hex(self) -> typing.List[str]:
+        """
+        Returns the Hex values of the colormap (built once)
+        """
+
+        if self._hex is None:
+            self._hex = Colors.rgb_many(self.packed)
+
+        return self._hex
+
+    def ansi(self, cell: str = ' ') -> typing.List[str]:
+        """
+        Returns the colormap as pre-rendered ANSI cells, i.e. *cell*
+        with each color of the colormap as background (built once per *cell*)
+        """
+
+        cells = self._ansi.get(cell)
+
+        if cells is None:
+            rgb = Styles.Background.rgb
+            cells = self._ansi[cell] = [
+                rgb(v >> 16, v >> 8 & 255, v & 255) + cell for v in self.packed
+            ]
+
+        return cells
+
+
+def apply_colormap(
+    values: typing.Iterable[typing.Union[int, float]],
+    lut: typing.Union[Colormap, typing.Sequence[int]],
+    vmin: typing.Optional[typing.Union[int, float]] = None,
+    vmax: typing.Optional[typing.Union[int, float]] = None,
+    output: str = 'packed',
+    cell: str = ' '
+) -> typing.Union[_array, typing.List[str]]:
+    """
+    Returns the colors of the scalar *values* through the colormap *lut*
+
+    The values are normalized from [*vmin*, *vmax*] (their own minimum
+    and maximum by default, values out of the range are clamped, and NaN
+    values get the first entry) to the entries of the LUT, and mapped in
+    a single pass of chained `map` calls. *output* is one of:
+        packed: an `array('I')` of packed 24-bit colors (0xRRGGBB)
+        hex: a list of Hex values
+        ansi: a list of ANSI cells (*cell* with the color as background)
+
+    *lut* is either a `Colormap` or a sequence of packed 24-bit colors
+    
+    E.g.: apply_colormap([0, 5, 10], Colormap(Colormap.HEAT), output='hex')
+    """
+
+    if not isinstance(values, (list, tuple, _array, memoryview)):
+        values = list(values)
+
+    if not isinstance(lut, Colormap):
+        lut = Colormap.from_packed(lut)
+
+    if output == 'packed':
+        table = lut.packed
+
+    elif output == 'hex':
+        table = lut.hex
+
+    elif output == 'ansi':
+        table = lut.ansi(cell)
+
+    else:
+        raise ValueError(f'Unknown output {output!r}')
+
+    if not len(values):
+        return _array('I') if output == 'packed' else []
+
+    # A NaN would break the minimum, maximum and the indices (NaN != NaN)
+    total = sum(values)
+    numbers = ([v for v in values if v == v] or [0]) if total != total else values
+    low, high = min(numbers), max(numbers)
+    vmin = low if vmin is None else vmin
+    vmax = high if vmax is None else vmax
+
+    # Out of range values would index out of (or from the end of) the table:
+    # min(vmax, max(vmin, v)) clamps them, NaN to vmin (NaN > vmin is False)
+    if total != total or low < vmin or high > vmax:
+        values = map(min, _repeat(vmax), map(max, _repeat(vmin), values))
+
+    scale = (len(table) - 1) / (vmax - vmin) if vmax > vmin else 0
+    offset = 0.5 - vmin * scale     # Rounds to the nearest entry
+
+    # Chained `map` calls of builtins, so no Python code runs per value
+    colors = map(table.__getitem__, map(int, map(
+        _add, _repeat(offset), map(_mul, _repeat(scale), values)
+    )))
+
+    return _array('I', colors) if output == 'packed' else list(colors)
+
+
+# A class to count the colors of (large) streams of pixels
+class ColorHistogram:
+    """
+    ColorHistogram class
+
+    A histogram of colors fed chunk by chunk (e.g. one image, or one
+    scanline, at a time), counting each color by its packed 24-bit
+    value (0xRRGGBB) so that no tuple is ever built per pixel.
+    
+    Histograms of different processes can be merged (they are small to
+    pickle) to compute statistics over millions of images in parallel.
+    
+    E.g.:
+    histogram = ColorHistogram()
+    histogram.update(rgb_bytes)
+    histogram.most_common(5) -> [('#ffffff', 1024), ...]
+    """
+
+    def __init__(
+        self,
+        pixels: typing.Optional[typing.Iterable] = None,
+        channels: int = 3
+    ) -> None:
+        self.counts = _Counter()
+
+        if pixels is not None:
+            self.update(pixels, channels)
+
+    # A function to count the colors of a chunk of pixels
+    def update(
+        self,
+        pixels: typing.Union[bytes, bytearray, memoryview, typing.Iterable],
+        channels: int = 3
+    ) -> 'ColorHistogram':
+        """
+        Counts the colors of *pixels* and returns the histogram itself
+
+        *pixels* is a buffer of interleaved 8-bit RGB values (RGBA if
+        *channels* is 4, the fastest), an iterable of (red, green, blue)
+        tuples or an iterable of packed 24-bit colors
+        """
+
+        if isinstance(pixels, (bytes, bytearray, memoryview)):
+            pixels = _pack_rgb(pixels, channels)
+
+        elif not isinstance(pixels, _array):
+            pixels = [
+                color if isinstance(color, int)
+                else color[0] << 16 | color[1] << 8 | color[2]
+                for color in pixels
+            ]
+
+        # `Counter.update` counts an iterable in C
+        self.counts.update(pixels)
+
+        return self
+
+    # A function to count the colors of many chunks of pixels
+    def feed(
+        self,
+        chunks: typing.Iterable,
+        channels: int = 3
+    ) -> 'ColorHistogram':
+        """
+        Counts the colors of every chunk of *chunks* (see `update`)
+        and returns the histogram itself
+        """
+
+        for chunk in chunks:
+            self.update(chunk, channels)
+
+        return self
+
+    # A function to merge another histogram into this one
+    def merge(self, *others: 'ColorHistogram') -> 'ColorHistogram':
+        """
+        Adds the counts of all the *others* histograms to this one
+        and returns the histogram itself
+        """
+
+        for other in others:
+            self.counts.update(other.counts)
+
+        return self
+
+    def __iadd__(self, other: 'ColorHistogram') -> 'ColorHistogram':
+        return self.merge(other)
+
+    def __add__(self, other: 'ColorHistogram') -> 'ColorHistogram':
+        return ColorHistogram().merge(self, other)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __getitem__(self, color: typing.Union[str, int]) -> int:
+        if isinstance(color, str):
+            red, green, blue = Converters.hex2rgb(color)
+            color = red << 16 | green << 8 | blue
+
+        return self.counts[color]
+
+    @property
+    def total(self) -> int:
+        """
+        Returns the number of pixels counted
+        """
+
+        return sum(self.counts.values())
+
+    # A function to get the most frequent colors
+    def most_common(
+        self,
+        count: typing.Optional[int] = None,
+        packed: bool = False
+    ) -> typing.List[typing.Tuple[typing.Union[str, int], int]]:
+        """
+        Returns the *count* most frequent colors (all of them if None)
+        with their counts, as Hex values or packed colors if *packed*
+        """
+
+        common = self.counts.most_common(count)
+
+        if packed or not common:
+            return common
+
+        colors, counts = zip(*common)
+
+        return list(zip(Colors.rgb_many(colors), counts))
+
+    # A function to bucket the colors by hue
+    def hues(
+        self,
+        bins: int = 36,
+        min_saturation: typing.Union[int, float] = 0,
+        min_value: typing.Union[int, float] = 0
+    ) -> typing.List[int]:
+        """
+        Returns the pixel counts of *bins* equal hue ranges (the first
+        bin starting at hue 0), computing the hue of each distinct color
+        once with `Converters.rgb2hsv`
+
+        Colors with a saturation below *min_saturation* or a value below
+        *min_value* (grays and near-blacks, whose hue is meaningless)
+        are left out
+        """
+
+        rgb2hsv = Converters.rgb2hsv
+        buckets = [0] * bins
+
+        for color, count in self.counts.items():
+            hue, saturation, value = rgb2hsv(
+                color >> 16, color >> 8 & 255, color & 255
+            )
+
+            if saturation < min_saturation or value < min_value:
+                continue
+
+            buckets[int(hue % 360 * bins / 360)] += count
+
+        return buckets
+
+    def __getstate__(self) -> typing.Tuple[bytes, bytes]:
+        # Two flat arrays pickle far smaller (and faster) than a dict
+        return (
+            _array('I', self.counts.keys()).tobytes(),
+            _array('Q', self.counts.values()).tobytes()
+        )
+
+    def __setstate__(self, state: typing.Tuple[bytes, bytes]) -> None:
+        colors, counts = _array('I'), _array('Q')
+        colors.frombytes(state[0])
+        counts.frombytes(state[1])
+
+        self.counts = _Counter(dict(zip(colors, counts)))
+
+
+class Palette:
+    """
+    A palette of named colors, loadable from X11 `rgb.txt`, JSON and
+    CSV files, with exact lookup, prefix search and nearest color queries
+    
+    Names are matched case-insensitively, ignoring spaces, dashes and
+    underscores ('Alice Blue', 'alice-blue' and 'AliceBlue' are the same).
+    
+    Usage:
+        palette = Palette.load('/usr/share/X11/rgb.txt', snapshot='rgb.dyepal')
+        palette['alice blue']          # '#f0f8ff'
+        palette.search('dark')         # [('DarkBlue', '#00008b'), ...]
+        palette.nearest('#0078d7')     # ('DodgerBlue3', '#1874cd')
+        Palette.register('x11', palette)
+        Palette.named('x11')
+    """
+
+    # The first bytes of a palette snapshot (see `to_bytes`)
+    SIGNATURE = b'DYEPAL\x00\x01'
+
+    # The registered palettes, by name (see `register` and `named`)
+    _registry = {}
+
+    def __init__(
+        self,
+        colors: typing.Union[
+            typing.Mapping[str, typing.Union[str, int, typing.Sequence[int]]],
+            typing.Iterable[typing.Tuple[str, typing.Union[str, int, typing.Sequence[int]]]]
+        ] = ()
+    ) -> None:
+        """
+        Makes a palette out of a mapping (or pairs) of names to colors
+        (Hex values, RGB tuples or packed 0xRRGGBB integers), the first
+        of every duplicated name being kept
+        """
+
+        if hasattr(colors, 'items'):
+            colors = colors.items()
+
+        entries = {}
+
+        for name, color in colors:
+            entries.setdefault(Palette._key(name), (name, Palette._color(color)))
+
+        keys = sorted(entries)
+        self._set(
+            keys,
+            [entries[key][0] for key in keys],
+            _array('I', [entries[key][1] for key in keys])
+        )
+
+    # A function to set the (sorted, parallel) arrays of the palette
+    def _set(
+        self,
+        keys: typing.List[str],
+        names: typing.List[str],
+        values: _array
+    ) -> None:
+        self._keys = keys
+        self._names = names
+        self._values = values
+        self._index = dict(zip(keys, range(len(keys))))
+        self._grid = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return Palette._key(name) in self._index
+
+    def __getitem__(self, name: str) -> str:
+        """
+        Returns the Hex value of the color *name*
+        """
+
+        try:
+            return Palette._hex(self._values[self._index[Palette._key(name)]])
+
+        except KeyError:
+            raise KeyError(name) from None
+
+    def __repr__(self) -> str:
+        return f'<Palette of {len(self)} colors>'
+
+    # A function to get a color by name, with a default
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        """
+        Returns the Hex value of the color *name*, *default* if unknown
+        """
+
+        index = self._index.get(Palette._key(name))
+
+        return default if index is None else Palette._hex(self._values[index])
+
+    # A function to get the named colors of the palette
+    def items(self) -> typing.List[typing.Tuple[str, str]]:
+        """
+        Returns the (name, Hex value) pairs of the palette, sorted by name
+        """
+
+        return list(zip(self._names, map(Palette._hex, self._values)))
+
+    # A function to find the colors with names starting with a prefix
+    def search(
+        self, prefix: str, limit: typing.Optional[int] = None
+    ) -> typing.List[typing.Tuple[str, str]]:
+        """
+        Returns the (name, Hex value) pairs of (up to *limit*) colors
+        whose names start with *prefix*, sorted by name
+        """
+
+        prefix = Palette._key(prefix)
+        keys = self._keys
+        start = end = _bisect_left(keys, prefix)
+        stop = len(keys) if limit is None else min(len(keys), start + limit)
+
+        while end < stop and keys[end].startswith(prefix):
+            end += 1
+
+        return [
+            (self._names[index], Palette._hex(self._values[index]))
+            for index in range(start, end)
+        ]
+
+    # A function to find the closest color of the palette
+    def nearest(
+        self, color: typing.Union[str, int, typing.Sequence[int]]
+    ) -> typing.Optional[typing.Tuple[str, str]]:
+        """
+        Returns the (name, Hex value) pair of the color of the palette
+        closest to *color* (by RGB euclidean distance), None if empty
+
+        The colors are bucketed in a coarse 8×8×8 grid (built on the
+        first query), searched in growing shells around the cell of
+        *color* until no closer color can be left
+        """
+
+        if not self._keys:
+            return None
+
+        if self._grid is None:
+            grid = {}
+
+            for index, value in enumerate(self._values):
+                cell = value >> 21 << 6 | value >> 10 & 56 | value >> 5 & 7
+                grid.setdefault(cell, []).append(index)
+
+            self._grid = grid
+
+        packed = Palette._color(color)
+        red, green, blue = packed >> 16, packed >> 8 & 255, packed & 255
+        x, y, z = red >> 5, green >> 5, blue >> 5
+        values, grid = self._values, self._grid
+        best, best_index = 1 << 20, -1
+
+        for shell in range(8):
+            for i in range(max(x - shell, 0), min(x + shell, 7) + 1):
+                for j in range(max(y - shell, 0), min(y + shell, 7) + 1):
+                    for k in range(max(z - shell, 0), min(z + shell, 7) + 1):
+                        if max(abs(i - x), abs(j - y), abs(k - z)) != shell:
+                            continue
+
+                        for index in grid.get(i << 6 | j << 3 | k, ()):
+                            value = values[index]
+                            distance = (
+                                ((value >> 16) - red) ** 2
+                                + ((value >> 8 & 255) - green) ** 2
+                                + ((value & 255) - blue) ** 2
+                            )
+
+                            if distance < best:
+                                best, best_index = distance, index
+
+            # Colors in the next shells differ by more than 32 * shell
+            # in at least one channel
+            if best_index >= 0 and best <= (32 * shell) ** 2:
+                break
+
+        return (self._names[best_index], Palette._hex(values[best_index]))
+
+    # A function to normalize a color name
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.lower().replace(' ', '').replace('-', '').replace('_', '')
+
+    # A function to format a packed color as a Hex value
+    @staticmethod
+    def _hex(value: int) -> str:
+        return f'#{value:06x}'
+
+    # A function to parse a color of a palette file to 0xRRGGBB
+    @staticmethod
+    def _color(color: typing.Union[str, int, typing.Sequence[int]]) -> int:
+        """
+        Returns the packed value of *color*: a Hex value (with or
+        without '#'), an 'r, g, b' (or 'r g b') string, an RGB tuple
+        or a packed integer
+        """
+
+        if isinstance(color, str):
+            text = color.strip()
+
+            if ',' in text or ' ' in text:
+                color = tuple(int(part) for part in text.replace(',', ' ').split())
+
+            else:
+                text = text.replace('0x', '#')
+                return _packed(text if text.startswith('#') else '#' + text)
+
+        packed = _packed(color)
+
+        if not 0 <= packed <= 0xffffff:
+            raise ValueError(f'Invalid color {color!r}')
+
+        return packed
+
+    # A function to parse the lines of an X11 `rgb.txt` file
+    @staticmethod
+    def parse_x11(lines: typing.Iterable[str]) -> 'Palette':
+        """
+        Returns the palette of the lines of an X11 `rgb.txt` file,
+        'red green blue name' lines where '!' starts comments
+        """
+
+        pairs = []
+
+        for line in lines:
+            line = line.strip()
+
+            if not line or line.startswith('!'):
+                continue
+
+            red, green, blue, name = line.split(None, 3)
+            pairs.append((name, (int(red), int(green), int(blue))))
+
+        return Palette(pairs)
+
+    # A function to parse a JSON palette
+    @staticmethod
+    def parse_json(text: typing.Union[str, bytes]) -> 'Palette':
+        """
+        Returns the palette of a JSON document, either an object of
+        names to colors, or a list (possibly under a "colors" key, like
+        the xkcd color survey) of [name, color] pairs or of objects with
+        a "name" (or "color") and a "hex" (or "value") key
+        """
+
+        data = _json.loads(text)
+
+        if isinstance(data, dict) and isinstance(data.get('colors'), list):
+            data = data['colors']
+
+        if isinstance(data, dict):
+            return Palette(data)
+
+        pairs = []
+
+        for entry in data:
+            if isinstance(entry, dict):
+                name = entry['name'] if 'name' in entry else entry['color']
+                pairs.append((name, entry['hex'] if 'hex' in entry else entry['value']))
+
+            else:
+                pairs.append(tuple(entry))
+
+        return Palette(pairs)
+
+    # A function to parse the rows of a CSV palette
+    @staticmethod
+    def parse_csv(lines: typing.Iterable[str]) -> 'Palette':
+        """
+        Returns the palette of CSV rows of 'name,color' (any color
+        `Palette` understands) or 'name,red,green,blue', a header row
+        being skipped when its color does not parse
+        """
+
+        pairs = []
+
+        for number, row in enumerate(_csv.reader(lines)):
+            if not row or not row[0].strip():
+                continue
+
+            color = row[1] if len(row) == 2 else tuple(int(part) for part in row[1:4])
+
+            try:
+                pairs.append((row[0].strip(), Palette._color(color)))
+
+            except ValueError:
+                if number:
+                    raise
+
+        return Palette(pairs)
+
+    # A function to load a palette file, through a compiled snapshot
+    @staticmethod
+    def load(
+        path: str,
+        format: typing.Optional[str] = None,
+        snapshot: typing.Optional[str] = None
+    ) -> 'Palette':
+        """
+        Returns the palette of the file *path*, in the *format* 'x11',
+        'json' or 'csv' (guessed from the extension if None, X11 being
+        the default)
+
+        If *snapshot* is the path of a snapshot file (see `to_bytes`),
+        it is read instead of *path* when it is newer, and (re)written
+        after parsing *path* otherwise, so that only the first load of
+        a large palette pays for the text parsing
+        """
+
+        if snapshot is not None:
+            try:
+                if _stat(snapshot).st_mtime >= _stat(path).st_mtime:
+                    with open(snapshot, 'rb') as file:
+                        return Palette.from_bytes(file.read())
+
+            except (OSError, ValueError):
+                pass
+
+        if format is None:
+            format = path.rsplit('.', 1)[-1].lower()
+            format = format if format in ('json', 'csv') else 'x11'
+
+        with open(path, encoding='utf-8', newline='') as file:
+            if format == 'json':
+                palette = Palette.parse_json(file.read())
+
+            elif format == 'csv':
+                palette = Palette.parse_csv(file)
+
+            elif format == 'x11':
+                palette = Palette.parse_x11(file)
+
+            else:
+                raise ValueError(f'Unknown palette format {format!r}')
+
+        if snapshot is not None:
+            # A temporary file per process, so that processes compiling the
+            # same snapshot at once never publish a mix of their writes
+            temporary = f'{snapshot}.{_getpid()}.tmp'
+
+            try:
+                with open(temporary, 'wb') as file:
+                    file.write(palette.to_bytes())
+
+                _replace(temporary, snapshot)
+
+            except OSError:     # A read-only snapshot location only costs speed
+                pass
+
+        return palette
+
+    # A function to compile the palette to bytes
+    def to_bytes(self) -> bytes:
+        """
+        Returns the snapshot of the palette: the signature, the number
+        of colors and the size of the names, the packed colors (as
+        little endian 32-bit integers), then the normalized and the
+        original names (newline separated), all already sorted
+        """
+
+        values = _array('I', self._values)
+
+        if _byteorder == 'big':
+            values.byteswap()
+
+        keys = '\n'.join(self._keys).encode()
+
+        return b''.join((
+            Palette.SIGNATURE,
+            _struct.pack('<II', len(values), len(keys)),
+            values.tobytes(),
+            keys,
+            b'\n',
+            '\n'.join(self._names).encode()
+        ))
+
+    # A function to load a palette from its compiled bytes
+    @staticmethod
+    def from_bytes(data: typing.Union[bytes, bytearray, memoryview]) -> 'Palette':
+        """
+        Returns the palette of a snapshot made by `to_bytes`
+        """
+
+        data = memoryview(data)
+        start = len(Palette.SIGNATURE) + 8
+
+        if bytes(data[:len(Palette.SIGNATURE)]) != Palette.SIGNATURE:
+            raise ValueError('Not a palette snapshot')
+
+        count, size = _struct.unpack_from('<II', data, len(Palette.SIGNATURE))
+        values = _array('I')
+        values.frombytes(data[start:start + 4 * count])
+
+        if _byteorder == 'big':
+            values.byteswap()
+
+        start += 4 * count
+        keys = str(data[start:start + size], 'utf-8').split('\n') if count else []
+        names = str(data[start + size + 1:], 'utf-8').split('\n') if count else []
+
+        if len(keys) != count or len(names) != count:
+            raise ValueError('Truncated palette snapshot')
+
+        palette = Palette.__new__(Palette)
+        palette._set(keys, names, values)
+
+        return palette
+
+    # A function to register a palette by name
+    @staticmethod
+    def register(name: str, palette: 'Palette') -> None:
+        """
+        Registers *palette* as *name* (see `named`)
+        """
+
+        Palette._registry[name.lower()] = palette
+
+    # A function to get a registered palette
+    @staticmethod
+    def named(name: str) -> 'Palette':
+        """
+        Returns the palette registered as *name*; 'colors' (the
+        constants of `Colors`) is always available
+        """
+
+        name = name.lower()
+
+        if name == 'colors' and name not in Palette._registry:
+            Palette._registry[name] = Palette(
+                (attribute, value) for attribute, value in vars(Colors).items()
+                if attribute.isupper() and isinstance(value, str)
+            )
+
+        try:
+            return Palette._registry[name]
+
+        except KeyError:
+            raise KeyError(f'Unknown palette {name!r}') from None
+
+
+# The palette index of the colors closest to 5-bit quantized RGB colors,
+# computed the first time they are looked up
+class _Nearest(dict):
+    def __init__(self, colors: typing.Sequence[int]) -> None:
+        super().__init__()
+        self._colors = [(color >> 16, color >> 8 & 255, color & 255) for color in colors]
+
+    def __missing__(self, key: int) -> int:
+        # Look up from the center of the 8×8×8 cell of *key*
+        red, green, blue = (key >> 16 | 4), (key >> 8 & 248 | 4), (key & 248 | 4)
+        best, index = 1 << 20, 0
+
+        for position, (r, g, b) in enumerate(self._colors):
+            distance = (r - red) ** 2 + (g - green) ** 2 + (b - blue) ** 2
+
+            if distance < best:
+                best, index = distance, position
+
+        self[key] = index
+
+        return index
+
+
+# A class to dither rows of pixels to a limited palette
+class Dither:
+    """
+    A row by row ditherer of RGB(A) pixels to the 256 or 16 color
+    palettes of terminals (see `Styles.Fg.n`), or to any palette of up
+    to 256 colors, either by error diffusion (Floyd–Steinberg, with a
+    single row of errors) or with an ordered (Bayer) threshold matrix
+    
+    Rows are dithered in order, from the first one to the last one
+    (call `reset` before the first row of another image), to palette
+    codes (`codes`), to ANSI cells (`ansi`) or, as a row function, to
+    the palette colors themselves (see `Images.pixels`).
+    
+    Usage:
+        dither = Dither(256, 'bayer')
+        for row in Images.open('photo.png'):
+            print(dither.ansi(row) + Styles.RESET)
+
+        Images.recolor('photo.png', 'gif-like.png', Dither(16))
+    """
+
+    METHODS = ('floyd-steinberg', 'bayer')
+
+    def __init__(
+        self,
+        palette: typing.Union[int, typing.Sequence[typing.Union[str, int, typing.Sequence[int]]]] = 256,
+        method: str = 'floyd-steinberg',
+        size: int = 4,
+        spread: typing.Optional[typing.Union[int, float]] = None
+    ) -> None:
+        """
+        Makes a ditherer to *palette*: 256 (the xterm color cube and
+        grays, codes 16 to 255), 16 (the system colors, codes 0 to 15)
+        or a sequence of up to 256 colors (codes being their positions)
+
+        *size* is the size of the Bayer matrix (a power of 2), and
+        *spread* the amplitude of its thresholds (by default the
+        average distance between the levels of the palette)
+        """
+
+        if method not in Dither.METHODS:
+            raise ValueError(f'Unknown dithering method {method!r}')
+
+        if palette == 256:
+            colors, codes = _XTERM[16:], range(16, 256)
+
+        elif palette == 16:
+            colors, codes = _XTERM[:16], range(16)
+
+        else:
+            colors = [_packed(color) for color in palette]
+            codes = range(len(colors))
+
+        if not 0 < len(colors) <= 256:
+            raise ValueError('expected a palette of 1 to 256 colors')
+
+        if size < 1 or size & (size - 1):
+            raise ValueError(f'invalid Bayer matrix size {size!r}')
+
+        self.method = method
+        self.size = size
+        self.spread = 256 / round(len(colors) ** (1 / 3)) if spread is None else spread
+        self.colors = _array('I', colors)
+        self.palette = palette if palette in (16, 256) else None
+        self._codes = bytes(codes) + bytes(256 - len(codes))
+        self._nearest = _Nearest(self.colors)
+        self._matrix = Dither.bayer(size)
+        self._table = None
+        self._thresholds = {}
+        self._cells = None
+        self.reset()
+
+    # A function to start dithering another image
+    def reset(self) -> None:
+        """
+        Makes the next row the first row of an image
+        """
+
+        self._row = 0
+        self._errors = None
+
+    # A function to make a Bayer threshold matrix
+    @staticmethod
+    def bayer(size: int) -> typing.List[typing.List[int]]:
+        """
+        Returns the *size*×*size* Bayer matrix (a power of 2) of the
+        thresholds 0 to size² - 1
+        """
+
+        matrix = [[0]]
+
+        while len(matrix) < size:
+            half = len(matrix)
+            matrix = [
+                [4 * matrix[y % half][x % half] + (0, 2, 3, 1)[(y // half) * 2 + x // half]
+                 for x in range(2 * half)]
+                for y in range(2 * half)
+            ]
+
+        return matrix
+
+    # A function to dither a row to positions in the palette
+    def _positions(self, row: typing.Union[bytes, bytearray, memoryview], channels: int) -> bytes:
+        view = memoryview(row).cast('B')
+        width = len(view) // channels
+        y = self._row
+        self._row += 1
+
+        if self.method == 'bayer':
+            return self._ordered(view, width, channels, y)
+
+        return self._diffuse(view, width, channels)
+
+    # A function to dither a row with the Bayer matrix
+    def _ordered(self, view: memoryview, width: int, channels: int, y: int) -> bytes:
+        """
+        Returns the palette positions of a row, every channel being
+        offset by its threshold and cut to 5 bits through a 65536-entry
+        table (see `_lut2`), then looked up in the nearest color cache
+        """
+
+        size = self.size
+
+        if self._table is None:
+            levels = size * size
+            offsets = [
+                round(((threshold + 0.5) / levels - 0.5) * self.spread)
+                for threshold in range(256)
+            ]
+            self._table = [
+                clamp(value + offsets[threshold], 0, 255) & 248
+                for value in range(256) for threshold in range(256)
+            ]
+
+        thresholds = self._thresholds.get((y % size, width))
+
+        if thresholds is None:
+            line = bytes(self._matrix[y % size])
+            thresholds = self._thresholds[y % size, width] = (line * (width // size + 1))[:width]
+
+        rgb = bytearray(3 * width)
+
+        for channel in range(3):
+            rgb[channel::3] = _lut2(self._table, view[channel:channels * width:channels], thresholds)
+
+        return bytes(map(self._nearest.__getitem__, _pack_rgb(rgb)))
+
+    # A function to dither a row by error diffusion
+    def _diffuse(self, view: memoryview, width: int, channels: int) -> bytearray:
+        """
+        Returns the palette positions of a row, diffusing the error of
+        every pixel to its right (7/16) and to the three pixels below
+        it (3/16, 5/16 and 1/16) in a single row of errors (in 16ths):
+        the errors below a pixel replace the ones it received once it
+        is done
+        """
+
+        errors = self._errors
+
+        if errors is None or len(errors) != 3 * width:
+            errors = self._errors = [0] * (3 * width)
+
+        nearest, colors = self._nearest, self.colors
+        positions = bytearray(width)
+        right = [0, 0, 0]
+        carry = [0, 0, 0, 0, 0, 0]      # Errors below x - 1 and below x, per channel
+        index = 0
+
+        for x in range(width):
+            pixel = view[x * channels:x * channels + 3]
+            key = 0
+            wanted = []
+
+            for channel in range(3):
+                value = pixel[channel] + ((errors[index + channel] + right[channel] + 8) >> 4)
+                value = 0 if value < 0 else 255 if value > 255 else value
+                wanted.append(value)
+                key = key << 8 | (value & 248)
+
+            position = nearest[key]
+            positions[x] = position
+            color = colors[position]
+            color = (color >> 16, color >> 8 & 255, color & 255)
+
+            for channel in range(3):
+                error = wanted[channel] - color[channel]
+                right[channel] = 7 * error
+                below = carry[channel]
+
+                if x:
+                    errors[index - 3 + channel] = below + 3 * error
+
+                carry[channel] = carry[3 + channel] + 5 * error
+                carry[3 + channel] = error
+
+            index += 3
+
+        if width:
+            errors[index - 3:index] = carry[:3]
+
+        return positions
+
+    # A function to dither a row to palette codes
+    def codes(self, row: typing.Union[bytes, bytearray, memoryview], channels: int = 3) -> bytes:
+        """
+        Returns the palette codes (see `Styles.Fg.n`) of the next row
+        of RGB (*channels* = 3) or RGBA (*channels* = 4) pixels
+        """
+
+        return self._positions(row, channels).translate(self._codes)
+
+    # A function to dither a row to ANSI cells
+    def ansi(
+        self,
+        row: typing.Union[bytes, bytearray, memoryview],
+        channels: int = 3,
+        cell: str = ' '
+    ) -> str:
+        """
+        Returns the next row as *cell*s on the dithered background
+        colors (with 16-color codes on the 16 color palette, so that
+        it also works on terminals without 256 colors)
+        """
+
+        if self._cells is None:
+            if self.palette == 16:
+                self._cells = [f'\x1b[{40 + code if code < 8 else 92 + code}m' for code in range(256)]
+
+            else:
+                self._cells = [Styles.Bg.n(code) for code in range(256)]
+
+        cells = self._cells
+        out = []
+        previous = -1
+
+        for code in self.codes(row, channels):
+            if code != previous:
+                out.append(cells[code])
+                previous = code
+
+            out.append(cell)
+
+        return ''.join(out)
+
+    # A function to dither a row to the palette colors (in place)
+    def __call__(self, row: bytearray, channels: int = 3) -> bytearray:
+        """
+        Recolors the next row (in place) to the dithered palette colors
+        and returns it, so a `Dither` is a row function of `Images.recolor`
+        """
+
+        positions = self._positions(row, channels)
+        rgb = _unpack_rgb(_array('I', map(self.colors.__getitem__, positions)))
+        view = memoryview(row).cast('B')
+
+        for channel in range(3):
+            view[channel::channels] = rgb[channel::3]
+
+        return row
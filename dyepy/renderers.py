@@ -0,0 +1,887 @@
+"""
+Command-line renderers: `Screen`, tweens and progress widgets
+"""
+
+
+# Import `typing` for type-hinting
+import typing
+
+# Import `array` from `array` as `_array`
+from array import array as _array
+
+# Import `deque` from `collections` as `_deque`
+from collections import deque as _deque
+
+# Import `monotonic` from `time` as `_monotonic` (for progress bars)
+from time import monotonic as _monotonic
+
+# Import `Lock` and `Timer` from `threading` as `_Lock` and `_Timer`
+from threading import Lock as _Lock, Timer as _Timer
+
+# Import `cos` and `pi` from `math` as `_cos` and `_pi`
+from math import cos as _cos, pi as _pi
+
+from . import Styles
+from .converters import Converters, _packed
+from .palettes import Colormap
+
+
+# A class to draw on a command-line, redrawing only what changed
+class Screen:
+    """
+    Screen class
+
+    A double-buffered grid of *width* × *height* cells, each with a
+    character, a foreground and a background color and attributes.
+    Drawing only changes the buffers; `render` returns the escape
+    sequences turning the previous frame into the current one, moving
+    the cursor and changing colors/attributes only where cells differ.
+    
+    E.g.:
+    screen = Screen(80, 24)
+    screen.put(0, 0, 'CPU', fg=Colors.WHITE, bg=(0, 120, 215), attrs=Screen.BOLD)
+    sys.stdout.write(screen.render())
+    
+    Colors are Hex values, (red, green, blue) tuples, packed 24-bit
+    integers or None for the default color of the command-line
+    """
+
+    # Attributes (combine them with |), in the order of their SGR codes
+    BOLD = 1 << 0
+    DISABLE = 1 << 1
+    ITALIC = 1 << 2
+    UNDERLINE = 1 << 3
+    SLOWBLINK = 1 << 4
+    RAPIDBLINK = 1 << 5
+    REVERSE = 1 << 6
+    INVISIBLE = 1 << 7
+    STRIKETHROUGH = 1 << 8
+
+    def __init__(self, width: int = 80, height: int = 24) -> None:
+        self.width, self.height = width, height
+
+        size = width * height
+        self.chars = [' '] * size
+        self.fg = _array('l', [-1]) * size
+        self.bg = _array('l', [-1]) * size
+        self.attrs = _array('H', [0]) * size
+
+        # The frame on the command-line, None until the first render
+        self._chars = None
+        self._fg = self._bg = self._attrs = None
+
+        # Cursor position and colors/attributes on the command-line
+        self._cursor = None
+        self._pen = None
+
+        # SGR parameters of the colors used so far
+        self._sgr_fg = {-1: '39'}
+        self._sgr_bg = {-1: '49'}
+
+    # A function to write text on the screen
+    def put(
+        self,
+        x: int,
+        y: int,
+        text: str,
+        fg: typing.Union[str, int, typing.Sequence[int], None] = None,
+        bg: typing.Union[str, int, typing.Sequence[int], None] = None,
+        attrs: int = 0
+    ) -> None:
+        """
+        Writes *text* from the cell (*x*, *y*) onwards (clipped at the
+        end of the row) with the colors *fg*/*bg* and the attributes *attrs*
+        """
+
+        if not 0 <= y < self.height or x >= self.width:
+            return
+
+        if x < 0:
+            text, x = text[-x:], 0
+
+        text = text[:self.width - x]
+        start = y * self.width + x
+        end = start + len(text)
+        count = len(text)
+
+        self.chars[start:end] = text
+        self.fg[start:end] = _array('l', [_packed(fg)]) * count
+        self.bg[start:end] = _array('l', [_packed(bg)]) * count
+        self.attrs[start:end] = _array('H', [attrs]) * count
+
+    # A function to fill a rectangle of the screen
+    def fill(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        char: str = ' ',
+        fg: typing.Union[str, int, typing.Sequence[int], None] = None,
+        bg: typing.Union[str, int, typing.Sequence[int], None] = None,
+        attrs: int = 0
+    ) -> None:
+        """
+        Fills the rectangle of *width* × *height* cells at (*x*, *y*)
+        with *char* in the colors *fg*/*bg* and the attributes *attrs*
+        """
+
+        for row in range(max(y, 0), min(y + height, self.height)):
+            self.put(x, row, char * width, fg, bg, attrs)
+
+    # A function to clear the screen
+    def clear(
+        self,
+        bg: typing.Union[str, int, typing.Sequence[int], None] = None
+    ) -> None:
+        """
+        Fills the whole screen with blanks in the background color *bg*
+        """
+
+        self.fill(0, 0, self.width, self.height, ' ', None, bg)
+
+    # A function to force the next render to redraw everything
+    def invalidate(self) -> None:
+        """
+        Forgets the frame on the command-line, e.g. after it was resized
+        or written to by something else, so the next render redraws it all
+        """
+
+        self._chars = None
+
+    # A function to get the SGR sequence changing the pen to a cell's style
+    def _sgr(self, fg: int, bg: int, attrs: int) -> str:
+        """
+        Returns the SGR sequence switching from the current pen to
+        (*fg*, *bg*, *attrs*) and makes it the current pen
+        """
+
+        params = []
+
+        if self._pen is None or self._pen[2] & ~attrs:
+            # Attributes can only be turned off all at once
+            params.append('0')
+            old_fg = old_bg = -1
+            old_attrs = 0
+
+        else:
+            old_fg, old_bg, old_attrs = self._pen
+
+        added = attrs & ~old_attrs
+        code = 1
+
+        while added:
+            if added & 1:
+                params.append(str(code))
+
+            added >>= 1
+            code += 1
+
+        if fg != old_fg:
+            sgr = self._sgr_fg.get(fg)
+
+            if sgr is None:
+                sgr = self._sgr_fg[fg] = f'38;2;{fg >> 16};{fg >> 8 & 255};{fg & 255}'
+
+            params.append(sgr)
+
+        if bg != old_bg:
+            sgr = self._sgr_bg.get(bg)
+
+            if sgr is None:
+                sgr = self._sgr_bg[bg] = f'48;2;{bg >> 16};{bg >> 8 & 255};{bg & 255}'
+
+            params.append(sgr)
+
+        self._pen = (fg, bg, attrs)
+
+        return f'\x1b[{";".join(params)}m' if params else ''
+
+    # A function to render the changes since the previous frame
+    def render(self) -> str:
+        """
+        Returns the escape sequences and characters turning the frame on
+        the command-line into the current one (everything on the first
+        render), and makes the current frame the previous one
+        """
+
+        width = self.width
+        chars, fgs, bgs, attrs = self.chars, self.fg, self.bg, self.attrs
+        full = self._chars is None
+        out = []
+
+        if full:
+            out.append('\x1b[0m\x1b[H')
+            self._pen = (-1, -1, 0)
+            self._cursor = 0
+
+        previous = (self._chars, self._fg, self._bg, self._attrs)
+        pen = self._pen
+        cursor = self._cursor
+
+        for y in range(self.height):
+            start, end = y * width, (y + 1) * width
+
+            # Rows are compared in C first, most rows don't change at all
+            if not full and (
+                chars[start:end] == previous[0][start:end]
+                and fgs[start:end] == previous[1][start:end]
+                and bgs[start:end] == previous[2][start:end]
+                and attrs[start:end] == previous[3][start:end]
+            ):
+                continue
+
+            for index in range(start, end):
+                style = (fgs[index], bgs[index], attrs[index])
+                char = chars[index]
+
+                if not full and (
+                    char == previous[0][index] and style[0] == previous[1][index]
+                    and style[1] == previous[2][index] and style[2] == previous[3][index]
+                ):
+                    continue
+
+                if cursor != index:
+                    out.append(f'\x1b[{y + 1};{index - start + 1}H')
+
+                if style != pen:
+                    self._pen = pen
+                    out.append(self._sgr(*style))
+                    pen = style
+
+                out.append(char)
+
+                # The cursor stays on the last column at the end of a row
+                cursor = index + 1 if index + 1 < end else None
+
+        self._pen = pen
+        self._cursor = cursor
+
+        if full:
+            self._chars = list(chars)
+            self._fg, self._bg, self._attrs = _array('l', fgs), _array('l', bgs), _array('H', attrs)
+
+        else:
+            self._chars[:] = chars
+            self._fg[:] = fgs
+            self._bg[:] = bgs
+            self._attrs[:] = attrs
+
+        return ''.join(out)
+
+
+# A class of precomputed color transitions
+class Tween:
+    """
+    A transition between two colors over a number of frames, with every
+    frame precomputed once as a Hex value
+    
+    Identical transitions (same colors, frames, easing and color space)
+    are shared, so animating hundreds of widgets the same way computes
+    a single table, and getting a frame is a tuple lookup.
+    
+    Usage:
+        fade = Tween(Colors.BLACK, Colors.WINDOWSBLUE, 30, 'ease-out', 'hsl')
+        fade[0], fade[15], fade[29]   # Hex values, fade[100] == fade[29]
+        button.configure(bg=fade[frame])
+    """
+
+    # Easing curves, mapping the progress 0 to 1 to the progress of the color
+    EASINGS = {
+        'linear': lambda t: t,
+        'ease-in': lambda t: t * t,
+        'ease-out': lambda t: t * (2 - t),
+        'ease-in-out': lambda t: t * t * (3 - 2 * t),
+        'ease-in-cubic': lambda t: t ** 3,
+        'ease-out-cubic': lambda t: 1 - (1 - t) ** 3,
+        'ease-in-out-cubic': lambda t: 4 * t ** 3 if t < 0.5 else 1 - (2 - 2 * t) ** 3 / 2,
+        'sine': lambda t: (1 - _cos(_pi * t)) / 2,
+    }
+
+    # Color spaces whose first channel is a hue (in degrees)
+    HUES = ('hsv', 'hsl')
+
+    # The most shared tables (all of them are forgotten past it)
+    CACHE_SIZE = 4096
+
+    # The shared transitions, by (start, end, frames, easing, space)
+    _cache = {}
+
+    __slots__ = ('start', 'end', 'frames', 'easing', 'space', 'colors')
+
+    def __new__(
+        cls,
+        start: typing.Union[str, int, typing.Sequence[int]],
+        end: typing.Union[str, int, typing.Sequence[int]],
+        frames: int = 30,
+        easing: str = 'ease-in-out',
+        space: str = 'rgb'
+    ) -> 'Tween':
+        """
+        Returns the transition from the color *start* to *end* (Hex
+        values, RGB tuples or packed colors) in *frames* frames (both
+        colors included), following the *easing* curve (one of
+        `Tween.EASINGS`) through the color space *space* (registered
+        to `Converters`, hues going the shortest way around)
+        """
+
+        key = (_packed(start), _packed(end), frames, easing, space)
+        tween = Tween._cache.get(key)
+
+        if tween is None:
+            if frames < 1:
+                raise ValueError(f'invalid number of frames {frames!r}')
+
+            try:
+                curve = Tween.EASINGS[easing]
+
+            except KeyError:
+                raise ValueError(f'Unknown easing {easing!r}') from None
+
+            if len(Tween._cache) >= Tween.CACHE_SIZE:
+                Tween._cache.clear()
+
+            tween = object.__new__(Tween)
+            tween.start, tween.end, tween.frames, tween.easing, tween.space = key
+            tween.colors = Tween._table(key[0], key[1], frames, curve, space)
+            Tween._cache[key] = tween
+
+        return tween
+
+    # A function to compute the frames of a transition
+    @staticmethod
+    def _table(
+        start: int,
+        end: int,
+        frames: int,
+        curve: typing.Callable[[float], float],
+        space: str
+    ) -> typing.Tuple[str, ...]:
+        first = Converters.convert(f'#{start:06x}', 'hex', space)
+        last = Converters.convert(f'#{end:06x}', 'hex', space)
+        to_hex = Converters.resolve(space, 'hex')
+
+        if space in Tween.HUES:
+            turn = (last[0] - first[0] + 180) % 360 - 180
+            last = (first[0] + turn, *last[1:])
+
+        colors = []
+
+        for frame in range(frames):
+            t = curve(frame / (frames - 1)) if frames > 1 else 1
+            value = tuple(a + (b - a) * t for a, b in zip(first, last))
+
+            if space in Tween.HUES:
+                value = (value[0] % 360, *value[1:])
+
+            colors.append(to_hex(value))
+
+        return tuple(colors)
+
+    def __len__(self) -> int:
+        return self.frames
+
+    def __getitem__(self, frame: int) -> str:
+        """
+        Returns the Hex value of the frame *frame*, the last one for
+        frames past the end (and the first one for negative frames)
+        """
+
+        if frame >= self.frames:
+            return self.colors[-1]
+
+        return self.colors[frame if frame > 0 else 0]
+
+    def __repr__(self) -> str:
+        return (
+            f'Tween({self.colors[0]!r}, {self.colors[-1]!r}, {self.frames}, '
+            f'{self.easing!r}, {self.space!r})'
+        )
+
+    def __reduce__(self) -> tuple:
+        return (Tween, (self.start, self.end, self.frames, self.easing, self.space))
+
+
+# A class to run many color transitions frame by frame
+class TweenScheduler:
+    """
+    A scheduler of color transitions (`Tween`s) of many targets (like
+    widgets), advanced one frame at a time by `step`, which returns
+    only the targets whose color changes on that frame
+    
+    Usage:
+        scheduler = TweenScheduler()
+        for button in buttons:
+            scheduler.add(button, Tween(Colors.BLACK, Colors.WHITE, 30))
+
+        def tick():
+            for button, color in scheduler.step():
+                button.configure(bg=color)
+
+            root.after(16, tick)
+    """
+
+    def __init__(self) -> None:
+        self.frame = 0
+        self._animations = {}
+
+    def __len__(self) -> int:
+        return len(self._animations)
+
+    def __contains__(self, target: typing.Hashable) -> bool:
+        return target in self._animations
+
+    # A function to animate a target
+    def add(
+        self,
+        target: typing.Hashable,
+        tween: Tween,
+        delay: int = 0,
+        loop: bool = False
+    ) -> None:
+        """
+        Animates *target* through *tween* starting *delay* frames
+        after the current one (forever if *loop*), replacing its
+        current animation if any
+        """
+
+        self._animations[target] = [tween.colors, self.frame + delay, loop, None]
+
+    # A function to stop animating a target
+    def cancel(self, target: typing.Hashable) -> None:
+        """
+        Stops animating *target* (leaving it at its current color)
+        """
+
+        self._animations.pop(target, None)
+
+    # A function to advance all the animations by one frame
+    def step(self) -> typing.List[typing.Tuple[typing.Hashable, str]]:
+        """
+        Returns the (target, Hex value) pairs of the targets whose color
+        changes on the current frame, then moves on to the next frame
+
+        Finished animations are dropped once their last color is returned
+        """
+
+        frame = self.frame
+        self.frame += 1
+        changes = []
+        finished = []
+
+        for target, animation in self._animations.items():
+            colors, start, loop, last = animation
+            index = frame - start
+
+            if index < 0:
+                continue
+
+            if index >= len(colors):
+                if not loop:
+                    finished.append(target)
+                    continue
+
+                index %= len(colors)
+
+            color = colors[index]
+
+            if color != last:
+                animation[3] = color
+                changes.append((target, color))
+
+            if index == len(colors) - 1 and not loop:
+                finished.append(target)
+
+        for target in finished:
+            del self._animations[target]
+
+        return changes
+
+
+# A class of progress bars drawn with precomputed gradient cells
+class ProgressBar:
+    """
+    A progress bar of *width* cells drawn in ⅛ block steps, colored
+    along a gradient (a `Colormap` or its color stops)
+    
+    The colored cells of every width and gradient (every column in
+    each of the 9 ⅛ steps, and the full cells up to every column) are
+    built once and shared by all the bars drawing them, so drawing a
+    bar is joining three precomputed strings.
+    
+    Usage:
+        bar = ProgressBar(1000, label='download')
+        bar.update(10)
+        print(bar.render())
+        with ProgressGroup() as group:
+            bars = [group.add(ProgressBar(size, label=name)) for name, size in jobs]
+            bars[0].update(1)   # redrawn at most every `group.interval` seconds
+    """
+
+    # The glyphs of 0 to 8 eighths of a cell
+    GLYPHS = ' ▏▎▍▌▋▊▉█'
+
+    # The default gradient
+    COLORS = ('#0078d7', '#1db954')
+
+    # The most shared cells (all of them are forgotten past it, the cells
+    # of a bar being about width² / 2 characters)
+    CACHE_SIZE = 64
+
+    # The cells of every (width, gradient) drawn so far
+    _cells = {}
+
+    def __init__(
+        self,
+        total: typing.Union[int, float] = 100,
+        width: int = 40,
+        colors: typing.Union['Colormap', typing.Sequence[typing.Union[str, int]]] = COLORS,
+        label: str = ''
+    ) -> None:
+        """
+        Makes a bar going from 0 to *total* of *width* cells colored by
+        *colors*, preceded by *label*
+        """
+
+        if total <= 0 or width < 1:
+            raise ValueError('A progress bar needs a positive total and width')
+
+        self.total = total
+        self.width = width
+        self.label = label
+        self.value = 0
+        self.group = None
+        self._full, self._partial = ProgressBar._gradient(width, colors)
+        self._drawn = None
+
+    # A function to get the shared cells of a width and gradient
+    @staticmethod
+    def _gradient(
+        width: int,
+        colors: typing.Union['Colormap', typing.Sequence[typing.Union[str, int]]]
+    ) -> typing.Tuple[typing.List[str], typing.List[typing.List[str]]]:
+        """
+        Returns the full cells up to every column (0 to *width*, the
+        color only set where it changes) and the cells of every column
+        in every ⅛ step, of the gradient *colors* (built once)
+        """
+
+        key = (width, colors if isinstance(colors, Colormap) else tuple(colors))
+        cells = ProgressBar._cells.get(key)
+
+        if cells is not None:
+            return cells
+
+        if not isinstance(colors, Colormap):
+            colors = Colormap(colors, max(width, 2))
+
+        packed = colors.packed
+        fg = Styles.Fg.rgb
+        sequences = [
+            fg(color >> 16, color >> 8 & 255, color & 255)
+            for color in (
+                packed[column * (len(packed) - 1) // max(width - 1, 1)] for column in range(width)
+            )
+        ]
+        partial = [
+            [' '] + [sequence + glyph for glyph in ProgressBar.GLYPHS[1:]]
+            for sequence in sequences
+        ]
+        full = ['']
+        previous = None
+
+        for sequence in sequences:
+            full.append(full[-1] + (
+                ProgressBar.GLYPHS[-1] if sequence == previous else sequence + ProgressBar.GLYPHS[-1]
+            ))
+            previous = sequence
+
+        if len(ProgressBar._cells) >= ProgressBar.CACHE_SIZE:
+            ProgressBar._cells.clear()
+
+        cells = ProgressBar._cells[key] = (full, partial)
+
+        return cells
+
+    # A function to get what the bar shows
+    def _state(self) -> typing.Tuple[int, int]:
+        """
+        Returns the ⅛ steps and the percentage the bar shows
+        """
+
+        fraction = min(max(self.value / self.total, 0), 1)
+
+        return (int(fraction * self.width * 8), int(fraction * 100))
+
+    # A function to advance the bar
+    def update(self, amount: typing.Union[int, float] = 1) -> None:
+        """
+        Adds *amount* to the value of the bar, redrawn by its group (if
+        any) when what it shows changed
+        """
+
+        self.set(self.value + amount)
+
+    # A function to set the value of the bar
+    def set(self, value: typing.Union[int, float]) -> None:
+        """
+        Sets the value of the bar, redrawn by its group (if any) when
+        what it shows changed
+        """
+
+        self.value = value
+
+        if self.group is not None and self._state() != self._drawn:
+            self.group.touch(self)
+
+    # A function to draw the bar
+    def render(self) -> str:
+        """
+        Returns the bar as a line: its label, cells and percentage
+        """
+
+        self._drawn = eighths, percent = self._state()
+        cells, rest = divmod(eighths, 8)
+        bar = self._full[cells]
+
+        if cells < self.width:
+            bar += self._partial[cells][rest] + ' ' * (self.width - cells - 1)
+
+        return f'{self.label}{" " if self.label else ""}{bar}{Styles.RESET} {percent:>3}%'
+
+
+# A class of sparklines drawn with precomputed colored cells
+class Sparkline:
+    """
+    A sparkline of the last *width* values, drawn with the 8 block
+    heights, each colored by its height along a gradient (a `Colormap`
+    or its color stops), with the 8 colored cells built once
+    
+    Usage:
+        load = Sparkline(60, vmin=0, vmax=100, label='cpu')
+        load.push(42.5)
+        print(load.render())
+    """
+
+    # The glyphs of the 8 heights
+    GLYPHS = '▁▂▃▄▅▆▇█'
+
+    # The default gradient
+    COLORS = ('#1db954', '#ffd700', '#e81123')
+
+    def __init__(
+        self,
+        width: int = 40,
+        vmin: typing.Optional[typing.Union[int, float]] = None,
+        vmax: typing.Optional[typing.Union[int, float]] = None,
+        colors: typing.Union['Colormap', typing.Sequence[typing.Union[str, int]]] = COLORS,
+        label: str = ''
+    ) -> None:
+        """
+        Makes a sparkline of the last *width* values, scaled between
+        *vmin* and *vmax* (the extremes of the values shown if None)
+        and colored by *colors*, preceded by *label*
+        """
+
+        if not isinstance(colors, Colormap):
+            colors = Colormap(colors, 8)
+
+        fg = Styles.Fg.rgb
+        packed = colors.packed
+
+        self.width = width
+        self.vmin, self.vmax = vmin, vmax
+        self.label = label
+        self.values = _deque(maxlen=width)
+        self.group = None
+        self._cells = [
+            fg(color >> 16, color >> 8 & 255, color & 255) + glyph
+            for color, glyph in zip(
+                (packed[level * (len(packed) - 1) // 7] for level in range(8)), Sparkline.GLYPHS
+            )
+        ]
+
+    # A function to add a value
+    def push(self, value: typing.Union[int, float]) -> None:
+        """
+        Appends *value* (dropping the oldest past *width* values), the
+        sparkline is redrawn by its group (if any)
+        """
+
+        self.values.append(value)
+
+        if self.group is not None:
+            self.group.touch(self)
+
+    # A function to draw the sparkline
+    def render(self) -> str:
+        """
+        Returns the sparkline as a line: its label and cells (the color
+        only set where the height changes)
+        """
+
+        values = self.values
+        low = min(values, default=0) if self.vmin is None else self.vmin
+        high = max(values, default=0) if self.vmax is None else self.vmax
+        scale = 7.999 / (high - low) if high > low else 0
+        cells, glyphs = self._cells, Sparkline.GLYPHS
+        out = [self.label, ' '] if self.label else []
+        previous = -1
+
+        for value in values:
+            level = min(max(int((value - low) * scale), 0), 7)
+            out.append(glyphs[level] if level == previous else cells[level])
+            previous = level
+
+        out.append(' ' * (self.width - len(values)) + Styles.RESET)
+
+        return ''.join(out)
+
+
+# A class to draw many progress bars and sparklines on one stream
+class ProgressGroup:
+    """
+    Lines of widgets (`ProgressBar`s, `Sparkline`s or anything with a
+    `render` method returning a line and a `group` attribute) drawn on
+    one stream (stdout by default) below the cursor
+    
+    Updates only mark widgets as changed, at most every *interval*
+    seconds the changed lines are redrawn in one write, in order from
+    the top, moving the cursor up and down only between changed lines.
+    Changes made too early to be redrawn are redrawn by a timer at the
+    end of the interval, so widgets never stay stale.
+    
+    Usage:
+        with ProgressGroup(interval=0.1) as group:
+            bar = group.add(ProgressBar(len(files), label='copy'))
+            speed = group.add(Sparkline(30, vmin=0, label='MB/s'))
+            for file in files:
+                speed.push(copy(file))
+                bar.update()
+    
+    NOTE: Lines scrolled off the command-line can't be redrawn, so the
+    widgets must fit its height
+    """
+
+    def __init__(
+        self,
+        stream: typing.Optional[typing.TextIO] = None,
+        interval: float = 0.1
+    ) -> None:
+        self.stream = stream
+        self.interval = interval
+        self.widgets = []
+        self._lines = {}
+        self._changed = {}
+        self._last = 0.0
+        self._lock = _Lock()
+        self._timer = None
+
+    def __enter__(self) -> 'ProgressGroup':
+        return self
+
+    def __exit__(self, *exception: typing.Any) -> None:
+        self.close()
+
+    # A function to write to the stream
+    def _write(self, text: str) -> None:
+        stream = self.stream
+
+        if stream is None:
+            import sys
+
+            stream = sys.stdout
+
+        stream.write(text)
+        stream.flush()
+
+    # A function to add a widget
+    def add(self, widget: typing.Any) -> typing.Any:
+        """
+        Returns *widget* after drawing it on a new line below the others
+        """
+
+        with self._lock:
+            widget.group = self
+            self._lines[id(widget)] = len(self.widgets)
+            self.widgets.append(widget)
+            self._write(widget.render() + '\x1b[K\n')
+
+        return widget
+
+    # A function to mark a widget as changed
+    def touch(self, widget: typing.Any) -> None:
+        """
+        Marks *widget* (of this group) as changed and redraws the changed
+        widgets if the last redraw is at least `interval` seconds old
+        """
+
+        self._changed[self._lines[id(widget)]] = widget
+
+        if _monotonic() - self._last >= self.interval:
+            self.refresh()
+
+        # Changes not drawn yet (too early, or during the redraw of another
+        # thread) are drawn once the interval is over
+        if self._changed and self._timer is None:
+            delay = max(self.interval - (_monotonic() - self._last), 0)
+            self._timer = _Timer(delay, self._trailing)
+            self._timer.daemon = True
+            self._timer.start()
+
+    # A function to redraw the changes left by `touch`
+    def _trailing(self) -> None:
+        self._timer = None
+        self.refresh(True)
+
+    # A function to redraw the changed widgets
+    def refresh(self, wait: bool = False) -> None:
+        """
+        Redraws the changed widgets now (in one write), unless another
+        thread is redrawing them and *wait* is False
+        """
+
+        # Another thread redrawing will draw these changes too
+        if not self._lock.acquire(blocking=wait):
+            return
+
+        try:
+            changed, self._changed = self._changed, {}
+            self._last = _monotonic()
+
+            if not changed:
+                return
+
+            bottom = current = len(self.widgets)
+            out = []
+
+            for line in sorted(changed):
+                if current > line:
+                    out.append(f'\x1b[{current - line}A')
+
+                elif current < line:
+                    out.append(f'\x1b[{line - current}B')
+
+                out.append('\r')
+                out.append(changed[line].render())
+                out.append('\x1b[K')
+                current = line
+
+            out.append(f'\x1b[{bottom - current}B\r')
+            self._write(''.join(out))
+
+        finally:
+            self._lock.release()
+
+    # A function to draw the final state
+    def close(self) -> None:
+        """
+        Redraws every widget, so that their final state is shown
+        """
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._changed.update(enumerate(self.widgets))
+        self.refresh(True)
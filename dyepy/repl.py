@@ -0,0 +1,165 @@
+"""
+The mini command-line of the module (`main`) and its entry point (`cli`)
+"""
+
+
+# Import `typing` for type-hinting
+import typing
+
+# Import `system` from `os` as `_system`
+from os import system as _system
+
+# Import `import_module` from `importlib` as `_import_module`
+from importlib import import_module as _import_module
+
+from . import Styles
+from .ansi import Colorizer
+from .server import Server
+
+
+# The names of the package, as seen by the statements of `main` (the ones
+# of the submodules not imported yet are imported on first use)
+class _Namespace(dict):
+    def __init__(self, module: typing.Any) -> None:
+        super().__init__()
+        self.module = module
+
+    def __missing__(self, name: str) -> typing.Any:
+        try:
+            return getattr(self.module, name)
+
+        except AttributeError:
+            raise KeyError(name) from None
+
+
+def main(clear: bool = False) -> None:
+    """
+    The main function of the program (direct entry point)
+    
+    Auto-runs when module is run directly, or can be run by calling
+    
+    clear (bool) = False - clears screen before starting if True
+    """
+    
+    if clear:
+        _system('cls')  # Clears screen in Windows
+        _system('clear')    # Clears screen in Unix OSs
+    
+    print("Welcome to DyePy's mini command-line interpreter.")
+    print("Enter '!exit' to exit.\n")
+
+    package = _import_module(__package__)
+    namespace = _Namespace(package)
+
+    while True:
+        # Acts like a command-line REPL for python
+        func = input('python> ')
+
+        if func == '!exit':
+            break
+
+        try:
+            func = eval(func, vars(package), namespace)
+
+        except (SyntaxError, KeyboardInterrupt, BaseException) as e:
+            if e is KeyboardInterrupt:
+                continue
+            
+            if func != '' and not func.isspace():   # Not empty line
+                func = ''.join((
+                    Styles.Background.RED,
+                    Styles.Foreground.WHITE,
+                    'Invalid statement/function call!',
+                    Styles.RESET
+                ))
+
+        if func is not None:
+            print(func)
+
+
+def cli(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    The command-line entry point of the module
+    
+    Usage:
+        dyepy [--cls]                   the mini command-line interpreter
+        dyepy serve [--socket PATH]     the conversion server (see `Server`)
+        dyepy colorize [--rule STYLE PATTERN] [--rules FILE] [--no-defaults]
+                                        the log colorizer filter (see `Colorizer`)
+    """
+
+    import argparse
+    import os
+    import re
+    import sys
+
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] not in ('serve', 'colorize'):
+        main('--cls' in argv or '--clear' in argv)
+
+        return
+
+    parser = argparse.ArgumentParser(prog='dyepy')
+    commands = parser.add_subparsers(dest='command')
+
+    serve = commands.add_parser('serve', help='serve conversions (see `dyepy.Server`)')
+    serve.add_argument('--socket', help='Unix domain socket path (stdin/stdout if not given)')
+    serve.add_argument('--cache-size', type=int, default=1 << 16)
+
+    colorize = commands.add_parser(
+        'colorize', help='colorize the log lines of stdin (see `dyepy.Colorizer`)'
+    )
+    colorize.add_argument(
+        '--rule', nargs=2, action='append', default=[], metavar=('STYLE', 'PATTERN'),
+        help='style the matches of PATTERN (before the default rules)'
+    )
+    colorize.add_argument(
+        '--rules', action='append', default=[], metavar='FILE',
+        help='read rules from FILE, one STYLE<tab>PATTERN per line (# comments)'
+    )
+    colorize.add_argument('--no-defaults', action='store_true', help='skip the default rules')
+    colorize.add_argument('--buffer-size', type=int, default=1 << 20)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        server = Server(args.cache_size)
+
+        try:
+            if args.socket:
+                server.serve_unix(args.socket)
+
+            else:
+                server.serve_stdio()
+
+        except KeyboardInterrupt:
+            pass
+
+    elif args.command == 'colorize':
+        rules = []
+
+        for path in args.rules:
+            with open(path, encoding='utf-8') as file:
+                for line in file:
+                    if line.strip() and not line.lstrip().startswith('#'):
+                        style, _, pattern = line.rstrip('\r\n').partition('\t')
+                        rules.append((pattern, style))
+
+        rules.extend((pattern, style) for style, pattern in args.rule)
+
+        try:
+            colorizer = Colorizer(rules if args.no_defaults else [*rules, *Colorizer.RULES])
+
+        except (ValueError, re.error) as error:
+            parser.error(str(error))
+
+        try:
+            colorizer.stream(sys.stdin.buffer, sys.stdout.buffer, args.buffer_size)
+
+        except KeyboardInterrupt:
+            pass
+
+        except BrokenPipeError:
+            # The reader went away (like `| head`): don't fail flushing on exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
@@ -0,0 +1,312 @@
+"""
+`Server`, serving conversions to other processes
+"""
+
+
+# Import `typing` for type-hinting
+import typing
+
+from .converters import Converters
+
+
+# A class to serve conversions to other processes
+class Server:
+    """
+    Server class
+
+    A long-running conversion server speaking a line protocol over
+    standard input/output or a Unix domain socket, so that programs
+    written in other languages can use dyepy without starting Python
+    (and resolving conversions) for every request.
+    
+    Protocol (UTF-8, one request per line, one response per line, in order):
+        request:  <source> <target> <value>
+        response: <converted value>, or `!error <message>`
+    
+    Values are Hex codes for the `hex` color space, and comma (or space)
+    separated components for the others, e.g.:
+        hex hsl #0078d7     ->  207,1,0.4215686274509804
+        hsv hex 207,1,0.84  ->  #0076d6
+    
+    All the complete lines received at once (from every connection) are
+    handled as one batch: requests are grouped by conversion and each group
+    goes through its cached `Converters` conversion in one pass; responses
+    are cached too (up to *cache_size* of them), so repeated requests cost
+    a dict lookup.
+    
+    Can be started as follows:
+        $ dyepy serve                                # standard input/output
+        $ python -m dyepy serve --socket /tmp/dyepy.sock
+    """
+
+    def __init__(self, cache_size: int = 1 << 16) -> None:
+        self.cache_size = cache_size
+        self._cache = {}
+        self._running = False
+
+    # A function to parse the value of a request
+    @staticmethod
+    def _parse(text: str, scalar: bool) -> typing.Any:
+        if scalar:
+            return text.strip()
+
+        return tuple(
+            int(part) if part.lstrip('-').isdigit() else float(part)
+            for part in text.replace(',', ' ').split()
+        )
+
+    # A function to format the result of a conversion
+    @staticmethod
+    def _format(value: typing.Any) -> str:
+        if isinstance(value, tuple):
+            return ','.join(map(str, value))
+
+        return str(value)
+
+    # A function to answer a batch of requests
+    def handle(self, lines: typing.List[str]) -> typing.List[str]:
+        """
+        Returns the responses to all the request *lines*, in order
+        """
+
+        responses = [None] * len(lines)
+        groups = {}
+        cache = self._cache
+
+        for index, line in enumerate(lines):
+            response = cache.get(line)
+
+            if response is not None:
+                responses[index] = response
+
+                continue
+
+            parts = line.split(None, 2)
+
+            if len(parts) != 3:
+                responses[index] = '!error expected: <source> <target> <value>'
+
+                continue
+
+            groups.setdefault((parts[0], parts[1]), []).append((index, parts[2]))
+
+        for (source, target), requests in groups.items():
+            try:
+                function = Converters._paths.get((source, target))
+
+                if function is None:
+                    function = Converters.resolve(source, target)
+
+            except Exception as error:
+                for index, _ in requests:
+                    responses[index] = f'!error {error}'
+
+                continue
+
+            scalar = Converters._spaces[source]
+            values = []
+
+            for index, text in requests:
+                try:
+                    values.append((index, self._parse(text, scalar)))
+
+                except Exception as error:
+                    responses[index] = f'!error {error}'
+
+            try:
+                results = list(map(function, [value for _, value in values]))
+
+            # A bad value (of any client, like `inf`) fails the whole batch and
+            # must never stop the server: convert them one by one
+            except Exception:
+                results = []
+
+                for _, value in values:
+                    try:
+                        results.append(function(value))
+
+                    except Exception as error:
+                        results.append(_ServerError(error))
+
+            for (index, _), result in zip(values, results):
+                if isinstance(result, _ServerError):
+                    responses[index] = f'!error {result.error}'
+
+                    continue
+
+                responses[index] = self._format(result)
+
+                if len(cache) >= self.cache_size:
+                    cache.clear()
+
+                cache[lines[index]] = responses[index]
+
+        return responses
+
+    # A function to serve requests over standard input/output
+    def serve_stdio(
+        self,
+        stdin: typing.Optional[typing.BinaryIO] = None,
+        stdout: typing.Optional[typing.BinaryIO] = None
+    ) -> None:
+        """
+        Answers the requests read from *stdin* on *stdout* (binary
+        streams, the standard ones by default) until end of file
+        """
+
+        import sys
+
+        stdin = stdin or sys.stdin.buffer
+        stdout = stdout or sys.stdout.buffer
+        read = getattr(stdin, 'read1', stdin.read)
+        pending = b''
+
+        while True:
+            data = read(1 << 16)
+
+            if not data:
+                break
+
+            *lines, pending = (pending + data).split(b'\n')
+
+            if lines:
+                responses = self.handle([line.decode(errors='replace') for line in lines])
+                stdout.write(('\n'.join(responses) + '\n').encode())
+                stdout.flush()
+
+        if pending.strip():
+            stdout.write((self.handle([pending.decode(errors='replace')])[0] + '\n').encode())
+            stdout.flush()
+
+    # A function to serve requests over a Unix domain socket
+    def serve_unix(self, path: str) -> None:
+        """
+        Answers the requests of every connection to the Unix domain
+        socket *path* until `shutdown` is called (or the process is
+        interrupted), batching the requests of all the connections
+        """
+
+        import os
+        import selectors
+        import socket
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        if os.path.exists(path):
+            os.unlink(path)
+
+        listener.bind(path)
+        listener.listen()
+        listener.setblocking(False)
+
+        selector = selectors.DefaultSelector()
+        selector.register(listener, selectors.EVENT_READ)
+        pending = {}    # Incomplete request line of every connection
+        outbox = {}     # Unsent responses of every connection
+        self._running = True
+
+        def close(connection):
+            selector.unregister(connection)
+            connection.close()
+            del pending[connection], outbox[connection]
+
+        try:
+            while self._running:
+                batch = []
+
+                for key, events in selector.select(0.25):
+                    connection = key.fileobj
+
+                    if connection is listener:
+                        connection, _ = listener.accept()
+                        connection.setblocking(False)
+                        selector.register(connection, selectors.EVENT_READ)
+                        pending[connection] = b''
+                        outbox[connection] = bytearray()
+
+                        continue
+
+                    if events & selectors.EVENT_WRITE:
+                        try:
+                            sent = connection.send(outbox[connection])
+
+                        except BlockingIOError:
+                            sent = 0
+
+                        except OSError:
+                            close(connection)
+
+                            continue
+
+                        del outbox[connection][:sent]
+
+                        if not outbox[connection]:
+                            selector.modify(connection, selectors.EVENT_READ)
+
+                    if not events & selectors.EVENT_READ:
+                        continue
+
+                    try:
+                        data = connection.recv(1 << 16)
+
+                    except BlockingIOError:
+                        continue
+
+                    except OSError:
+                        data = b''
+
+                    if not data:
+                        close(connection)
+
+                        continue
+
+                    *lines, pending[connection] = (pending[connection] + data).split(b'\n')
+                    batch.extend(
+                        (connection, line.decode(errors='replace')) for line in lines
+                    )
+
+                if not batch:
+                    continue
+
+                responses = self.handle([line for _, line in batch])
+                replies = {}
+
+                for (connection, _), response in zip(batch, responses):
+                    replies.setdefault(connection, []).append(response)
+
+                # Replies are queued and sent as the clients read them, so a
+                # client pipelining many requests can never block the server
+                for connection, lines in replies.items():
+                    if connection not in outbox:
+                        continue
+
+                    if not outbox[connection]:
+                        selector.modify(
+                            connection, selectors.EVENT_READ | selectors.EVENT_WRITE
+                        )
+
+                    outbox[connection] += ('\n'.join(lines) + '\n').encode()
+
+        finally:
+            for connection in pending:
+                connection.close()
+
+            selector.close()
+            listener.close()
+
+            if os.path.exists(path):
+                os.unlink(path)
+
+    # A function to stop `serve_unix`
+    def shutdown(self) -> None:
+        """
+        Stops `serve_unix` (from another thread) within a quarter of a second
+        """
+
+        self._running = False
+
+
+# The error of a single request in a batch handled by `Server`
+class _ServerError:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
@@ -18,13 +18,15 @@ setuptools.setup(
     long_description_content_type='text/markdown',
     url=__github__,
     license='MIT',
-    py_modules=['dyepy'],
-    packages=[],
+    packages=['dyepy'],
     install_requires=[],
+    entry_points={
+        'console_scripts': ['dyepy=dyepy:cli'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )
@@ -35,6 +35,23 @@ def test_Colors():
     
     assert dyepy.Colors.cmyk(1, 0.4418604651162791, 0, 0.1568627450980392) == '#0078d7'
     assert dyepy.Colors.cmyk(0.8432432432432432, 0, 0.545945945945946, 0.27450980392156865) == '#1db954'
+    
+    assert dyepy.Colors.rgb(255.0, -1, 127.6) == '#ff0080'
+    assert dyepy.Colors.rgb(300, 0.4, True) == '#ff0001'
+    
+    assert dyepy.Colors.rgba(0, 120, 215) == '#0078d7ff'
+    assert dyepy.Colors.rgba(0, 120, 215, 127.6) == '#0078d780'
+
+
+def test_rgb_many():
+    colors = [(0, 120, 215), (29, 185, 84)]
+    
+    assert dyepy.Colors.rgb_many(colors) == ['#0078d7', '#1db954']
+    assert dyepy.Colors.rgb_many(iter(colors), ',') == '#0078d7,#1db954'
+    assert dyepy.Colors.rgb_many([0x0078d7, 0x1db954], ',', True) == b'#0078d7,#1db954'
+    assert dyepy.Colors.rgb_many(bytes((0, 120, 215, 29, 185, 84))) == ['#0078d7', '#1db954']
+    assert dyepy.Colors.rgb_many(b'', ',') == ''
+    assert dyepy.Colors.rgb_many([(0.4, 300, -2)]) == ['#00ff00']
 
 
 def test_Converters():
@@ -43,6 +60,13 @@ def test_Converters():
     assert dyepy.Converters.hex2rgb('#fff') == (255, 255, 255)
     assert dyepy.Converters.hex2rgb('#0078d7') == (0, 120, 215)
     assert dyepy.Converters.hex2rgb(0x1db954) == (29, 185, 84)
+    assert dyepy.Converters.hex2rgb(0x0078d7) == (0, 120, 215)
+    assert dyepy.Converters.hex2rgb('#0078d780') == (0, 120, 215)
+    
+    assert dyepy.Converters.hex2rgba('#0078d780') == (0, 120, 215, 128)
+    assert dyepy.Converters.hex2rgba('#0078d7') == (0, 120, 215, 255)
+    assert dyepy.Converters.hex2rgba('#f008') == (255, 0, 0, 136)
+    assert dyepy.Converters.hex2rgba(0x1db95440) == (29, 185, 84, 64)
     
     assert dyepy.Converters.hex2hsv('#0078d7') == (207, 1, 0.8431372549019608)
     assert dyepy.Converters.hex2hsv('#1db954') == (141, 0.8432432432432432, 0.7254901960784313)
@@ -92,3 +116,673 @@ def test_Converters():
 
 def test_getrandomcolor():
     pass    # Nothing to test, returns random hex color (random strings)
+
+
+def test_random_colors():
+    colors = dyepy.Colors.random_colors(1000, seed=42)
+    packed = dyepy.Colors.random_colors(1000, seed=42, packed=True)
+    
+    assert len(colors) == 1000
+    assert colors == dyepy.Colors.random_colors(1000, seed=42)
+    assert colors == dyepy.Colors.rgb_many(packed)
+    assert dyepy.Colors.random_colors(0) == []
+    
+    distinct = dyepy.Colors.distinct_colors(8, seed=1, avoid=[dyepy.Colors.BLACK])
+    
+    assert len(set(distinct)) == 8
+    assert distinct == dyepy.Colors.distinct_colors(8, seed=1, avoid=[dyepy.Colors.BLACK])
+    assert dyepy.Colors.BLACK not in distinct
+
+
+def test_roundtrip_harness():
+    import bench_dyepy
+
+    for red in (0, 128, 255):
+        stats = bench_dyepy.roundtrip_worker((red, 17, ('hsv', 'hsl', 'yiq', 'cmyk')))
+        
+        assert stats['cmyk']['histogram'] == {0: stats['cmyk']['count']}
+        assert max(stats['hsv']['histogram']) <= 2
+        assert max(stats['hsl']['histogram']) <= 2
+        assert max(stats['yiq']['histogram']) <= 1
+
+
+def test_convert():
+    convert = dyepy.Converters.convert
+    
+    assert convert('#0078d7', 'hex', 'rgb') == (0, 120, 215)
+    assert convert((0, 120, 215), 'rgb', 'hex') == '#0078d7'
+    assert convert('#1db954', 'hex', 'cmyk') == dyepy.Converters.hex2cmyk('#1db954')
+    assert convert((207, 1, 0.8431372549019608), 'hsv', 'hsl') == dyepy.Converters.hsv2hsl(207, 1, 0.8431372549019608)
+    assert convert((1, 2, 3), 'rgb', 'rgb') == (1, 2, 3)
+    assert dyepy.Converters.path('hsv', 'hex') == ['hsv', 'rgb', 'hex']
+    
+    assert dyepy.Converters.convert_many(['#000', '#fff'], 'hex', 'rgb') == [(0, 0, 0), (255, 255, 255)]
+    
+    Converters = dyepy.Converters
+    
+    try:
+        Converters.register_space('gray')
+        Converters.register('rgb', 'gray', lambda r, g, b: ((r + g + b) / 765,))
+        Converters.register('gray', 'rgb', lambda v: (round(v * 255),) * 3)
+        
+        assert convert('#ffffff', 'hex', 'gray') == (1,)
+        assert convert((0.2,), 'gray', 'hex') == '#333333'
+    
+    finally:
+        # Leave the conversions of the other tests as they were
+        Converters._spaces.pop('gray', None)
+        Converters._kernels.pop('gray', None)
+        Converters._kernels['rgb'].pop('gray', None)
+        Converters._paths.clear()
+    
+    assert 'gray' not in Converters._spaces
+
+
+def test_apply_colormap():
+    grays = dyepy.Colormap(dyepy.Colormap.GRAYS)
+    
+    assert len(grays) == 256
+    assert grays.hex[0] == '#000000' and grays.hex[-1] == '#ffffff'
+    
+    assert dyepy.apply_colormap([0, 128, 255], grays, output='hex') == ['#000000', '#808080', '#ffffff']
+    assert dyepy.apply_colormap([-5, 500], grays, 0, 100, 'hex') == ['#000000', '#ffffff']
+    assert list(dyepy.apply_colormap([0, 1], [0x0078d7, 0x1db954])) == [0x0078d7, 0x1db954]
+    assert dyepy.apply_colormap([1], grays, 0, 1, 'ansi', '  ') == [dyepy.Styles.Bg.rgb(255, 255, 255) + '  ']
+    assert dyepy.apply_colormap([], grays, output='hex') == []
+    
+    nan = float('nan')
+    
+    assert dyepy.apply_colormap([nan, 0, 255], grays, output='hex') == ['#000000', '#000000', '#ffffff']
+    assert dyepy.apply_colormap([1, nan], grays, 0, 1, 'hex') == ['#ffffff', '#000000']
+
+
+def test_ColorHistogram():
+    import pickle
+    
+    histogram = dyepy.ColorHistogram(bytes((255, 0, 0, 0, 255, 0, 255, 0, 0, 0, 0, 0)))
+    histogram.update([(0, 255, 0), 0xff0000])
+    histogram.update(bytes((0, 0, 255, 128)), channels=4)
+    
+    assert histogram.total == 7
+    assert len(histogram) == 4
+    assert histogram['#ff0000'] == 3
+    assert histogram.most_common(2) == [('#ff0000', 3), ('#00ff00', 2)]
+    assert histogram.most_common(1, packed=True) == [(0xff0000, 3)]
+    assert histogram.hues(3, min_saturation=0.5) == [3, 2, 1]
+    
+    merged = pickle.loads(pickle.dumps(histogram)) + histogram
+    
+    assert merged.total == 14
+    assert merged.most_common(1) == [('#ff0000', 6)]
+
+
+def test_Blend():
+    backdrop = bytes((255, 0, 0, 255, 0, 0, 255, 128, 10, 20, 30, 0))
+    source = bytes((0, 0, 255, 128, 255, 255, 255, 255, 0, 0, 0, 0))
+    
+    assert list(dyepy.Blend.over(backdrop, source)) == [127, 0, 128, 255, 255, 255, 255, 255, 0, 0, 0, 0]
+    assert list(dyepy.Blend.multiply(backdrop, source))[:8] == [127, 0, 0, 255, 127, 127, 255, 255]
+    assert list(dyepy.Blend.screen(backdrop, source))[:8] == [255, 0, 128, 255, 255, 255, 255, 255]
+    assert list(dyepy.Blend.overlay(backdrop, source))[:8] == [255, 0, 0, 255, 127, 127, 255, 255]
+    
+    premultiplied = dyepy.Blend.premultiply(source)
+    
+    assert list(premultiplied)[:4] == [0, 0, 128, 128]
+    assert dyepy.Blend.unpremultiply(premultiplied) == source
+    assert dyepy.Blend.unpremultiply(dyepy.Blend.over_premultiplied(
+        dyepy.Blend.premultiply(backdrop), premultiplied
+    )) == dyepy.Blend.over(backdrop, source)
+    
+    out = bytearray(backdrop)
+    
+    assert dyepy.Blend.over(out, source, out=out) is out
+
+
+def test_Images():
+    import io
+    
+    rows = [bytes((0, 120, 215, 29, 185, 84)), bytes((255, 0, 0, 0, 0, 0))]
+    
+    for writer in (dyepy.PNGWriter, dyepy.PPMWriter):
+        image = io.BytesIO()
+        
+        with writer(image, 2, 2) as output:
+            output.write_rows(rows)
+        
+        image.seek(0)
+        
+        with dyepy.Images.open(image) as reader:
+            assert (reader.width, reader.height, reader.channels) == (2, 2, 3)
+            assert list(reader) == rows
+    
+    image = io.BytesIO(b'P5\n# gray\n2 1\n255\n\x00\x80')
+    
+    assert list(dyepy.PPMReader(image)) == [bytearray((0, 0, 0, 128, 128, 128))]
+    
+    source, target = io.BytesIO(), io.BytesIO()
+    
+    with dyepy.PNGWriter(source, 2, 1, channels=4) as output:
+        output.write_row(bytes((255, 0, 0, 10, 0, 0, 255, 20)))
+    
+    source.seek(0)
+    dyepy.Images.recolor(source, target, dyepy.Images.hue_shift(120), png=True)
+    target.seek(0)
+    
+    assert list(dyepy.PNGReader(target)) == [bytearray((0, 255, 0, 10, 255, 0, 0, 20))]
+    assert dyepy.Images.grayscale(bytearray((0, 120, 215))) == bytearray((95, 95, 95))
+    
+    # An error of the `with` block isn't replaced by the incomplete image error
+    try:
+        with dyepy.PNGWriter(io.BytesIO(), 2, 2) as output:
+            output.write_row(rows[0])
+            raise KeyError('rows')
+    except KeyError:
+        pass
+    
+    for writer in (dyepy.PNGWriter, dyepy.PPMWriter):
+        try:
+            with writer(io.BytesIO(), 2, 2) as output:
+                output.write_row(rows[0])
+        except ValueError as error:
+            assert str(error) == '1 rows were written instead of 2'
+        else:
+            raise AssertionError('the incomplete image did not raise ValueError')
+        
+        try:
+            writer(io.BytesIO(), 2, 2).write_row(rows[0][:5])
+        except ValueError as error:
+            assert str(error) == 'The row does not match the width of the image'
+        else:
+            raise AssertionError('the short row did not raise ValueError')
+
+
+def test_Screen():
+    screen = dyepy.Screen(4, 2)
+    
+    assert screen.render() == '\x1b[0m\x1b[H    \x1b[2;1H    '
+    assert screen.render() == ''
+    
+    screen.put(1, 0, 'ab', fg='#ff0000', attrs=dyepy.Screen.BOLD)
+    
+    assert screen.render() == '\x1b[1;2H\x1b[1;38;2;255;0;0mab'
+    
+    screen.put(3, 0, 'c', fg=(255, 0, 0), attrs=dyepy.Screen.BOLD)
+    screen.put(0, 1, 'xyz', bg=0x0078d7)
+    
+    assert screen.render() == 'c\x1b[2;1H\x1b[0;48;2;0;120;215mxyz'
+    
+    screen.invalidate()
+    
+    assert screen.render().count('\x1b[') == 6
+
+
+def test_Server():
+    import io
+    
+    server = dyepy.Server()
+    
+    assert server.handle([
+        'hex rgb #0078d7', 'rgb hex 29,185,84', 'hex cmyk 0x1db954',
+        'foo rgb 1', 'rgb hsv 1,x', 'nonsense'
+    ]) == [
+        '0,120,215', '#1db954', '0.8432432432432432,0.0,0.5459459459459459,0.27450980392156865',
+        "!error Unknown color space 'foo'", "!error could not convert string to float: 'x'",
+        '!error expected: <source> <target> <value>'
+    ]
+    
+    stdout = io.BytesIO()
+    server.serve_stdio(io.BytesIO(b'hex rgb #fff\nrgb hex 0 120 215'), stdout)
+    
+    assert stdout.getvalue() == b'255,255,255\n#0078d7\n'
+    
+    assert server.handle(['rgb hex inf,0,0', 'rgb hex 1e400,0,0', 'rgb hex 1,2,3']) == [
+        '!error cannot convert float infinity to integer',
+        '!error cannot convert float infinity to integer', '#010203'
+    ]
+    
+    stdout = io.BytesIO()
+    server.serve_stdio(io.BytesIO(b'rgb hex 1,2,\xff3\nrgb hex 1,2,3\n'), stdout)
+    
+    assert stdout.getvalue().split(b'\n')[0].startswith(b'!error')
+    assert stdout.getvalue().split(b'\n')[1:] == [b'#010203', b'']
+
+
+def test_Transform():
+    Transform = dyepy.Transform
+    
+    assert Transform.rgb2yiq().vector(0, 120 / 255, 215 / 255) == dyepy.Converters.rgb2yiq(0, 120, 215)
+    assert Transform.grayscale().color(0, 120, 215) == (95, 95, 95)
+    assert Transform.saturation(0) == Transform.grayscale()
+    assert Transform.saturation(1).color(0, 120, 215) == (0, 120, 215)
+    assert Transform.cvd('protanopia', 0).color(0, 120, 215) == (0, 120, 215)
+    
+    swap = Transform.mixer(red=(0, 0, 1), blue=(1, 0, 0))
+    
+    assert swap.then(swap) == Transform.identity()
+    
+    transform = Transform.saturation(1.5).then(Transform.cvd('deuteranopia')).then(swap)
+    row = bytearray([0, 120, 215, 255, 255, 0, 0, 128])
+    
+    assert transform(row, 4) == bytearray([*transform.color(0, 120, 215), 255, *transform.color(255, 0, 0), 128])
+    assert swap(bytearray([1, 2, 3, 4, 5, 6])) == bytearray([3, 2, 1, 6, 5, 4])
+
+
+def test_Palette(tmp_path):
+    path = tmp_path / 'rgb.txt'
+    path.write_text('! X11 colors\n255 250 250\t\tsnow\n240 248 255\t\talice blue\n240 248 255\t\tAliceBlue\n  0   0 128\t\tnavy\n')
+    
+    palette = dyepy.Palette.load(str(path), snapshot=str(tmp_path / 'rgb.dyepal'))
+    
+    assert len(palette) == 3 and 'ALICE_BLUE' in palette
+    assert palette['AliceBlue'] == '#f0f8ff'
+    assert palette.search('a') == [('alice blue', '#f0f8ff')]
+    assert palette.nearest((10, 0, 100)) == ('navy', '#000080')
+    assert dyepy.Palette.load(str(path), snapshot=str(tmp_path / 'rgb.dyepal')).items() == palette.items()
+    assert sorted(file.name for file in tmp_path.iterdir()) == ['rgb.dyepal', 'rgb.txt']
+    assert dyepy.Palette.from_bytes(palette.to_bytes()).items() == palette.items()
+    
+    assert dyepy.Palette.parse_json('{"red": "#f00", "blue": [0, 0, 255]}').items() == [('blue', '#0000ff'), ('red', '#ff0000')]
+    assert dyepy.Palette.parse_csv(['name,hex', 'green,00ff00']).get('Green') == '#00ff00'
+    assert dyepy.Palette.named('colors')['chocolate'] == dyepy.Colors.CHOCOLATE == '#d2691e'
+
+
+def test_ColorArray():
+    colors = dyepy.ColorArray.from_colors([(0, 120, 215), '#1db954', 0xff0000])
+    
+    assert len(colors) == 3 and colors[-1] == (255, 0, 0)
+    assert colors.hex() == ['#0078d7', '#1db954', '#ff0000']
+    assert colors[::2].tolist() == [(0, 120, 215), (255, 0, 0)]
+    
+    hsv = colors.convert('hsv')
+    
+    assert hsv.space == 'hsv' and hsv[0] == (207.0, 1.0, 0.8431372549019608)
+    
+    view = colors[1:]
+    view[0] = (1, 2, 3)
+    
+    assert colors[1] == (1, 2, 3)
+    assert hsv[1:].convert('rgb', out=view) is view
+    assert colors.tolist() == [(0, 120, 215), (29, 185, 84), (255, 0, 0)]
+    assert colors.convert('cmyk').channels == 4
+    assert colors.__array_interface__['shape'] == (3, 3)
+    assert bytes(colors.data) == bytes([0, 120, 215, 29, 185, 84, 255, 0, 0])
+    
+    # The buffer protocol of Python classes needs Python 3.12 (PEP 688)
+    import sys
+    
+    if sys.version_info >= (3, 12):
+        assert memoryview(colors).tobytes() == bytes(colors.data)
+        assert memoryview(hsv).format == 'd'
+    
+    else:
+        try:
+            memoryview(colors)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError('memoryview(colors) worked before Python 3.12')
+    
+    colors.data[0] = 7
+    
+    assert colors[0] == (7, 120, 215) and colors[:1].data.obj is colors.data.obj
+
+
+def test_ansi_helpers():
+    Styles = dyepy.Styles
+    text = Styles.BOLD + 'bold' + Styles.RESET + ' ' + Styles.Fg.rgb(0, 120, 215) + '日本' + Styles.RESET + '\x1b]8;;https://example.com\x07link\x1b]8;;\x07'
+    
+    assert dyepy.strip_ansi(text) == 'bold 日本link'
+    assert dyepy.visible_width(text) == 13
+    assert ''.join(dyepy.iter_strip_ansi(text[i:i + 3] for i in range(0, len(text), 3))) == 'bold 日本link'
+    
+    assert dyepy.wrap(Styles.Fg.RED + 'the quick brown fox' + Styles.RESET + ' jumps', 10) == [
+        Styles.Fg.RED + 'the quick' + Styles.RESET,
+        Styles.Fg.RED + 'brown fox' + Styles.RESET,
+        'jumps'
+    ]
+    assert dyepy.wrap('日本語日本語', 5) == ['日本', '語日', '本語']
+    assert dyepy.wrap('abcdef\nx', 4) == ['abcd', 'ef', 'x']
+    assert dyepy.wrap('a\tb c', 20) == ['a\tb c']
+    assert dyepy.wrap(Styles.Fg.RED + 'abc\ndef' + Styles.RESET, 20) == [
+        Styles.Fg.RED + 'abc' + Styles.RESET, Styles.Fg.RED + 'def' + Styles.RESET
+    ]
+    
+    # A chunk boundary anywhere, even within a hyperlink and its terminator
+    text = 'x\x1b]8;;http://e.com\x1b\\link\x1b]8;;\x1b\\y' + Styles.Fg.RED + 'z'
+    
+    for i in range(len(text) + 1):
+        assert ''.join(dyepy.iter_strip_ansi([text[:i], text[i:]])) == 'xlinkyz'
+
+
+def test_AnsiHtml():
+    import io
+    
+    Styles = dyepy.Styles
+    text = Styles.BOLD + Styles.Fg.RED + 'a <b>' + Styles.RESET + ' & ' + Styles.Fg.n(196) + Styles.Bg.rgb(0, 120, 215) + 'c' + Styles.RESET + Styles.BOLD + Styles.Fg.RED + 'd' + Styles.RESET
+    converter = dyepy.AnsiHtml()
+    html = ''.join(converter.convert(text[i:i + 4] for i in range(0, len(text), 4)))
+    
+    assert html == '<span class="ansi0">a &lt;b&gt;</span> &amp; <span class="ansi1">c</span><span class="ansi0">d</span>'
+    assert converter.css() == '.ansi0 { color: #cd0000; font-weight: bold }\n.ansi1 { color: #ff0000; background-color: #0078d7 }\n'
+    
+    text = 'x\x1b]8;;http://e.com\x1b\\link\x1b]8;;\x1b\\' + Styles.Fg.RED + 'y'
+    
+    for i in range(len(text) + 1):
+        converter = dyepy.AnsiHtml()
+        
+        assert ''.join(converter.convert([text[:i], text[i:]])) == 'xlink<span class="ansi0">y</span>'
+    
+    converter = dyepy.AnsiHtml(max_classes=0)
+    file = io.StringIO()
+    converter.write([Styles.REVERSE + 'x'], file)
+    
+    assert file.getvalue() == '<pre class="ansi"><span style="color: #000000; background-color: #e5e5e5">x</span></pre>\n<style>\n</style>\n'
+
+
+def test_Dither():
+    assert dyepy.Dither.bayer(2) == [[0, 2], [3, 1]]
+    
+    gray = bytearray([64, 64, 64] * 16)
+    dither = dyepy.Dither(['#000000', '#ffffff'])
+    rows = [dither.codes(gray) for _ in range(4)]
+    
+    assert sum(map(sum, rows)) == 16     # A quarter of the pixels are white
+    
+    dither = dyepy.Dither(['#000000', '#ffffff'], 'bayer', 2)
+    
+    assert dither.codes(gray[:12]) == bytes([0, 0, 0, 0])
+    assert dither.codes(gray[:12]) == bytes([1, 0, 1, 0])
+    
+    assert dyepy.Dither(256, 'bayer').codes(bytes([255, 0, 0, 0, 0, 255])) == bytes([196, 21])
+    assert dyepy.Dither(16).ansi(bytes([255, 0, 0, 255, 0, 0, 0, 0, 0])) == '\x1b[101m  \x1b[40m '
+    
+    row = bytearray([250, 10, 10, 128])
+    
+    assert dyepy.Dither(16)(row, 4) == bytearray([255, 0, 0, 128])
+
+
+def test_Style():
+    Styles, Style = dyepy.Styles, dyepy.Style
+    alert = Style(bold=True, fg=dyepy.Colors.WHITE, bg=(215, 0, 0))
+    
+    assert alert.sequence == '\x1b[1;38;2;255;255;255;48;2;215;0;0m'
+    assert alert is Style(fg=0xffffff, bg='#d70000', bold=True)
+    assert alert('hi') == alert.sequence + 'hi' + Styles.RESET
+    
+    assert Style(Styles.BOLD, Styles.Fg.RED, Styles.Bg.n(17), underline=True, bold=False).sequence == '\x1b[4;31;48;5;17m'
+    assert (Style(Styles.ITALIC, fg=Styles.Fg.CYAN) | Style(underline=True)).sequence == '\x1b[3;4;36m'
+    assert Style(Styles.BOLD, Styles.RESET)('plain') == 'plain'
+    assert Style(Styles.BOLD + Styles.Fg.RED) is Style(Styles.BOLD, Styles.Fg.RED)
+    
+    try:
+        Style(Styles.BOLD + 'text')
+    except ValueError as error:
+        assert str(error).startswith('Not an SGR sequence')
+    else:
+        raise AssertionError('Style did not reject text')
+
+
+def test_pty_harness():
+    import pytest
+    import bench_dyepy
+    
+    pytest.importorskip('pty')
+    report = bench_dyepy.pty_throughput(2, 16, 4, ['table'])['renderers']
+    
+    assert list(report) == ['table, write per frame', 'table, write per line']
+    assert report['table, write per frame']['writes_per_frame'] == 1
+    assert report['table, write per line']['writes_per_frame'] == 5
+    assert report['table, write per line']['bytes_per_frame'] == report['table, write per frame']['bytes_per_frame'] + 2
+
+
+def test_Tween():
+    Tween = dyepy.Tween
+    fade = Tween(dyepy.Colors.BLACK, dyepy.Colors.WINDOWSBLUE, 5, 'linear')
+    
+    assert fade.colors == ('#000000', '#001e36', '#003c6c', '#005aa1', '#0078d7')
+    assert fade[-1] == '#000000' and fade[100] == '#0078d7'
+    assert fade is Tween((0, 0, 0), 0x0078d7, 5, 'linear')
+    assert Tween('#ff0000', '#0000ff', 3, 'linear', 'hsv').colors == ('#ff0000', '#ff00ff', '#0000ff')
+    
+    scheduler = dyepy.TweenScheduler()
+    scheduler.add('button', fade)
+    scheduler.add('label', Tween('#ffffff', '#ffffff', 2), delay=1)
+    
+    assert scheduler.step() == [('button', '#000000')]
+    assert scheduler.step() == [('button', '#001e36'), ('label', '#ffffff')]
+    assert scheduler.step() == [('button', '#003c6c')]
+    assert len(scheduler) == 1
+
+
+def test_LUT3D():
+    LUT3D = dyepy.LUT3D
+    cube = 'TITLE "invert"\n# comment\nLUT_3D_SIZE 2\n' + ''.join(
+        f'{1 - r} {1 - g} {1 - b}\n' for b in (0, 1) for g in (0, 1) for r in (0, 1)
+    )
+    invert = LUT3D.parse(cube.splitlines())
+    
+    assert invert.title == 'invert' and invert.size == 2
+    assert invert.color(0, 120, 215) == (255, 135, 40)
+    assert LUT3D.parse(invert.to_cube().splitlines()).table == invert.table
+    
+    identity = LUT3D.identity(5)
+    identity.method = 'trilinear'
+    
+    assert identity.color(0, 120, 215) == (0, 120, 215)
+    assert invert.then(invert).color(10, 20, 30) == (10, 20, 30)
+    
+    darker = invert.then(lambda red, green, blue: (red / 2, green / 2, blue / 2))
+    row = bytearray([0, 120, 215, 255, 255, 255, 255, 0])
+    
+    assert darker(bytearray(row), 4) == bytearray([128, 68, 20, 255, 0, 0, 0, 0])
+    centered = darker(bytearray([64, 64, 192, 255, 192, 192, 192, 0]), 4)
+    
+    baked = darker.bake(1)
+    
+    assert baked(bytearray(row), 4) == centered
+    assert baked is not darker and darker(bytearray(row), 4) != centered
+    assert len(darker.bake(4)._baked) == 1 << 12
+
+
+def test_YCbCr():
+    Converters = dyepy.Converters
+    
+    assert Converters.ycbcr2rgb(*Converters.rgb2ycbcr(0, 120, 215)) == (0, 120, 215)
+    assert tuple(map(round, Converters.convert((255, 255, 255), 'rgb', 'ycbcr'))) == (255, 128, 128)
+    assert tuple(map(round, Converters.rgb2ycbcr(0, 0, 0, 709, False))) == (16, 128, 128)
+    
+    video = dyepy.YCbCr(601)
+    # 4×2 pixels: two red columns, then two blue columns
+    frame = bytes([255, 0, 0, 255, 0, 0, 0, 0, 255, 0, 0, 255] * 2)
+    i420 = video.to_i420(frame, 4, 2)
+    
+    assert i420.hex() == '51512929515129295af0f06e'
+    assert video.to_nv12(frame, 4, 2) == i420[:8] + bytes([0x5a, 0xf0, 0xf0, 0x6e])
+    assert video.from_i420(i420, 4, 2) == video.from_nv12(video.to_nv12(frame, 4, 2), 4, 2)
+    assert video.from_i420(i420, 4, 2)[:3] == bytearray([254, 0, 0])
+    assert video.from_i420(i420, 4, 2, 4)[:4] == bytearray([254, 0, 0, 255])
+    
+    try:
+        video.to_i420(bytes(9), 3, 1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('odd dimensions were accepted')
+
+
+def test_Colorizer():
+    import io
+    
+    Colorizer, Style = dyepy.Colorizer, dyepy.Style
+    
+    assert Colorizer.style('bold red') is Style(dyepy.Styles.Fg.RED, bold=True)
+    assert Colorizer.style('fg=#0078d7,bg=blue').sequence == '\x1b[38;2;0;120;215;44m'
+    assert Colorizer.style(dyepy.Styles.BOLD + dyepy.Styles.Fg.rgb(0, 120, 215)) is Style(
+        bold=True, fg=(0, 120, 215)
+    )
+    
+    colorizer = Colorizer([(r'(a)(b)', 'red'), (r'c', 'green'), (r'(?i:d+)', 'blue')])
+    
+    assert colorizer(b'ab \x1b[1mc\x1b[0m Dd\n') == (
+        b'\x1b[31mab\x1b[00m \x1b[1m\x1b[32mc\x1b[00m\x1b[0m \x1b[34mDd\x1b[00m\n'
+    )
+    assert colorizer.text('c\n') == '\x1b[32mc\x1b[00m\n'
+    assert b'\x1b[1;31mERROR\x1b[00m' in Colorizer()(b'12:00 ERROR boom\n')
+    
+    sink = io.BytesIO()
+    colorizer.stream(io.BytesIO(b'xc\nc y\nc'), sink, 4)
+    
+    assert sink.getvalue() == b'x\x1b[32mc\x1b[00m\n\x1b[32mc\x1b[00m y\n\x1b[32mc\x1b[00m'
+    
+    colorizer = Colorizer([(r'(?i)error', 'red'), (r'(?P<x>a)(?P=x)', 'green'), (r'(?P<x>b)', 'blue')])
+    
+    assert colorizer(b'Error aa b') == (
+        b'\x1b[31mError\x1b[00m \x1b[32maa\x1b[00m \x1b[34mb\x1b[00m'
+    )
+
+
+def test_ProgressBar():
+    import io
+    
+    RESET = dyepy.Styles.RESET
+    blue, green = dyepy.Styles.Fg.rgb(0, 120, 215), dyepy.Styles.Fg.rgb(29, 185, 84)
+    bar = dyepy.ProgressBar(8, 2, label='job')
+    
+    assert bar.render() == f'job   {RESET}   0%'
+    bar.update(3)
+    assert bar.render() == f'job {blue}▊ {RESET}  37%'
+    bar.set(8)
+    assert bar.render() == f'job {blue}█{green}█{RESET} 100%'
+    assert dyepy.ProgressBar(8, 2)._full is bar._full
+    
+    spark = dyepy.Sparkline(4, vmin=0, vmax=8)
+    
+    for value in (0, 0, 8):
+        spark.push(value)
+    
+    assert dyepy.strip_ansi(spark.render()) == '▁▁█ '
+    assert spark.render().count('\x1b[38;2;') == 2
+    
+    stream = io.StringIO()
+    
+    with dyepy.ProgressGroup(stream, interval=0) as group:
+        first, second = group.add(dyepy.ProgressBar(2, 1)), group.add(dyepy.ProgressBar(2, 1))
+        stream.seek(0)
+        stream.truncate()
+        second.update()
+        
+        assert stream.getvalue() == f'\x1b[1A\r{blue}▌{RESET}  50%\x1b[K\x1b[1B\r'
+        group.interval = 60
+        first.update()
+        
+        assert stream.getvalue().count('50%') == 1
+    
+    assert stream.getvalue().count('50%') == 3
+    
+    # A change within the interval is still drawn once the interval is over
+    import time
+    
+    stream = io.StringIO()
+    group = dyepy.ProgressGroup(stream, interval=0.05)
+    bar = group.add(dyepy.ProgressBar(2, 1))
+    bar.update()
+    bar.update()
+    time.sleep(0.3)
+    
+    assert '100%\x1b[K' in stream.getvalue() and group._timer is None
+    group.close()
+    
+    for width in range(dyepy.ProgressBar.CACHE_SIZE + 1):
+        dyepy.ProgressBar(1, width + 1)
+    
+    assert len(dyepy.ProgressBar._cells) <= dyepy.ProgressBar.CACHE_SIZE
+
+
+def test_enable_lut(tmp_path):
+    Converters = dyepy.Converters
+    cache = str(tmp_path / 'hsl.lut')
+    colors = [
+        (hue, s / 100, l / 100)
+        for hue in range(0, 360, 7) for s in range(0, 101, 9) for l in range(0, 101, 11)
+    ]
+    expected = [Converters.hsl2rgb(*color) for color in colors]
+    
+    try:
+        Converters.enable_lut('hsl', cache)
+        
+        assert [Converters.hsl2rgb(*color) for color in colors] == expected
+        assert Converters._luts['hsl'].lookup(200, 0.29, 0.57) == Converters.hsl2rgb(200.0, 0.29, 0.57)
+        assert Converters._luts['hsl'].lookup(200.5, 0.29, 0.57) is None
+        assert Converters.hsl2rgb(200.5, 0.333, 2) == (255, 255, 255)
+        
+        Converters.enable_lut('hsl', cache)
+        
+        assert Converters.convert((207, 1, 0.42), 'hsl', 'hex') == '#0076d6'
+        assert isinstance(Converters._luts['hsl'].table, memoryview)
+    
+    finally:
+        Converters.disable_lut('hsl')
+    
+    assert 'hsl' not in Converters._luts
+
+
+def test_import_time():
+    import os
+    import subprocess
+    import sys
+    
+    code = (
+        'import sys, dyepy; dyepy.Styles.Fg.RED;'
+        'print(*sorted(name for name in sys.modules if name.startswith("dyepy")));'
+        'print("typing" in sys.modules, "re" in sys.modules)'
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(dyepy.__file__)))
+    )
+    times = {}
+    
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line[len('import time:'):].split('|')
+        
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    
+    assert result.stdout.split('\n')[:2] == ['dyepy', 'False False']
+    # Was ~40 ms (every submodule, `typing`, `re`, `json`...) with the
+    # bytecode cached, now below 1 ms; the budget leaves room for slow CI
+    assert times['dyepy'] < 25000
+    
+    assert 'Converters' in dir(dyepy) and 'cli' in dyepy.__all__
+    assert dyepy.Colors.rgb(255, 0, 128) == '#ff0080'
+    assert dyepy.Colorizer is dyepy.ansi.Colorizer
+    
+    # The ANSI helpers don't load the renderers, palettes and batch buffers
+    code = 'import sys, dyepy; dyepy.strip_ansi; print(*sorted(sys.modules))'
+    modules = subprocess.run(
+        [sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(dyepy.__file__)))
+    ).stdout.split()
+    
+    assert 'dyepy.ansi' in modules and 'dyepy.renderers' not in modules
+    assert 'dyepy.palettes' not in modules and 'dyepy.arrays' not in modules
+    assert 'json' not in modules and 'csv' not in modules
+    
+    try:
+        dyepy.missing
+    except AttributeError as error:
+        assert 'missing' in str(error)
+    else:
+        raise AssertionError('dyepy.missing did not raise AttributeError')
+
+
+def test_main(monkeypatch, capsys):
+    lines = iter(['Colors.RED', 'Converters.convert((0, 120, 215), "rgb", "hex")', 'nonsense', '!exit'])
+    monkeypatch.setattr('builtins.input', lambda prompt: next(lines))
+    
+    dyepy.main()
+    output = capsys.readouterr().out.split('\n')
+    
+    assert output[3:5] == ['#ff0000', '#0078d7']
+    assert 'Invalid statement/function call!' in output[5]